@@ -1,8 +1,208 @@
-
 import tkinter as tk
-from tkinter import ttk
+from tkinter import ttk, messagebox
 from ttkthemes import ThemedStyle
-import json_store
+import background_io
+import store
+
+# Card tabs are virtualized: every card has the same height, so row i sits at
+# y = i * ROW_HEIGHT and only the cards in view exist as widgets.
+CARD_HEIGHT = 150
+ROW_HEIGHT  = CARD_HEIGHT + 10
+
+CARD_TABS = ("questions", "answers", "false_answers")
+
+class CardList:
+    """A scroll-driven recycler for one card tab.
+
+    Rows are plain dicts (the card's draft values). A small pool of cards is
+    placed on a canvas; as the user scrolls, each card stores its edits back
+    into its row and is re-filled with the row that scrolled into view.
+    """
+    def __init__(self, parent, make_card):
+        self.make_card = make_card
+        self.rows = []
+        self.pool = []  # [(card, canvas window id)]
+        self.canvas = tk.Canvas(parent, yscrollincrement=ROW_HEIGHT // 4); self.canvas.pack(side="left", fill="both", expand=True)
+        self.scrollbar = ttk.Scrollbar(parent, orient="vertical", command=self._yview)
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self.canvas.bind("<Configure>", self._on_resize)
+        self._bind_wheel(self.canvas)
+
+    def _bind_wheel(self, widget):
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            widget.bind(seq, self._on_wheel)
+        for child in widget.winfo_children():
+            self._bind_wheel(child)
+
+    def _on_wheel(self, event):
+        if getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0:
+            self.canvas.yview_scroll(-1, "units")
+        else:
+            self.canvas.yview_scroll(1, "units")
+        self.render()
+        return "break"
+
+    def _yview(self, *args):
+        self.canvas.yview(*args)
+        self.render()
+
+    def _on_resize(self, event):
+        for _, item in self.pool:
+            self.canvas.itemconfigure(item, width=event.width)
+        self.render()
+
+    def _update_scrollregion(self):
+        self.canvas.configure(scrollregion=(0, 0, 0, len(self.rows) * ROW_HEIGHT))
+
+    def set_rows(self, rows):
+        """Show a new list of rows (drafts of the previous rows are dropped)."""
+        for card, _ in self.pool:
+            card.row = None
+        self.rows = rows
+        self._update_scrollregion()
+        self.canvas.yview_moveto(0)
+        self.render()
+
+    def append(self, row):
+        self.rows.append(row)
+        self._update_scrollregion()
+        self.canvas.yview_moveto(1.0)
+        self.render()
+
+    def extend(self, rows):
+        """Add rows at the end without moving the view."""
+        if not rows: return
+        self.rows.extend(rows)
+        self._update_scrollregion()
+        self.render()
+
+    def remove(self, rows):
+        """Drop the given row objects; cards below them move up on the next render."""
+        gone = {id(r) for r in rows}
+        if not gone: return
+        # the cards are re-filled with shifted rows; keep what is typed into them first
+        self.store()
+        self.rows = [r for r in self.rows if id(r) not in gone]
+        for card, _ in self.pool:
+            if card.row is not None and id(card.row) in gone:
+                card.row = None
+        self._update_scrollregion()
+        self.render()
+
+    def store(self):
+        """Copy what is typed into the visible cards back into their rows."""
+        for card, _ in self.pool:
+            if card.row is not None:
+                card.store()
+
+    def refresh(self, rows=None):
+        """Re-fill the visible cards from their rows (after the rows changed underneath).
+
+        With rows given, only the cards currently showing one of those rows are touched.
+        """
+        only = None if rows is None else {id(r) for r in rows}
+        for card, _ in self.pool:
+            if card.row is not None and (only is None or id(card.row) in only):
+                card.fill()
+
+    def render(self):
+        width = self.canvas.winfo_width()
+        # Row i always uses pool slot i % len(pool), so a contiguous window of rows never collides
+        needed = min(max(self.canvas.winfo_height(), ROW_HEIGHT) // ROW_HEIGHT + 2, len(self.rows))
+        while len(self.pool) < needed:
+            card = self.make_card(self.canvas)
+            self._bind_wheel(card)
+            item = self.canvas.create_window(0, -ROW_HEIGHT, window=card, anchor="nw", width=width, height=CARD_HEIGHT)
+            self.pool.append((card, item))
+        if not self.pool:
+            return
+        first = max(0, int(self.canvas.canvasy(0) // ROW_HEIGHT))
+        last = min(len(self.rows), first + len(self.pool))
+        used = set()
+        for i in range(first, last):
+            slot = i % len(self.pool)
+            used.add(slot)
+            card, item = self.pool[slot]
+            if card.row is not self.rows[i]:
+                card.show(self.rows[i])
+                self.canvas.coords(item, 0, i * ROW_HEIGHT)
+        for slot, (card, item) in enumerate(self.pool):
+            if slot not in used:
+                # end of the list (or fewer rows than cards): park the spare card out of sight
+                if card.row is not None:
+                    card.store()
+                    card.row = None
+                self.canvas.coords(item, 0, -2 * ROW_HEIGHT)
+
+class QuestionCard(ttk.Frame):
+    """Recyclable card for the Questions tab: text + True/False flag."""
+    def __init__(self, parent, on_save):
+        super().__init__(parent, relief="ridge", padding=10)
+        self.row = None
+        self.question_text = tk.Text(self, width=60, height=3); self.question_text.pack(pady=5)
+        self.tf_var = tk.BooleanVar(value=False)
+        tf_check = ttk.Checkbutton(self, text="True Or False", variable=self.tf_var); tf_check.pack()
+        sep = ttk.Separator(self, orient="horizontal"); sep.pack(fill="x", pady=5)
+        ttk.Button(self, text="Save", command=lambda: on_save(self)).pack(anchor="e")
+
+    def show(self, row):
+        if self.row is not None:
+            self.store()
+        self.row = row
+        self.fill()
+
+    def fill(self):
+        self.question_text.delete("1.0", tk.END); self.question_text.insert("1.0", self.row["question_text"])
+        self.tf_var.set(self.row["is_true_false"])
+
+    def store(self):
+        self.row["question_text"] = self.question_text.get("1.0", tk.END).strip()
+        self.row["is_true_false"] = bool(self.tf_var.get())
+
+class AnswerCard(ttk.Frame):
+    """Recyclable card for the Answers / False Answers tabs: one text field + the question it belongs to."""
+    def __init__(self, parent, window, field, label, width, on_save):
+        super().__init__(parent, relief="ridge", padding=10)
+        self.row = None
+        self.window = window
+        self.field = field
+        self._ids = None
+        ttk.Label(self, text=label).pack(anchor="w")
+        self.entry = ttk.Entry(self, width=width); self.entry.pack(anchor="w")
+        ttk.Label(self, text="Question ID:").pack(anchor="w")
+        self.q_var = tk.StringVar(value="")
+        self.id_dropdown = ttk.OptionMenu(self, self.q_var, ""); self.id_dropdown.pack(anchor="w")
+        # Question ids are read when the dropdown opens, so adding a question never refills the cards
+        self.id_dropdown["menu"].configure(postcommand=self._update_ids)
+        ttk.Button(self, text="Save", command=lambda: on_save(self)).pack(anchor="e")
+
+    def _update_ids(self):
+        self._set_ids(self.window.loaded.question_ids() if self.window.loaded else ())
+
+    def _set_ids(self, ids):
+        # The dropdown is rebuilt only when the quiz's question ids changed
+        if ids is self._ids:
+            return
+        menu = self.id_dropdown["menu"]
+        menu.delete(0, "end")
+        for qid in ids:
+            menu.add_command(label=qid, command=tk._setit(self.q_var, qid))
+        self._ids = ids
+
+    def show(self, row):
+        if self.row is not None:
+            self.store()
+        self.row = row
+        self.fill()
+
+    def fill(self):
+        self.q_var.set(self.row["question_id"] or "")
+        self.entry.delete(0, tk.END); self.entry.insert(0, self.row[self.field])
+
+    def store(self):
+        self.row["question_id"] = self.q_var.get().strip() or None
+        self.row[self.field] = self.entry.get().strip()
 
 class QuestionCreatorWindow(tk.Toplevel):
     def __init__(self, master=None):
@@ -16,16 +216,21 @@ class QuestionCreatorWindow(tk.Toplevel):
         main_frame = ttk.Frame(self, padding=10)
         main_frame.pack(fill="both", expand=True)
 
-        # Load quizzes
-        self.quizzes = json_store.list_quizzes()
+        # Quizzes are listed off the UI thread; the dropdown is filled when they arrive
+        self.quizzes = []
         self.selected_slug = None
+        # The selected quiz, loaded once and shared by every tab and card of this window.
+        self.loaded = None
+        # self.loaded with this window's queued saves applied (None once they are done)
+        self._unsaved = None
+        # Card tabs are filled the first time they are shown after a quiz is selected.
+        self._stale = set(CARD_TABS)
 
-        quiz_names = ["None"] + [q["quiz_name"] for q in self.quizzes]
         self.quiz_var = tk.StringVar(value="None")
-        self.quiz_dropdown = ttk.OptionMenu(main_frame, self.quiz_var, quiz_names[0], *quiz_names, command=self.on_quiz_select)
+        self.quiz_dropdown = ttk.OptionMenu(main_frame, self.quiz_var, "None", "None", command=self.on_quiz_select)
         self.quiz_dropdown.pack()
 
-        self.select_label = ttk.Label(main_frame, text="Select a quiz to get started!", font=("Helvetica", 16, "bold"))
+        self.select_label = ttk.Label(main_frame, text="Loading quizzes...", font=("Helvetica", 16, "bold"))
         self.select_label.pack(pady=20)
 
         self.notebook = ttk.Notebook(main_frame)
@@ -37,17 +242,40 @@ class QuestionCreatorWindow(tk.Toplevel):
         self.notebook.add(self.questions_frame, text="Questions")
         self.notebook.add(self.answers_frame, text="Answers")
         self.notebook.add(self.falseanswers_frame, text="False Answers")
+        self._tab_names = {str(self.questions_frame): "questions",
+                           str(self.answers_frame): "answers",
+                           str(self.falseanswers_frame): "false_answers"}
 
         self.init_details_tab()
         self.init_questions_tab()
         self.init_answers_tab()
         self.init_falseanswers_tab()
+        self._lists = {"questions": self.question_list,
+                       "answers": self.answer_list,
+                       "false_answers": self.falseanswer_list}
+        self._row_builders = {"questions": self._question_row,
+                              "answers": self._answer_row,
+                              "false_answers": self._falseanswer_row}
+        self._stagers = {"questions": self._stage_question,
+                         "answers": self._stage_answer,
+                         "false_answers": self._stage_falseanswer}
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         self.notebook.pack(fill="both", expand=True)
-        self.notebook.forget()
+        self.notebook.pack_forget()
+
+        self._refresh_quizzes()
 
     def _refresh_quizzes(self):
-        self.quizzes = json_store.list_quizzes()
+        background_io.run(self, store.list_quizzes, on_done=self._show_quizzes)
+
+    def _show_quizzes(self, quizzes):
+        self.quizzes = quizzes
+        quiz_names = ["None"] + [q["quiz_name"] for q in quizzes]
+        current = self.quiz_var.get()
+        self.quiz_dropdown.set_menu(current if current in quiz_names else "None", *quiz_names)
+        if self.selected_slug is None:
+            self.select_label.config(text="Select a quiz to get started!")
 
     def _find_slug_by_name(self, name: str):
         for q in self.quizzes:
@@ -55,20 +283,150 @@ class QuestionCreatorWindow(tk.Toplevel):
                 return q["slug"]
         return None
 
+    def _on_tab_changed(self, _=None):
+        name = self._tab_names.get(self.notebook.select())
+        if name in self._stale:
+            self._load_tab(name)
+
+    def _load_tab(self, name):
+        self._stale.discard(name)
+        make_row = self._row_builders[name]
+        self._lists[name].set_rows([make_row(q) for q in self.loaded.questions] if self.loaded else [])
+
+    def _reload_tabs(self):
+        self._stale.update(CARD_TABS)
+        self._on_tab_changed()
+
+    def _save_rows(self, name, rows):
+        """Queue the given rows of one tab into one batch, write the quiz once, then patch the tabs."""
+        if not self.loaded: return
+        # The writer thread edits and saves a copy; self.loaded is only ever
+        # read and replaced here, on the Tk thread. A save made while earlier
+        # ones are still queued builds on them, not on the last finished one.
+        base = self._unsaved
+        if base is None or base.data.get("quiz_id") != self.loaded.data.get("quiz_id"):
+            base = self.loaded
+        working = base.copy()
+        b = store.batch(working)
+        for row in rows:
+            self._stagers[name](b, row)
+        if not len(b):
+            # nothing to write, but validation may have put a message into a row
+            self._lists[name].refresh(rows)
+            return
+        quiz_id = working.data.get("quiz_id")
+        question_ids = b.question_ids()
+        data = working.data
+        preview = self._unsaved = b.preview()
+        self._set_status("Saving...")
+
+        def saved(_):
+            self._set_status("")
+            if self._unsaved is preview:
+                self._unsaved = None  # no later save is queued
+            if not self._showing(quiz_id):
+                return  # another quiz was selected meanwhile
+            # saves finish in click order, so this copy is the newest one
+            self.loaded = working
+            if working.data is not data:
+                # rebased onto a newer file: other questions may have changed too
+                self._reload_tabs()
+            else:
+                self._patch_tabs(name, rows, question_ids)
+
+        def reloaded(fresh):
+            if fresh is not None and self._showing(quiz_id):
+                self.loaded = fresh
+                self._reload_tabs()
+
+        def failed(e):
+            self._set_status("")
+            # later saves start from the quiz as stored again
+            self._unsaved = None
+            if not isinstance(e, store.StaleRevisionError):
+                messagebox.showerror("Save failed", str(e), parent=self)
+                return
+            # Another instructor edited the same question; show their version.
+            messagebox.showwarning("Quiz changed", f"{e}\nThe latest version has been loaded.", parent=self)
+            # queued behind the saves still pending, so it reads the quiz after them
+            background_io.write(self, store.open_quiz, working.slug, on_done=reloaded)
+
+        # The write runs on the writer thread, which keeps saves in click order
+        background_io.write(self, b.commit, on_done=saved, on_error=failed)
+
+    def _showing(self, quiz_id):
+        return self.loaded is not None and self.loaded.data.get("quiz_id") == quiz_id
+
+    def _set_status(self, text):
+        if self.selected_slug is not None:
+            self.select_label.config(text=text)
+
+    def _patch_tabs(self, name, saved_rows, question_ids):
+        """Bring the loaded card tabs in line with the saved questions, touching only their rows and cards."""
+        wanted = set(question_ids)
+        questions = [q for q in map(self.loaded.get_question, question_ids) if q is not None]
+        for tab in CARD_TABS:
+            if tab in self._stale:
+                continue  # rebuilt from self.loaded when shown
+            card_list = self._lists[tab]
+            make_row = self._row_builders[tab]
+            # typing goes into the rows before they are patched, so no card overwrites a patch later
+            card_list.store()
+            # "+ Create" rows that were just saved are merged into their question's row
+            merged = [r for r in saved_rows if r.get("new") and r["question_id"] in wanted] if tab == name else []
+            existing = {r["question_id"]: r for r in card_list.rows
+                        if not r.get("new") and r["question_id"] in wanted}
+            changed, added = [], []
+            for q in questions:
+                row = existing.get(q["question_id"])
+                if row is None:
+                    added.append(make_row(q))
+                else:
+                    row.update(make_row(q))
+                    changed.append(row)
+            if tab == name:
+                # saved rows may also carry a validation message
+                merged_ids = {id(r) for r in merged}
+                changed += [r for r in saved_rows if id(r) not in merged_ids]
+            card_list.refresh(changed)
+            card_list.remove(merged)
+            card_list.extend(added)
+
+    def _save_card(self, name, card):
+        card.store()
+        self._save_rows(name, [card.row])
+
+    def _save_all(self, name):
+        self._lists[name].store()
+        self._save_rows(name, self._lists[name].rows)
+
     def on_quiz_select(self, _=None):
         name = self.quiz_var.get()
         if name == "None":
             self.selected_slug = None
+            self.loaded = None
             self.select_label.config(text="Select a quiz to get started!")
-            self.notebook.forget()
+            self.notebook.pack_forget()
             return
-        self.selected_slug = self._find_slug_by_name(name)
-        self.load_details()
-        self.load_questions()
-        self.load_answers()
-        self.load_false_answers()
-        self.select_label.config(text="")
-        self.notebook.pack(fill="both", expand=True)
+        slug = self.selected_slug = self._find_slug_by_name(name)
+        self.loaded = None
+        if not slug:
+            return
+        self.notebook.pack_forget()
+        self.select_label.config(text="Loading quiz...")
+
+        def opened(loaded):
+            if self.selected_slug != slug:
+                return  # a different quiz was picked while this one loaded
+            self.loaded = loaded
+            self.load_details()
+            # Card tabs are built lazily, when first shown
+            self._stale.update(CARD_TABS)
+            self._on_tab_changed()
+            self.select_label.config(text="")
+            self.notebook.pack(fill="both", expand=True)
+
+        background_io.run(self, store.open_quiz, slug, on_done=opened)
 
     # -------- DETAILS TAB --------
     def init_details_tab(self):
@@ -85,9 +443,9 @@ class QuestionCreatorWindow(tk.Toplevel):
         self.save_details_btn.pack(pady=10)
 
     def load_details(self):
-        quiz = json_store.load_quiz_by_slug(self.selected_slug)
-        if not quiz:
+        if not self.loaded:
             return
+        quiz = self.loaded.data
         self.name_entry.delete(0, tk.END); self.name_entry.insert(0, quiz.get("quiz_name",""))
         self.desc_text.delete("1.0", tk.END); self.desc_text.insert("1.0", quiz.get("quiz_description",""))
         self.qs_spin.delete(0, tk.END); self.qs_spin.insert(0, str(quiz.get("question_selector_amount", 4)))
@@ -97,169 +455,131 @@ class QuestionCreatorWindow(tk.Toplevel):
         new_name = self.name_entry.get().strip()
         new_desc = self.desc_text.get("1.0", tk.END).strip()
         new_qs = int(self.qs_spin.get())
-        quiz = json_store.load_quiz_by_slug(self.selected_slug)
-        if not quiz: return
+        if not self.loaded: return
+        slug = self.selected_slug
+
+        def saved(updated):
+            self._set_status("")
+            self._refresh_quizzes()
+            if self.selected_slug != slug:
+                return
+            # Update selection to the new slug if name changed
+            self.selected_slug = updated["slug"]
+            self.loaded = store.LoadedQuiz(updated)
+            self.quiz_var.set(updated["quiz_name"])
+
+        def failed(e):
+            # e.g. the new name is taken by another quiz
+            self._set_status("")
+            messagebox.showerror("Save failed", str(e), parent=self)
+
+        self._set_status("Saving...")
         # If name changes, slug will change.
-        updated = json_store.update_quiz_fields(self.selected_slug, name=new_name, description=new_desc, selector_amount=new_qs)
-        self._refresh_quizzes()
-        # Update selection to the new slug if name changed
-        self.selected_slug = updated["slug"]
+        background_io.write(self, store.update_quiz_fields, slug, name=new_name, description=new_desc,
+                            selector_amount=new_qs, on_done=saved, on_error=failed)
 
     # -------- QUESTIONS TAB --------
     def init_questions_tab(self):
         self.create_question_btn = ttk.Button(self.questions_frame, text="+ Create", command=self.create_question_card)
         self.create_question_btn.pack(anchor="e", pady=5)
-
-        self.questions_canvas = tk.Canvas(self.questions_frame); self.questions_canvas.pack(side="left", fill="both", expand=True)
-        self.questions_scrollbar = ttk.Scrollbar(self.questions_frame, orient="vertical", command=self.questions_canvas.yview)
-        self.questions_scrollbar.pack(side="right", fill="y")
-        self.questions_canvas.configure(yscrollcommand=self.questions_scrollbar.set)
-        self.questions_inner_frame = ttk.Frame(self.questions_canvas)
-        self.questions_canvas.create_window((0, 0), window=self.questions_inner_frame, anchor="nw")
-        self.questions_inner_frame.bind("<Configure>", lambda e: self.questions_canvas.configure(scrollregion=self.questions_canvas.bbox("all")))
+        self.save_all_questions_btn = ttk.Button(self.questions_frame, text="Save All",
+                                                 command=lambda: self._save_all("questions"))
+        self.save_all_questions_btn.pack(anchor="e", pady=5)
+        self.question_list = CardList(self.questions_frame,
+                                      lambda parent: QuestionCard(parent, on_save=lambda c: self._save_card("questions", c)))
 
     def load_questions(self):
-        for w in self.questions_inner_frame.winfo_children():
-            w.destroy()
-        quiz = json_store.load_quiz_by_slug(self.selected_slug)
-        if not quiz: return
-        for q in quiz.get("questions", []):
-            self.create_question_card(existing=q)
-
-    def create_question_card(self, existing=None):
-        card = ttk.Frame(self.questions_inner_frame, relief="ridge", padding=10)
-        card.pack(fill="x", pady=5)
-
-        q_id = existing.get("question_id") if existing else None
-        q_text_val = existing.get("question_text","") if existing else ""
-        is_tf_val = bool(existing.get("is_true_false", False)) if existing else False
-
-        question_text = tk.Text(card, width=60, height=3); question_text.pack(pady=5); question_text.insert("1.0", q_text_val)
-        tf_var = tk.BooleanVar(value=is_tf_val)
-        tf_check = ttk.Checkbutton(card, text="True Or False", variable=tf_var); tf_check.pack()
-
-        sep = ttk.Separator(card, orient="horizontal"); sep.pack(fill="x", pady=5)
-
-        def save_question():
-            if not self.selected_slug: return
-            text_val = question_text.get("1.0", tk.END).strip()
-            tf = bool(tf_var.get())
-            # Preserve existing answer / false answers if present; handled in other tabs.
-            # For convenience, ensure an answer exists; if blank, set placeholder.
-            ans = ""
-            fa = []
-            if existing:
-                ans = existing.get("answer","")
-                fa = existing.get("false_answers", [])
-            json_store.add_or_update_question(self.selected_slug, q_id, text_val, tf, ans, fa)
-            self.load_questions()
-
-        ttk.Button(card, text="Save", command=save_question).pack(anchor="e")
+        self._load_tab("questions")
+
+    def _question_row(self, q):
+        return {"question_id": q.get("question_id"),
+                "question_text": q.get("question_text", ""),
+                "is_true_false": bool(q.get("is_true_false", False))}
+
+    def create_question_card(self):
+        self.question_list.append({"question_id": None, "question_text": "", "is_true_false": False})
+
+    # The stagers compare rows with b.target: the quiz as it will be once
+    # the saves queued before this one are done.
+    def _stage_question(self, b, row):
+        text_val = row["question_text"]
+        tf = row["is_true_false"]
+        if row["question_id"] is None:
+            if text_val:
+                # Answer / false answers are filled in on the other tabs.
+                row["question_id"] = b.upsert(None, text_val, tf, "", [])
+            return
+        q = b.target.get_question(row["question_id"])
+        if q and (text_val != q.get("question_text", "") or tf != bool(q.get("is_true_false", False))):
+            b.update(row["question_id"], question_text=text_val, is_true_false=tf)
 
     # -------- ANSWERS TAB --------
     def init_answers_tab(self):
         self.create_answer_btn = ttk.Button(self.answers_frame, text="+ Create", command=self.create_answer_card)
         self.create_answer_btn.pack(anchor="e", pady=5)
-
-        self.answers_canvas = tk.Canvas(self.answers_frame); self.answers_canvas.pack(side="left", fill="both", expand=True)
-        self.answers_scrollbar = ttk.Scrollbar(self.answers_frame, orient="vertical", command=self.answers_canvas.yview)
-        self.answers_scrollbar.pack(side="right", fill="y")
-        self.answers_canvas.configure(yscrollcommand=self.answers_scrollbar.set)
-        self.answers_inner_frame = ttk.Frame(self.answers_canvas)
-        self.answers_canvas.create_window((0, 0), window=self.answers_inner_frame, anchor="nw")
-        self.answers_inner_frame.bind("<Configure>", lambda e: self.answers_canvas.configure(scrollregion=self.answers_canvas.bbox("all")))
+        self.save_all_answers_btn = ttk.Button(self.answers_frame, text="Save All",
+                                               command=lambda: self._save_all("answers"))
+        self.save_all_answers_btn.pack(anchor="e", pady=5)
+        self.answer_list = CardList(self.answers_frame,
+                                    lambda parent: AnswerCard(parent, self, "answer", "Answer:", 50,
+                                                              on_save=lambda c: self._save_card("answers", c)))
 
     def load_answers(self):
-        for w in self.answers_inner_frame.winfo_children():
-            w.destroy()
-        quiz = json_store.load_quiz_by_slug(self.selected_slug)
-        if not quiz: return
-        questions = quiz.get("questions", [])
-        for q in questions:
-            self.create_answer_card(existing=q)
-
-    def create_answer_card(self, existing=None):
-        card = ttk.Frame(self.answers_inner_frame, relief="ridge", padding=10)
-        card.pack(fill="x", pady=5)
-
-        quiz = json_store.load_quiz_by_slug(self.selected_slug)
-        questions = quiz.get("questions", []) if quiz else []
-        question_ids = [q["question_id"] for q in questions]
-
-        current_q_id = existing.get("question_id") if existing else (question_ids[0] if question_ids else None)
-        ans_text_val = existing.get("answer","") if existing else ""
-
-        ttk.Label(card, text="Answer:").pack(anchor="w")
-        answer_entry = ttk.Entry(card, width=50); answer_entry.pack(anchor="w"); answer_entry.insert(0, ans_text_val)
-
-        ttk.Label(card, text="Question ID:").pack(anchor="w")
-        q_var = tk.StringVar(value=current_q_id or "")
-        id_dropdown = ttk.OptionMenu(card, q_var, q_var.get(), *question_ids); id_dropdown.pack(anchor="w")
-
-        def save_answer():
-            qid = q_var.get().strip()
-            if not qid: return
-            # find question
-            q = next((x for x in questions if x["question_id"] == qid), None)
-            if not q: return
-            is_tf = bool(q.get("is_true_false", False))
-            text_val = answer_entry.get().strip()
-            if is_tf and text_val.lower() not in ("true","false"):
-                answer_entry.delete(0, tk.END); answer_entry.insert(0, "True or False only!"); return
-            json_store.add_or_update_question(self.selected_slug, qid, q.get("question_text",""), is_tf, text_val, q.get("false_answers", []))
-            self.load_answers()
-
-        ttk.Button(card, text="Save", command=save_answer).pack(anchor="e")
+        self._load_tab("answers")
+
+    def _answer_row(self, q):
+        return {"question_id": q.get("question_id"), "answer": q.get("answer", "")}
+
+    def create_answer_card(self):
+        question_ids = self.loaded.question_ids() if self.loaded else ()
+        self.answer_list.append({"question_id": question_ids[0] if question_ids else None, "answer": "", "new": True})
+
+    def _stage_answer(self, b, row):
+        qid = row["question_id"]
+        if not qid: return
+        # find question
+        q = b.target.get_question(qid)
+        if not q: return
+        text_val = row["answer"]
+        if row.get("new") and not text_val: return
+        is_tf = bool(q.get("is_true_false", False))
+        if is_tf and text_val.lower() not in ("true","false"):
+            row["answer"] = "True or False only!"; return
+        if text_val != q.get("answer", ""):
+            b.update(qid, answer=text_val)
 
     # -------- FALSE ANSWERS TAB --------
     def init_falseanswers_tab(self):
         self.create_false_btn = ttk.Button(self.falseanswers_frame, text="+ Create", command=self.create_falseanswer_card)
         self.create_false_btn.pack(anchor="e", pady=5)
-
-        self.falseanswers_canvas = tk.Canvas(self.falseanswers_frame); self.falseanswers_canvas.pack(side="left", fill="both", expand=True)
-        self.falseanswers_scrollbar = ttk.Scrollbar(self.falseanswers_frame, orient="vertical", command=self.falseanswers_canvas.yview)
-        self.falseanswers_scrollbar.pack(side="right", fill="y")
-        self.falseanswers_canvas.configure(yscrollcommand=self.falseanswers_scrollbar.set)
-        self.falseanswers_inner_frame = ttk.Frame(self.falseanswers_canvas)
-        self.falseanswers_canvas.create_window((0, 0), window=self.falseanswers_inner_frame, anchor="nw")
-        self.falseanswers_inner_frame.bind("<Configure>", lambda e: self.falseanswers_canvas.configure(scrollregion=self.falseanswers_canvas.bbox("all")))
+        self.save_all_false_btn = ttk.Button(self.falseanswers_frame, text="Save All",
+                                             command=lambda: self._save_all("false_answers"))
+        self.save_all_false_btn.pack(anchor="e", pady=5)
+        self.falseanswer_list = CardList(self.falseanswers_frame,
+                                         lambda parent: AnswerCard(parent, self, "false_answers", "False Answers (comma-separated):", 60,
+                                                                   on_save=lambda c: self._save_card("false_answers", c)))
 
     def load_false_answers(self):
-        for w in self.falseanswers_inner_frame.winfo_children():
-            w.destroy()
-        quiz = json_store.load_quiz_by_slug(self.selected_slug)
-        if not quiz: return
-        for q in quiz.get("questions", []):
-            self.create_falseanswer_card(existing=q)
-
-    def create_falseanswer_card(self, existing=None):
-        card = ttk.Frame(self.falseanswers_inner_frame, relief="ridge", padding=10)
-        card.pack(fill="x", pady=5)
-
-        quiz = json_store.load_quiz_by_slug(self.selected_slug)
-        questions = quiz.get("questions", []) if quiz else []
-        question_ids = [q["question_id"] for q in questions]
-
-        current_q_id = existing.get("question_id") if existing else (question_ids[0] if question_ids else None)
-        fa_text_val = ", ".join(existing.get("false_answers", [])) if existing else ""
-
-        ttk.Label(card, text="False Answers (comma-separated):").pack(anchor="w")
-        false_entry = ttk.Entry(card, width=60); false_entry.pack(anchor="w"); false_entry.insert(0, fa_text_val)
-
-        ttk.Label(card, text="Question ID:").pack(anchor="w")
-        q_var = tk.StringVar(value=current_q_id or "")
-        id_dropdown = ttk.OptionMenu(card, q_var, q_var.get(), *question_ids); id_dropdown.pack(anchor="w")
-
-        def save_falseanswer():
-            qid = q_var.get().strip()
-            if not qid: return
-            q = next((x for x in questions if x["question_id"] == qid), None)
-            if not q: return
-            is_tf = bool(q.get("is_true_false", False))
-            if is_tf:
-                false_entry.delete(0, tk.END); false_entry.insert(0, "Not applicable for T/F!"); return
-            parts = [p.strip() for p in false_entry.get().split(",")]
-            json_store.add_or_update_question(self.selected_slug, qid, q.get("question_text",""), is_tf, q.get("answer",""), parts)
-            self.load_false_answers()
-
-        ttk.Button(card, text="Save", command=save_falseanswer).pack(anchor="e")
+        self._load_tab("false_answers")
+
+    def _falseanswer_row(self, q):
+        return {"question_id": q.get("question_id"), "false_answers": ", ".join(q.get("false_answers", []))}
+
+    def create_falseanswer_card(self):
+        question_ids = self.loaded.question_ids() if self.loaded else ()
+        self.falseanswer_list.append({"question_id": question_ids[0] if question_ids else None, "false_answers": "", "new": True})
+
+    def _stage_falseanswer(self, b, row):
+        qid = row["question_id"]
+        if not qid: return
+        q = b.target.get_question(qid)
+        if not q: return
+        if row.get("new") and not row["false_answers"]: return
+        is_tf = bool(q.get("is_true_false", False))
+        if is_tf:
+            if row["false_answers"]:
+                row["false_answers"] = "Not applicable for T/F!"
+            return
+        parts = [p.strip() for p in row["false_answers"].split(",")]
+        if [p for p in parts if p] != q.get("false_answers", []):
+            b.update(qid, false_answers=parts)
@@ -1,5 +1,6 @@
 import customtkinter as ctk
-import json_store
+import background_io
+import store
 import QuizTake
 import instantfeedback
 import QuestionCreator
@@ -18,11 +19,19 @@ class QuizMenuWindow(ctk.CTkToplevel):
         # Changed: Apply dark purple background to the window
         self.configure(fg_color=BG_MAIN)
 
-        main_frame = ctk.CTkFrame(self, fg_color=BG_MAIN)
+        self.main_frame = main_frame = ctk.CTkFrame(self, fg_color=BG_MAIN)
         main_frame.pack(fill="both", expand=True, padx=10, pady=10)
 
-        # Load all quizzes (from JSON store) and display each as a selectable card
-        quizzes = json_store.list_quizzes()
+        # Load all quizzes (from JSON store) off the UI thread; the cards are built when they arrive
+        self.loading_label = ctk.CTkLabel(main_frame, text="Loading quizzes...", font=("Verdana", 14, "bold"),
+                                          text_color=ACCENT_ORANGE)
+        self.loading_label.pack(pady=20)
+        background_io.run(self, store.list_quizzes, on_done=self.show_quizzes)
+
+    def show_quizzes(self, quizzes):
+        """Display each quiz as a selectable card."""
+        self.loading_label.destroy()
+        main_frame = self.main_frame
         if not quizzes:
             # If no quizzes exist, open the Quiz Creator to prompt creation
             QuestionCreator.QuestionCreatorWindow(self.master)
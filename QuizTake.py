@@ -1,7 +1,9 @@
 import customtkinter as ctk
-import random
 import Results
-import json_store
+import attempt_history
+import background_io
+import quiz_session
+import quiz_timing
 
 # ============== THEME & STYLE CONSTANTS ==============
 BG_MAIN          = "#2b1a5c"   # Dark purple background for the quiz windows
@@ -31,16 +33,18 @@ class QuestionBox(ctk.CTkCanvas):
                          highlightthickness=0, **kwargs)
         self.width = width
         self.height = height
-    def set_text(self, text):
-        self.delete("all")
         x = self.width // 2
         y = self.height // 2
         wrap_width = self.width - 40
-        # Draw shadowed text: a gray shadow slightly offset, then white text on top
-        self.create_text(x+2, y+2, text=text, font=QUESTION_FONT, fill="gray",
-                         anchor="center", width=wrap_width, justify="center")
-        self.create_text(x, y, text=text, font=QUESTION_FONT, fill=TEXT_COLOR,
-                         anchor="center", width=wrap_width, justify="center")
+        # Draw shadowed text: a gray shadow slightly offset, then white text on top.
+        # The two items are created once and only re-texted per question.
+        self._shadow = self.create_text(x+2, y+2, text="", font=QUESTION_FONT, fill="gray",
+                                        anchor="center", width=wrap_width, justify="center")
+        self._text = self.create_text(x, y, text="", font=QUESTION_FONT, fill=TEXT_COLOR,
+                                      anchor="center", width=wrap_width, justify="center")
+    def set_text(self, text):
+        self.itemconfigure(self._shadow, text=text)
+        self.itemconfigure(self._text, text=text)
 
 class AnswerRectangle(ctk.CTkFrame):
     """A custom widget representing an answer option as a clickable rectangle with hover/selection effects."""
@@ -48,10 +52,13 @@ class AnswerRectangle(ctk.CTkFrame):
         super().__init__(parent, width=width, height=height, fg_color=BG_MAIN, corner_radius=corner_radius)
         self.command = command
         self.selected = False
+        # Disabled answers ignore clicks and hover (e.g. while feedback is shown)
+        self.enabled = True
         # Colors for different states
         self.normal_color = ANSWER_NORMAL
         self.hover_color = ANSWER_HOVER
         self.selected_color = ANSWER_SELECTED
+        self.color = self.normal_color  # color currently painted, so repaints can be skipped
 
         # Offset shadow layer (creates a drop-shadow effect below the answer rectangle)
         self.offset_frame = ctk.CTkFrame(self, width=width, height=height,
@@ -82,16 +89,20 @@ class AnswerRectangle(ctk.CTkFrame):
             widget.configure(cursor="hand2")
 
     def on_enter(self, event):
-        if not self.selected:
+        if self.enabled and not self.selected:
             self.set_color(self.hover_color)
     def on_leave(self, event):
-        if not self.selected:
+        if self.enabled and not self.selected:
             self.set_color(self.normal_color)
     def on_click(self, event):
         # When clicked, notify the parent command (e.g., to record selection)
-        self.command(self)
+        if self.enabled:
+            self.command(self)
     def set_color(self, color):
         # Update the colors of inner frame and labels
+        if color == self.color:
+            return
+        self.color = color
         self.inner.configure(fg_color=color)
         self.label.configure(fg_color=color)
         self.label_shadow.configure(fg_color=color)
@@ -101,6 +112,95 @@ class AnswerRectangle(ctk.CTkFrame):
         self.set_color(self.selected_color if selected else self.normal_color)
         # Changed: If selected, remove shadow offset (button appears pressed); if not, restore shadow
         self.offset_frame.place_configure(y=(0 if selected else 3))
+    def set_text(self, text):
+        # Re-label the answer when the widget is reused for another question
+        if self.label.cget("text") != text:
+            self.label.configure(text=text)
+            self.label_shadow.configure(text=text)
+    def reset(self):
+        # Back to the fresh, clickable, unselected state
+        self.enabled = True
+        if self.selected or self.color != self.normal_color:
+            self.select(False)
+
+class AnswerPool:
+    """A fixed set of AnswerRectangle widgets that are re-labelled and re-gridded for
+    each question instead of being destroyed and rebuilt on every navigation."""
+    def __init__(self, parent, command, size=4, width=350, height=120):
+        self.parent = parent
+        self.command = command
+        self.width = width
+        self.height = height
+        self.widgets = []
+        self.shown = 0
+        self._grow(size)
+
+    def _grow(self, count):
+        while len(self.widgets) < count:
+            self.widgets.append(AnswerRectangle(self.parent, text="", command=self.command,
+                                                width=self.width, height=self.height))
+
+    def reserve(self, count):
+        """Create widgets ahead of time so a question with more options doesn't build them on click."""
+        self._grow(count)
+
+    def show(self, options):
+        """Display one widget per option (two per row) and hide the rest; returns the shown widgets."""
+        self._grow(len(options))
+        for i, widget in enumerate(self.widgets):
+            if i < len(options):
+                widget.set_text(options[i])
+                widget.reset()
+                if i >= self.shown:
+                    widget.grid(row=i // 2, column=i % 2, padx=30, pady=30)
+            elif i < self.shown:
+                widget.grid_remove()
+        self.shown = len(options)
+        return self.widgets[:self.shown]
+
+class QuestionPrefetcher:
+    """Builds what a question needs on screen (display text, shuffled options)
+    for the next few questions while the window is idle, so Next only has to
+    apply a ready layout. Built layouts are kept, so revisits reuse them."""
+    def __init__(self, widget, count, build, pool=None, ahead=3):
+        self.widget = widget
+        self.count = count
+        self.build = build      # build(index) -> (display_text, options)
+        self.pool = pool
+        self.ahead = ahead
+        self.layouts = {}
+        self._next = 0          # next index the idle chain will build
+        self._stop = 0
+        self._scheduled = False
+
+    def get(self, index):
+        layout = self.layouts.get(index)
+        if layout is None:
+            layout = self.layouts[index] = self.build(index)
+        return layout
+
+    def prefetch(self, index):
+        """Prepare index+1 .. index+ahead, one question per idle callback."""
+        self._next = index + 1
+        self._stop = min(self.count, index + 1 + self.ahead)
+        if not self._scheduled:
+            self._scheduled = True
+            self.widget.after_idle(self._step)
+
+    def _step(self):
+        self._scheduled = False
+        if not self.widget.winfo_exists():
+            return
+        while self._next < self._stop and self._next in self.layouts:
+            self._next += 1
+        if self._next >= self._stop:
+            return
+        _, options = self.get(self._next)
+        if self.pool is not None:
+            self.pool.reserve(len(options))
+        self._next += 1
+        self._scheduled = True
+        self.widget.after_idle(self._step)
 
 class NavButton(ctk.CTkFrame):
     """A custom widget for navigation buttons (Back/Next) with similar style to AnswerRectangle."""
@@ -146,7 +246,7 @@ class NavButton(ctk.CTkFrame):
         self.label_shadow.configure(text=text)
 
 class QuizTakeWindow(ctk.CTkToplevel):
-    def __init__(self, master, quiz_slug: str):
+    def __init__(self, master, quiz_slug: str, seed=None, weights=None):
         super().__init__(master)
         self.title("Take Quiz")
         self.quiz_slug = quiz_slug
@@ -155,11 +255,12 @@ class QuizTakeWindow(ctk.CTkToplevel):
         self.configure(fg_color=BG_MAIN)
         self.grab_set()
 
-        quiz = json_store.load_quiz_by_slug(quiz_slug)
-        self.questions = quiz.get("questions", []) if quiz else []
-        self.current_index = 0
-        self.user_answers = [None] * len(self.questions)
+        # The attempt itself (a quiz_session.QuizSession), started off the UI
+        # thread (see on_session_ready)
+        self.session = None
         self.answer_widgets = []
+        # Render/think-time samples, recorded only while quiz_timing is enabled
+        self.timer = quiz_timing.QuizTimer()
 
         self.main_frame = ctk.CTkFrame(self, fg_color=BG_MAIN)
         self.main_frame.pack(fill="both", expand=True)
@@ -172,98 +273,93 @@ class QuizTakeWindow(ctk.CTkToplevel):
         # Frame to hold answer option widgets
         self.answers_frame = ctk.CTkFrame(self.main_frame, fg_color=BG_MAIN)
         self.answers_frame.pack(pady=20)
+        self.answer_pool = AnswerPool(self.answers_frame, command=self.on_answer_click)
 
         # Navigation buttons (Back/Next) at bottom
         self.nav_frame = ctk.CTkFrame(self.main_frame, fg_color=BG_MAIN)
         self.nav_frame.pack(fill="x", pady=20)
         self.back_btn = NavButton(self.nav_frame, text="Back", command=self.go_back, width=120, height=50)
         self.next_btn = NavButton(self.nav_frame, text="Next", command=self.go_next, width=120, height=50)
-        self.back_btn.pack(side="left", padx=20)
         self.next_btn.pack(side="right", padx=20)
 
+        self.question_box.set_text("Loading quiz...")
+        # Each attempt draws question_selector_amount questions (all of them if unset)
+        background_io.run(self, quiz_session.QuizSession.load, quiz_slug, seed=seed, weights=weights,
+                          on_done=self.on_session_ready)
+
+    def on_session_ready(self, session):
+        self.session = session
+        self.prefetcher = QuestionPrefetcher(self, len(self.session), self.build_layout, self.answer_pool)
+        if not len(self.session):
+            self.question_box.set_text("This quiz has no questions yet.")
+            return
         # Load the first question
         self.load_question(0)
         self.update_nav_buttons()
 
+    @quiz_timing.timed("answer")
     def on_answer_click(self, selected_widget):
-        # When an answer is clicked, mark it selected and store the answer text
+        # When an answer is clicked, mark it selected and record its position in the session
         for widget in self.answer_widgets:
             widget.select(False)
         selected_widget.select(True)
-        self.user_answers[self.current_index] = selected_widget.label.cget("text")
-
-    def load_question(self, index):
-        # Clear previous answer option widgets
-        for widget in self.answers_frame.winfo_children():
-            widget.destroy()
-        self.answer_widgets = []
-
-        q = self.questions[index]
-        q_text = q.get("question_text", "")
-        is_tf = bool(q.get("is_true_false", False))
+        self.session.answer(self.answer_widgets.index(selected_widget))
 
+    def build_layout(self, index):
+        """Display text and answer options of one question (prepared ahead by the prefetcher)."""
+        q_text = self.session.question(index).get("question_text", "")
         # Display the question text with numbering
-        display_text = f"Question {index+1} out of {len(self.questions)}:\n{q_text}"
+        display_text = f"Question {index+1} out of {len(self.session)}:\n{q_text}"
+        return display_text, self.session.options(index)
+
+    @quiz_timing.timed("render")
+    def load_question(self, index):
+        display_text, options = self.prefetcher.get(index)
         self.question_box.set_text(display_text)
 
-        # Determine answer options (True/False vs multiple choice)
-        if is_tf:
-            options = ["True", "False"]
-        else:
-            correct = q.get("answer", "")
-            false_answers = list(q.get("false_answers", []))
-            options = [correct] + false_answers
-            random.shuffle(options)
-
-        # Create AnswerRectangle widgets for each option
-        if len(options) == 2:
-            for i, opt in enumerate(options):
-                widget = AnswerRectangle(self.answers_frame, text=opt, command=self.on_answer_click, width=350, height=120)
-                widget.grid(row=0, column=i, padx=30, pady=30)
-                self.answer_widgets.append(widget)
-                # Restore selection state if navigating back to a question
-                if self.user_answers[self.current_index] == opt:
-                    widget.select(True)
-        else:
-            for i, opt in enumerate(options):
-                row = i // 2
-                col = i % 2
-                widget = AnswerRectangle(self.answers_frame, text=opt, command=self.on_answer_click, width=350, height=120)
-                widget.grid(row=row, column=col, padx=30, pady=30)
-                self.answer_widgets.append(widget)
-                if self.user_answers[self.current_index] == opt:
-                    widget.select(True)
+        # Reuse the pooled AnswerRectangle widgets for this question's options
+        self.answer_widgets = self.answer_pool.show(options)
+        # Restore selection state if navigating back to a question
+        chosen = self.session.chosen_position(index)
+        if chosen is not None:
+            self.answer_widgets[chosen].select(True)
+        # Response time counts from here
+        self.session.mark_shown()
+        # Get the following questions ready while the user reads this one
+        self.prefetcher.prefetch(index)
 
     def go_back(self):
-        if self.current_index > 0:
-            self.current_index -= 1
-            self.load_question(self.current_index)
+        if self.session and self.session.back():
+            self.load_question(self.session.current)
             self.update_nav_buttons()
 
+    @quiz_timing.timed("navigate")
     def go_next(self):
-        if self.current_index == len(self.questions) - 1:
+        if not self.session or not len(self.session):
+            return  # still loading (or nothing to answer)
+        if not self.session.next():
             self.finish_quiz()
             return
-        self.current_index += 1
-        self.load_question(self.current_index)
+        self.load_question(self.session.current)
         self.update_nav_buttons()
 
     def update_nav_buttons(self):
         # Hide or show the Back button appropriately
-        if self.current_index == 0:
+        if self.session.is_first:
             self.back_btn.pack_forget()
         else:
             self.back_btn.pack(side="left", padx=20)
         # Update Next button text to "Finish" on last question
-        self.next_btn.update_text("Finish" if self.current_index == len(self.questions) - 1 else "Next")
+        self.next_btn.update_text("Finish" if self.session.is_last else "Next")
 
+    @quiz_timing.timed("finish")
     def finish_quiz(self):
-        # Compile results data and open the Results window
-        result_data = []
-        for i, q in enumerate(self.questions):
-            user_ans = self.user_answers[i]
-            correct_ans = q.get("answer", "")
-            result_data.append((q.get("question_text", ""), user_ans, correct_ans, user_ans == correct_ans))
+        # Grading happens in the session; the Results window just shows the rows
+        result_data = self.session.finish()
+        # Timings (when instrumented) go into the history record, so export them first
+        quiz_timing.export_attempt(self)
+        # Append the attempt to the local history (on the writer thread, after any pending saves)
+        background_io.write(self.master, attempt_history.record_session, self.session)
         Results.ResultsWindow(self.master, result_data)
         self.destroy()
 
@@ -1,25 +1,83 @@
 # Results.py (fixed for customtkinter fonts)
+import functools
 import customtkinter as ctk
 import tkinter.font as tkFont
+import quiz_session
 
 BG_MAIN         = "#2b1a5c"   # Dark purple
 CARD_BG_COLOR   = "#40278a"   # Card purple
 TEXT_COLOR      = "#ffffff"
 ACCENT_ORANGE   = "#FF7518"
 
+# Virtualized list layout: every card has the same height (fitted fonts keep
+# each line inside it), so row i always sits at y = i * ROW_HEIGHT.
+CARD_HEIGHT     = 190
+ROW_HEIGHT      = CARD_HEIGHT + 10
+IDLE_CHUNK      = 25          # rows prepared per idle callback
+
+# Shared tk font objects keyed by (family, size, weight); creating a Font is a Tk round trip.
+_font_cache = {}
+
+def _get_font(family, size, weight):
+    key = (family, size, weight)
+    font = _font_cache.get(key)
+    if font is None:
+        font = _font_cache[key] = tkFont.Font(family=family, size=size, weight=weight)
+    return font
+
+@functools.lru_cache(maxsize=4096)
 def _fit_font_size(text, max_width, family="Verdana", weight="normal", min_size=8, max_size=36):
-    """Return the largest integer font size whose measured width fits max_width."""
-    low, high = min_size, max_size
-    best = min_size
-    while low <= high:
-        mid = (low + high) // 2
-        f = tkFont.Font(family=family, size=mid, weight=weight)
-        if f.measure(text) <= max_width:
-            best = mid
-            low = mid + 1
-        else:
-            high = mid - 1
-    return best
+    """Return the largest integer font size whose measured width fits max_width.
+
+    Text width grows roughly linearly with point size, so one measurement at
+    max_size gives a close estimate; a probe or two then corrects it. Results
+    are memoized, so repeated strings ("Correct ✅", ...) cost nothing.
+    """
+    def fits(size):
+        return _get_font(family, size, weight).measure(text) <= max_width
+    full_width = _get_font(family, max_size, weight).measure(text)
+    if full_width <= max_width:
+        return max_size
+    size = max(min_size, min(max_size - 1, int(max_size * max_width / full_width)))
+    if fits(size):
+        # max_size is already known not to fit
+        while size + 1 < max_size and fits(size + 1):
+            size += 1
+    else:
+        while size > min_size:
+            size -= 1
+            if fits(size):
+                break
+    return size
+
+class ResultCard(ctk.CTkFrame):
+    """A recyclable result card: question, your answer, correct answer and result."""
+    def __init__(self, parent, on_wheel):
+        super().__init__(parent, fg_color=CARD_BG_COLOR, corner_radius=10, height=CARD_HEIGHT)
+        self.pack_propagate(False)
+        self.index = None
+        # One font object per label, resized in place when the card is reused
+        self.fonts = [ctk.CTkFont(family="Verdana", size=10, weight="bold"),
+                      ctk.CTkFont(family="Verdana", size=10),
+                      ctk.CTkFont(family="Verdana", size=10),
+                      ctk.CTkFont(family="Verdana", size=10)]
+        self.labels = [ctk.CTkLabel(self, text="", font=font, text_color=TEXT_COLOR) for font in self.fonts]
+        self.labels[0].pack(anchor="w", pady=2)
+        for label in self.labels[1:]:
+            label.pack(anchor="w")
+        for widget in [self] + self.labels:
+            widget.bind("<MouseWheel>", on_wheel)
+            widget.bind("<Button-4>", on_wheel)
+            widget.bind("<Button-5>", on_wheel)
+
+    def show(self, index, row):
+        """Fill the card with the prepared texts and font sizes of one result row."""
+        self.index = index
+        texts, sizes, is_correct = row
+        for label, font, text, size in zip(self.labels, self.fonts, texts, sizes):
+            font.configure(size=size)
+            label.configure(text=text)
+        self.labels[3].configure(text_color=("green" if is_correct else "red"))
 
 class ResultsWindow(ctk.CTkToplevel):
     def __init__(self, master, result_data):
@@ -31,61 +89,111 @@ class ResultsWindow(ctk.CTkToplevel):
         self.result_data = result_data
 
         screen_width = self.winfo_screenwidth()
-        max_label_width = int(screen_width * 0.8)
-
-        # Score & grade
-        total = len(self.result_data)
-        correct = sum(1 for _, _, _, ok in self.result_data if ok)
-        percentage = (correct / total * 100) if total else 0.0
-        if percentage <= 59: grade = "F"
-        elif percentage <= 69: grade = "D"
-        elif percentage <= 79: grade = "C"
-        elif percentage <= 89: grade = "B"
-        elif percentage <= 99: grade = "A"
-        else: grade = "A+"
+        self.max_label_width = int(screen_width * 0.8)
+
+        # Score & grade (thresholds live in quiz_session)
+        correct, total, percentage = quiz_session.score(self.result_data)
+        grade = quiz_session.letter_grade(percentage)
 
         header_text = f"{percentage:.1f}%   Grade: {grade}"
-        h_size = _fit_font_size(header_text, max_label_width, family="Verdana", weight="bold", min_size=18, max_size=36)
+        h_size = _fit_font_size(header_text, self.max_label_width, family="Verdana", weight="bold", min_size=18, max_size=36)
         header_font = ctk.CTkFont(family="Verdana", size=h_size, weight="bold")
         header_label = ctk.CTkLabel(self, text=header_text, font=header_font,
                                     text_color=ACCENT_ORANGE, anchor="center")
         header_label.pack(fill="x", pady=10)
 
-        # Scrollable area
-        scroll = ctk.CTkScrollableFrame(self, fg_color="transparent")
-        scroll.pack(fill="both", expand=True, padx=10, pady=10)
-
-        for i, (q_text, user_ans, correct_ans, is_correct) in enumerate(self.result_data, start=1):
-            card = ctk.CTkFrame(scroll, fg_color=CARD_BG_COLOR, corner_radius=10)
-            card.pack(fill="x", expand=True, pady=5, padx=5)
-
-            # Question
-            q_str = f"Q{i}: {q_text}"
-            q_size = _fit_font_size(q_str, max_label_width, family="Verdana", weight="bold", min_size=10, max_size=36)
-            q_font = ctk.CTkFont(family="Verdana", size=q_size, weight="bold")
-            ctk.CTkLabel(card, text=q_str, font=q_font, text_color=TEXT_COLOR).pack(anchor="w", pady=2)
-
-            # Your Answer
-            ua_str = f"Your Answer: {user_ans}"
-            ua_size = _fit_font_size(ua_str, max_label_width, family="Verdana", min_size=8, max_size=30)
-            ua_font = ctk.CTkFont(family="Verdana", size=ua_size)
-            ctk.CTkLabel(card, text=ua_str, font=ua_font, text_color=TEXT_COLOR).pack(anchor="w")
-
-            # Correct Answer
-            ca_str = f"Correct Answer: {correct_ans}"
-            ca_size = _fit_font_size(ca_str, max_label_width, family="Verdana", min_size=8, max_size=30)
-            ca_font = ctk.CTkFont(family="Verdana", size=ca_size)
-            ctk.CTkLabel(card, text=ca_str, font=ca_font, text_color=TEXT_COLOR).pack(anchor="w")
-
-            # Result
-            res_str = "Correct ✅" if is_correct else "Incorrect ❌"
-            r_size = _fit_font_size(res_str, max_label_width, family="Verdana", min_size=8, max_size=30)
-            r_font = ctk.CTkFont(family="Verdana", size=r_size)
-            ctk.CTkLabel(card, text=res_str, font=r_font,
-                         text_color=("green" if is_correct else "red")).pack(anchor="w")
-
-        back_btn = ctk.CTkButton(scroll, text="Back To Quizzes", command=self.destroy,
+        back_btn = ctk.CTkButton(self, text="Back To Quizzes", command=self.destroy,
                                  fg_color="#6A0DAD", hover_color="#600E99",
                                  text_color="white", font=ctk.CTkFont("Verdana", 14, "bold"),
                                  corner_radius=8)
-        back_btn.pack(pady=10)
+        back_btn.pack(side="bottom", pady=10)
+
+        # Virtualized scroll area: only the cards in the viewport exist, and they
+        # are recycled (moved + re-labelled) as the user scrolls.
+        body = ctk.CTkFrame(self, fg_color="transparent")
+        body.pack(fill="both", expand=True, padx=10, pady=10)
+        self.scrollbar = ctk.CTkScrollbar(body, command=self._yview)
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas = ctk.CTkCanvas(body, bg=BG_MAIN, highlightthickness=0,
+                                    yscrollincrement=ROW_HEIGHT // 4)
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.canvas.configure(yscrollcommand=self.scrollbar.set,
+                              scrollregion=(0, 0, 0, total * ROW_HEIGHT))
+        self.canvas.bind("<Configure>", self._on_resize)
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.canvas.bind(seq, self._on_wheel)
+
+        self._rows = [None] * total   # prepared (texts, sizes, is_correct) per result
+        self._pool = []               # [(card, canvas window id)]
+        self._width = 0
+
+        # Cards and font fitting happen after the header is on screen
+        self.after_idle(self._prepare_rows, 0)
+
+    def _row(self, i):
+        """Texts and fitted font sizes for result i (computed once, then cached)."""
+        row = self._rows[i]
+        if row is None:
+            q_text, user_ans, correct_ans, is_correct = self.result_data[i]
+            w = self.max_label_width
+            texts = (f"Q{i + 1}: {q_text}",
+                     f"Your Answer: {user_ans}",
+                     f"Correct Answer: {correct_ans}",
+                     "Correct ✅" if is_correct else "Incorrect ❌")
+            sizes = (_fit_font_size(texts[0], w, family="Verdana", weight="bold", min_size=10, max_size=36),
+                     _fit_font_size(texts[1], w, family="Verdana", min_size=8, max_size=30),
+                     _fit_font_size(texts[2], w, family="Verdana", min_size=8, max_size=30),
+                     _fit_font_size(texts[3], w, family="Verdana", min_size=8, max_size=30))
+            row = self._rows[i] = (texts, sizes, is_correct)
+        return row
+
+    def _prepare_rows(self, start):
+        # Fit the next chunk of rows while the UI is idle so scrolling never waits on it
+        if not self.winfo_exists():
+            return
+        end = min(start + IDLE_CHUNK, len(self._rows))
+        for i in range(start, end):
+            self._row(i)
+        if start == 0:
+            self._render()
+        if end < len(self._rows):
+            self.after(1, self._prepare_rows, end)
+
+    def _yview(self, *args):
+        self.canvas.yview(*args)
+        self._render()
+
+    def _on_wheel(self, event):
+        if getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0:
+            self.canvas.yview_scroll(-1, "units")
+        else:
+            self.canvas.yview_scroll(1, "units")
+        self._render()
+
+    def _on_resize(self, event):
+        self._width = event.width
+        for _, item in self._pool:
+            self.canvas.itemconfigure(item, width=self._width)
+        self._render()
+
+    def _render(self):
+        """Place a recycled card on every row intersecting the viewport."""
+        total = len(self._rows)
+        if not total:
+            return
+        height = max(self.canvas.winfo_height(), ROW_HEIGHT)
+        # Row i always uses pool slot i % len(pool), so a contiguous window of rows never collides
+        needed = height // ROW_HEIGHT + 2
+        while len(self._pool) < min(needed, total):
+            card = ResultCard(self.canvas, self._on_wheel)
+            item = self.canvas.create_window(0, -ROW_HEIGHT, window=card, anchor="nw",
+                                             width=self._width or self.canvas.winfo_width(), height=CARD_HEIGHT)
+            self._pool.append((card, item))
+        top = self.canvas.canvasy(0)
+        first = max(0, int(top // ROW_HEIGHT))
+        last = min(total, first + len(self._pool))
+        for i in range(first, last):
+            card, item = self._pool[i % len(self._pool)]
+            if card.index != i:
+                card.show(i, self._row(i))
+                self.canvas.coords(item, 0, i * ROW_HEIGHT)
@@ -1,19 +1,103 @@
+import os
+import json
+import uuid
 import sqlite3
+from tkinter import messagebox
 # Changed: Use CustomTkinter for modern UI and theming (removed ttk and ThemedTk)
 import customtkinter as ctk
 
+import background_io
+import store
 import QuestionCreator
 import QuizMenu
+import quiz_timing
 
 DB_NAME = "wolfquiz.db"
 
-def setup_database():
-    """Creates the tables if they don't already exist (for legacy SQLite storage)."""
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    # ... (omitted for brevity, unchanged database setup code)
-    conn.commit()
-    conn.close()
+# Single shared connection to the legacy database (opened on first use).
+_conn = None
+
+def get_connection():
+    """Return the process-wide connection to the legacy SQLite database."""
+    global _conn
+    if _conn is None:
+        _conn = sqlite3.connect(DB_NAME)
+        _conn.row_factory = sqlite3.Row
+    return _conn
+
+def close_connection():
+    global _conn
+    if _conn is not None:
+        _conn.close()
+        _conn = None
+
+def _legacy_questions(conn, quiz_key):
+    """Questions stored for one legacy quiz, converted to the quiz store layout."""
+    columns = {row["name"] for row in conn.execute("PRAGMA table_info(Questions)")}
+    if "quiz_id" not in columns:
+        return []
+    questions = []
+    for row in conn.execute("SELECT * FROM Questions WHERE quiz_id = ?", (quiz_key,)):
+        is_tf = bool(row["is_true_false"]) if "is_true_false" in columns else False
+        answer = ""
+        for col in ("answer", "correct_answer"):
+            if col in columns and row[col] is not None:
+                answer = str(row[col])
+                break
+        false_answers = []
+        if "false_answers" in columns and row["false_answers"]:
+            raw = row["false_answers"]
+            try:
+                false_answers = [str(fa) for fa in json.loads(raw)]
+            except ValueError:
+                false_answers = raw.split(",")
+        qid = row["question_id"] if "question_id" in columns else None
+        questions.append({
+            "question_id": str(qid) if isinstance(qid, str) and qid else str(uuid.uuid4()),
+            "question_text": (row["question_text"] or "").strip() if "question_text" in columns else "",
+            "is_true_false": is_tf,
+            "answer": answer.strip(),
+            "false_answers": [] if is_tf else [fa.strip() for fa in false_answers if fa.strip()],
+        })
+    return questions
+
+def migrate_legacy_database():
+    """Move quizzes left in the legacy SQLite database into the quiz store (runs once).
+
+    All rows are read and the legacy table is retired inside one transaction,
+    so an interrupted migration is simply retried on the next start. Quizzes
+    whose name already exists in the quiz store are left alone.
+    """
+    if not os.path.exists(DB_NAME):
+        return 0
+    conn = get_connection()
+    tables = {row["name"] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    if "Quizzes" not in tables:
+        return 0
+    migrated = 0
+    with conn:
+        # Take the write lock up front so two instances starting together don't both migrate.
+        conn.execute("BEGIN IMMEDIATE")
+        if not conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'Quizzes'").fetchone():
+            return 0
+        for row in conn.execute("SELECT * FROM Quizzes").fetchall():
+            keys = row.keys()
+            name = (row["quiz_name"] or "").strip()
+            if not name or store.load_quiz_by_name(name) is not None:
+                continue
+            quiz_key = row["quiz_id"] if "quiz_id" in keys else None
+            store.save_quiz({
+                # legacy ids were integers; the quiz store uses UUIDs
+                "quiz_id": quiz_key if isinstance(quiz_key, str) and quiz_key else str(uuid.uuid4()),
+                "quiz_name": name,
+                "quiz_description": (row["quiz_description"] or "") if "quiz_description" in keys else "",
+                "question_selector_amount": int(row["question_selector_amount"] or 4) if "question_selector_amount" in keys else 4,
+                "questions": _legacy_questions(conn, quiz_key) if "Questions" in tables and quiz_key is not None else [],
+            })
+            migrated += 1
+        # Keep the old rows for reference but never migrate them again.
+        conn.execute("ALTER TABLE Quizzes RENAME TO Quizzes_migrated")
+    return migrated
 
 # Define theme colors (Halloween purple and orange)
 HALLOWEEN_PURPLE       = "#6A0DAD"   # Primary purple color 
@@ -56,6 +140,11 @@ class WolfQuizApp:
                                       text_color="white", font=("Verdana", 16, "bold"), corner_radius=10)
         take_quiz_btn.pack(pady=10, fill="x")
 
+    def toggle_timing(self, event=None):
+        """Turn quiz_timing on or off and show the state in the main window title."""
+        on = quiz_timing.toggle()
+        self.master.title("WolfQuiz - Main Menu" + (" (timing on)" if on else ""))
+
     def open_quiz_creator(self):
         """Opens the QuizCreatorWindow for adding a brand-new quiz."""
         QuizCreatorWindow(self.master)  # Launches the Quiz Creator window (modal)
@@ -79,10 +168,6 @@ class QuizCreatorWindow(ctk.CTkToplevel):
         # Changed: Use CustomTkinter theming for the new quiz form
         self.configure(fg_color=HALLOWEEN_PURPLE_DARK)
 
-        # Database connection
-        self.conn = sqlite3.connect(DB_NAME)
-        self.c = self.conn.cursor()
-
         # Main Frame for form inputs
         main_frame = ctk.CTkFrame(self, fg_color=HALLOWEEN_PURPLE_DARK, corner_radius=0)
         main_frame.pack(fill="both", expand=True, padx=15, pady=15)
@@ -109,42 +194,45 @@ class QuizCreatorWindow(ctk.CTkToplevel):
         back_btn.pack(side="left", padx=5)
 
     def save_quiz(self):
-        """Insert a new quiz into the database (or JSON store)."""
+        """Create the new quiz in the quiz store so QuizMenu and QuestionCreator can see it."""
         quiz_name = self.title_entry.get().strip()
         quiz_desc = self.desc_text.get("1.0", "end").strip()
         if quiz_name == "":
             # Optionally, show a warning (omitted for brevity)
             return
-        # Changed: Save to database (using default selector_amount=4 for new quiz)
-        self.c.execute("""
-            INSERT INTO Quizzes (quiz_name, quiz_description, question_selector_amount)
-            VALUES (?, ?, ?)
-        """, (quiz_name, quiz_desc, 4))
-        self.conn.commit()
+        # Changed: Save to the quiz store (using default selector_amount=4 for new quiz), off the UI thread
+        background_io.write(self, store.create_quiz, quiz_name, quiz_desc, 4,
+                            on_done=self.quiz_saved, on_error=lambda e: self.quiz_save_failed(quiz_name, e))
+
+    def quiz_saved(self, quiz):
         # Clear fields (or close window after saving)
         self.title_entry.delete(0, "end")
         self.desc_text.delete("1.0", "end")
         # self.close_window()  # (Optional) Close immediately after saving
 
+    def quiz_save_failed(self, quiz_name, exc):
+        if isinstance(exc, FileExistsError):
+            messagebox.showwarning("Quiz exists", f"A quiz named '{quiz_name}' already exists.", parent=self)
+        else:
+            messagebox.showerror("Save failed", str(exc), parent=self)
+
     def close_window(self):
         self.destroy()
 
-    def __del__(self):
-        # Properly close DB connection if window is closed
-        try:
-            self.conn.close()
-        except:
-            pass
-
 def main():
-    # Initialize database (creates tables if needed)
-    setup_database()
+    # Bring any quizzes from the legacy SQLite database into the quiz store
+    migrate_legacy_database()
+    close_connection()
     # Changed: Initialize main application window using CustomTkinter
     ctk.set_appearance_mode("Dark")      # Force dark mode for consistent theming
     root = ctk.CTk()
     root.geometry("500x400")             # Set a starting size for the main menu window
     app = WolfQuizApp(root)
+    # Response-time instrumentation (see quiz_timing), toggled from any window
+    root.bind_all("<Control-Shift-T>", app.toggle_timing)
     root.mainloop()
+    # Let saves still queued on the writer thread finish before exiting
+    background_io.shutdown()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,236 @@
+"""Append-only history of finished quiz attempts, in a local SQLite database.
+
+Every finished attempt adds one row to attempts and one row per drawn
+question to answers (question_id, chosen option index, correctness and
+response time). An instrumented attempt (see quiz_timing) also keeps its
+render and think timings as JSON in attempts.timings. Neither table is ever updated or deleted from; triggers
+reject it. Dashboards read the aggregate tables instead of the raw log:
+
+    question_stats  asked / correct / skipped / response time per question
+    user_stats      attempts, answers and best score per user and quiz
+
+Both are updated incrementally in the same transaction that appends an
+attempt, so reading them never rescans answers; rebuild_stats() recomputes
+them from the log if they are ever in doubt.
+
+    attempt_history.record_session(session)          # after session.finish()
+    attempt_history.question_stats(quiz_id)           # hardest questions first
+    attempt_history.user_history("sam")
+"""
+import os
+import json
+import time
+import getpass
+import sqlite3
+import argparse
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlite_db import Transaction, connect
+
+# Database file holding the attempt log.
+DB_PATH = os.path.join(os.path.dirname(__file__), "wolfquiz_history.db")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS attempts (
+    attempt_id  INTEGER PRIMARY KEY,
+    user        TEXT NOT NULL,
+    quiz_id     TEXT NOT NULL,
+    started_at  REAL NOT NULL,   -- Unix time
+    finished_at REAL NOT NULL,
+    correct     INTEGER NOT NULL,
+    total       INTEGER NOT NULL,
+    timings     TEXT              -- quiz_timing export as JSON; NULL if not instrumented
+);
+CREATE TABLE IF NOT EXISTS answers (
+    attempt_id  INTEGER NOT NULL REFERENCES attempts(attempt_id),
+    position    INTEGER NOT NULL,
+    question_id TEXT NOT NULL,
+    chosen      INTEGER,          -- index into question_sampler.question_options; NULL if skipped
+    is_correct  INTEGER NOT NULL,
+    response_ms INTEGER NOT NULL,
+    PRIMARY KEY (attempt_id, position)
+) WITHOUT ROWID;
+-- per-user history, newest first
+CREATE INDEX IF NOT EXISTS idx_attempts_user ON attempts(user, finished_at);
+CREATE INDEX IF NOT EXISTS idx_attempts_quiz ON attempts(quiz_id, finished_at);
+-- covers miss-rate and option-choice queries for one question without touching the table
+CREATE INDEX IF NOT EXISTS idx_answers_question ON answers(question_id, is_correct, chosen);
+
+CREATE TABLE IF NOT EXISTS question_stats (
+    quiz_id     TEXT NOT NULL,
+    question_id TEXT NOT NULL,
+    asked       INTEGER NOT NULL DEFAULT 0,
+    correct     INTEGER NOT NULL DEFAULT 0,
+    skipped     INTEGER NOT NULL DEFAULT 0,
+    response_ms INTEGER NOT NULL DEFAULT 0,  -- summed over answers
+    PRIMARY KEY (quiz_id, question_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS user_stats (
+    user             TEXT NOT NULL,
+    quiz_id          TEXT NOT NULL,
+    attempts         INTEGER NOT NULL DEFAULT 0,
+    correct          INTEGER NOT NULL DEFAULT 0,
+    total            INTEGER NOT NULL DEFAULT 0,
+    best_percentage  REAL NOT NULL DEFAULT 0,
+    last_finished_at REAL,
+    PRIMARY KEY (user, quiz_id)
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS attempts_no_update BEFORE UPDATE ON attempts
+BEGIN SELECT RAISE(ABORT, 'attempt history is append-only'); END;
+CREATE TRIGGER IF NOT EXISTS attempts_no_delete BEFORE DELETE ON attempts
+BEGIN SELECT RAISE(ABORT, 'attempt history is append-only'); END;
+CREATE TRIGGER IF NOT EXISTS answers_no_update BEFORE UPDATE ON answers
+BEGIN SELECT RAISE(ABORT, 'attempt history is append-only'); END;
+CREATE TRIGGER IF NOT EXISTS answers_no_delete BEFORE DELETE ON answers
+BEGIN SELECT RAISE(ABORT, 'attempt history is append-only'); END;
+"""
+
+def _migrate(conn: sqlite3.Connection) -> None:
+    columns = {row["name"] for row in conn.execute("PRAGMA table_info(attempts)")}
+    if "timings" not in columns:
+        # history databases written before timings were recorded
+        conn.execute("ALTER TABLE attempts ADD COLUMN timings TEXT")
+
+def _connect() -> sqlite3.Connection:
+    """Return this thread's connection to DB_PATH, opening it on first use."""
+    return connect(DB_PATH, _SCHEMA, _migrate)
+
+def current_user() -> str:
+    """The name attempts are recorded under: $WOLFQUIZ_USER, else the login name."""
+    return os.environ.get("WOLFQUIZ_USER") or getpass.getuser()
+
+# (question_id, chosen option index or None, is correct, response time in ms), as QuizSession.attempt_rows
+AnswerRow = Tuple[str, Optional[int], bool, int]
+
+def record_attempt(user: str, quiz_id: str, rows: Iterable[AnswerRow],
+                   started_at: float, finished_at: Optional[float] = None, timings: Optional[Dict] = None) -> int:
+    """Append one finished attempt and fold it into the aggregates; returns its attempt_id."""
+    rows = list(rows)
+    finished_at = time.time() if finished_at is None else finished_at
+    correct = sum(1 for _, _, ok, _ in rows if ok)
+    total = len(rows)
+    with Transaction(_connect()) as conn:
+        attempt_id = conn.execute("""
+            INSERT INTO attempts (user, quiz_id, started_at, finished_at, correct, total, timings)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, (user, quiz_id, started_at, finished_at, correct, total,
+              None if timings is None else json.dumps(timings, ensure_ascii=False))).lastrowid
+        conn.executemany("""
+            INSERT INTO answers (attempt_id, position, question_id, chosen, is_correct, response_ms)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, [(attempt_id, pos, qid, chosen, int(ok), int(ms)) for pos, (qid, chosen, ok, ms) in enumerate(rows)])
+        conn.executemany("""
+            INSERT INTO question_stats (quiz_id, question_id, asked, correct, skipped, response_ms)
+            VALUES (?, ?, 1, ?, ?, ?)
+            ON CONFLICT(quiz_id, question_id) DO UPDATE SET
+                asked = asked + 1, correct = correct + excluded.correct,
+                skipped = skipped + excluded.skipped, response_ms = response_ms + excluded.response_ms
+        """, [(quiz_id, qid, int(ok), int(chosen is None), int(ms)) for qid, chosen, ok, ms in rows])
+        percentage = correct / total * 100 if total else 0.0
+        conn.execute("""
+            INSERT INTO user_stats (user, quiz_id, attempts, correct, total, best_percentage, last_finished_at)
+            VALUES (?, ?, 1, ?, ?, ?, ?)
+            ON CONFLICT(user, quiz_id) DO UPDATE SET
+                attempts = attempts + 1, correct = correct + excluded.correct, total = total + excluded.total,
+                best_percentage = MAX(best_percentage, excluded.best_percentage),
+                last_finished_at = MAX(last_finished_at, excluded.last_finished_at)
+        """, (user, quiz_id, correct, total, percentage, finished_at))
+    return attempt_id
+
+def record_session(session, user: Optional[str] = None) -> int:
+    """Record a finished quiz_session.QuizSession, with its timings if it has any."""
+    if not session.finished:
+        raise ValueError("Only finished sessions can be recorded")
+    return record_attempt(user or current_user(), session.quiz_id or "", session.attempt_rows(),
+                          session.started_at, session.finished_at, session.timings)
+
+def question_stats(quiz_id: str) -> List[Dict]:
+    """Per-question totals of one quiz with miss_rate and mean_response_ms, highest miss rate first."""
+    rows = _connect().execute("""
+        SELECT question_id, asked, correct, skipped,
+               1.0 - CAST(correct AS REAL) / asked AS miss_rate,
+               CAST(response_ms AS REAL) / asked AS mean_response_ms
+        FROM question_stats WHERE quiz_id = ? AND asked > 0
+        ORDER BY miss_rate DESC, asked DESC
+    """, (quiz_id,)).fetchall()
+    return [dict(row) for row in rows]
+
+def question_choices(question_id: str) -> Dict[Optional[int], int]:
+    """{chosen option index (None = skipped): times chosen} over the whole log (index-only scan)."""
+    rows = _connect().execute("""
+        SELECT chosen, COUNT(*) FROM answers WHERE question_id = ? GROUP BY chosen
+    """, (question_id,)).fetchall()
+    return {chosen: n for chosen, n in rows}
+
+def user_stats(user: str) -> List[Dict]:
+    """One row per quiz the user has attempted, most recent first."""
+    rows = _connect().execute("""
+        SELECT * FROM user_stats WHERE user = ? ORDER BY last_finished_at DESC
+    """, (user,)).fetchall()
+    return [dict(row) for row in rows]
+
+def user_history(user: str, quiz_id: Optional[str] = None, limit: int = 50) -> List[Dict]:
+    """The user's latest attempts (newest first), optionally for one quiz only."""
+    if quiz_id is None:
+        rows = _connect().execute("""
+            SELECT * FROM attempts WHERE user = ? ORDER BY finished_at DESC LIMIT ?
+        """, (user, limit)).fetchall()
+    else:
+        rows = _connect().execute("""
+            SELECT * FROM attempts WHERE user = ? AND quiz_id = ? ORDER BY finished_at DESC LIMIT ?
+        """, (user, quiz_id, limit)).fetchall()
+    return [dict(row) for row in rows]
+
+def attempt_answers(attempt_id: int) -> List[Dict]:
+    rows = _connect().execute("""
+        SELECT * FROM answers WHERE attempt_id = ? ORDER BY position
+    """, (attempt_id,)).fetchall()
+    return [dict(row) for row in rows]
+
+def attempt_timings(attempt_id: int) -> Optional[Dict]:
+    """The quiz_timing export recorded with an attempt (None if it was not instrumented)."""
+    row = _connect().execute("SELECT timings FROM attempts WHERE attempt_id = ?", (attempt_id,)).fetchone()
+    return None if row is None or row["timings"] is None else json.loads(row["timings"])
+
+def rebuild_stats() -> None:
+    """Recompute both aggregate tables from the raw log in one transaction."""
+    with Transaction(_connect()) as conn:
+        conn.execute("DELETE FROM question_stats")
+        conn.execute("""
+            INSERT INTO question_stats (quiz_id, question_id, asked, correct, skipped, response_ms)
+            SELECT a.quiz_id, ans.question_id, COUNT(*), SUM(ans.is_correct),
+                   SUM(ans.chosen IS NULL), SUM(ans.response_ms)
+            FROM answers AS ans JOIN attempts AS a ON a.attempt_id = ans.attempt_id
+            GROUP BY a.quiz_id, ans.question_id
+        """)
+        conn.execute("DELETE FROM user_stats")
+        conn.execute("""
+            INSERT INTO user_stats (user, quiz_id, attempts, correct, total, best_percentage, last_finished_at)
+            SELECT user, quiz_id, COUNT(*), SUM(correct), SUM(total),
+                   MAX(CASE WHEN total > 0 THEN correct * 100.0 / total ELSE 0.0 END), MAX(finished_at)
+            FROM attempts GROUP BY user, quiz_id
+        """)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Show the recorded quiz attempt history.")
+    parser.add_argument("--db", default=DB_PATH, help="history database file")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--user", help="show a user's latest attempts (default: the current user)")
+    group.add_argument("--quiz-id", help="show per-question miss rates of a quiz")
+    group.add_argument("--rebuild", action="store_true", help="recompute the aggregate tables from the log")
+    args = parser.parse_args()
+    DB_PATH = args.db
+    if args.rebuild:
+        rebuild_stats()
+        print(f"Rebuilt aggregates in {DB_PATH}")
+    elif args.quiz_id:
+        for row in question_stats(args.quiz_id):
+            print(f"{row['question_id']}  missed {row['miss_rate']:6.1%} of {row['asked']}"
+                  f"  ({row['mean_response_ms'] / 1000:.1f}s avg)")
+    else:
+        user = args.user or current_user()
+        for row in user_history(user):
+            percentage = row["correct"] / row["total"] * 100 if row["total"] else 0.0
+            print(f"{time.strftime('%Y-%m-%d %H:%M', time.localtime(row['finished_at']))}  {row['quiz_id']}"
+                  f"  {row['correct']}/{row['total']} ({percentage:.1f}%)")
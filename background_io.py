@@ -0,0 +1,94 @@
+"""Run store calls off the Tk main loop and hand their results back to it.
+
+Tk widgets may only be touched from the thread running mainloop, so a
+worker never calls back into the UI itself: it puts (callback, value) on a
+queue that the main loop drains with after() while work is outstanding.
+
+    background_io.run(self, store.list_quizzes, on_done=self.show_quizzes)
+    background_io.write(self, batch.commit, on_done=self.saved)
+
+Reads share a small thread pool. Writes go through a single thread, so
+saves reach the disk in the order they were made. Callbacks for a widget
+that was destroyed in the meantime are dropped.
+
+Objects the UI keeps reading (such as a LoadedQuiz) are not locked: give
+a worker a copy and swap its result in from the callback.
+"""
+import queue
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
+
+READ_WORKERS = 4
+POLL_MS = 30
+
+_readers = ThreadPoolExecutor(max_workers=READ_WORKERS, thread_name_prefix="wolfquiz-read")
+_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="wolfquiz-write")
+_results: "queue.Queue" = queue.Queue()
+_pending = 0
+_polling = False
+
+def _deliver(widget, on_done: Optional[Callable], on_error: Optional[Callable], future: Future) -> None:
+    # Worker thread: only queue the outcome, the main loop runs the callback
+    exc = future.exception()
+    if exc is None:
+        _results.put((widget, on_done, future.result()))
+    else:
+        _results.put((widget, on_error or _report(widget), exc))
+
+def _report(widget) -> Callable:
+    # Same handling as an exception raised inside a normal Tk callback
+    def report(exc: BaseException) -> None:
+        widget._root().report_callback_exception(type(exc), exc, exc.__traceback__)
+    return report
+
+def _poll(root) -> None:
+    global _pending, _polling
+    while True:
+        try:
+            widget, callback, value = _results.get_nowait()
+        except queue.Empty:
+            break
+        _pending -= 1
+        if callback is None or not widget.winfo_exists():
+            continue
+        try:
+            callback(value)
+        except Exception as exc:
+            _report(root)(exc)
+    if _pending:
+        root.after(POLL_MS, _poll, root)
+    else:
+        # nothing outstanding: stop waking the main loop until the next submit
+        _polling = False
+
+def _submit(executor: ThreadPoolExecutor, widget, fn: Callable, args, kwargs,
+            on_done: Optional[Callable], on_error: Optional[Callable]) -> Future:
+    global _pending, _polling
+    _pending += 1
+    future = executor.submit(fn, *args, **kwargs)
+    future.add_done_callback(lambda f: _deliver(widget, on_done, on_error, f))
+    if not _polling:
+        _polling = True
+        root = widget._root()
+        root.after(POLL_MS, _poll, root)
+    return future
+
+def run(widget, fn: Callable, *args, on_done: Optional[Callable] = None,
+        on_error: Optional[Callable] = None, **kwargs) -> Future:
+    """Call fn(*args, **kwargs) on a reader thread.
+
+    on_done(result) or on_error(exception) then runs on the main loop, unless
+    widget has been destroyed. Without on_error the exception is reported
+    like any other Tk callback error. Must be called from the main loop.
+    """
+    return _submit(_readers, widget, fn, args, kwargs, on_done, on_error)
+
+def write(widget, fn: Callable, *args, on_done: Optional[Callable] = None,
+          on_error: Optional[Callable] = None, **kwargs) -> Future:
+    """Like run(), but on the single writer thread, so writes keep their order."""
+    return _submit(_writer, widget, fn, args, kwargs, on_done, on_error)
+
+def shutdown() -> None:
+    """Wait for queued writes to reach the disk (call after mainloop returns)."""
+    _writer.shutdown(wait=True)
+    _readers.shutdown(wait=False)
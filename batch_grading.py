@@ -0,0 +1,125 @@
+"""Grade many attempts at one quiz at once (class-wide review).
+
+Attempts are encoded as an int16 matrix with one row per attempt and one
+column per question of the quiz's bank. A cell holds the chosen option's
+index into question_sampler.question_options, or
+
+    NOT_ASKED  (-1)  the question was not drawn for that attempt
+    SKIPPED    (-2)  it was shown but left unanswered (counts as wrong)
+
+so scores, grade buckets, p-values and distractor rates are each a few
+vectorized passes over the matrix instead of a Python loop per answer.
+
+    attempts = [session.answers_by_id() for session in finished_sessions]
+    report = batch_grading.grade(batch_grading.encode(quiz["questions"], attempts))
+
+NumPy is optional for the rest of WolfQuiz and only needed here.
+"""
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # the app runs without it; only batch grading needs it
+    np = None
+
+import question_sampler
+from quiz_session import GRADE_THRESHOLDS
+
+NOT_ASKED = -1
+SKIPPED = -2
+GRADES = tuple(grade for _, grade in GRADE_THRESHOLDS) + ("A+",)
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("batch grading needs NumPy (pip install numpy)")
+
+class EncodedAttempts:
+    """The answer matrix of a set of attempts plus what is needed to grade it."""
+    def __init__(self, question_ids: List[str], answers, correct, option_counts):
+        self.question_ids = question_ids    # column order
+        self.answers = answers              # (attempts, questions) int16
+        self.correct = correct              # (questions,) index of the correct option
+        self.option_counts = option_counts  # (questions,) options per question
+
+    def __len__(self) -> int:
+        return self.answers.shape[0]
+
+def encode(questions: Sequence[Dict], attempts: Iterable[Mapping[str, Optional[int]]]) -> EncodedAttempts:
+    """Build the answer matrix from {question_id: option index or None} per attempt.
+
+    Questions missing from an attempt are NOT_ASKED; ids that are not in the
+    bank (e.g. deleted since) are ignored.
+    """
+    _require_numpy()
+    question_ids = [q.get("question_id") for q in questions]
+    column = {qid: i for i, qid in enumerate(question_ids)}
+    attempts = list(attempts)
+    answers = np.full((len(attempts), len(question_ids)), NOT_ASKED, dtype=np.int16)
+    for row, attempt in enumerate(attempts):
+        for qid, chosen in attempt.items():
+            col = column.get(qid)
+            if col is not None:
+                answers[row, col] = SKIPPED if chosen is None else chosen
+    correct = np.fromiter((question_sampler.correct_option(q) for q in questions), dtype=np.int16, count=len(questions))
+    option_counts = np.fromiter((len(question_sampler.question_options(q)) for q in questions),
+                                dtype=np.int16, count=len(questions))
+    return EncodedAttempts(question_ids, answers, correct, option_counts)
+
+class GradeReport:
+    """Results of grade(); every per-question array follows EncodedAttempts.question_ids."""
+    def __init__(self, question_ids, correct_options, correct, asked, percentages, grade_index, p_values, option_rates):
+        self.question_ids = question_ids
+        self.correct_options = correct_options  # (questions,) index of the correct option
+        self.correct = correct              # (attempts,) questions answered correctly
+        self.asked = asked                  # (attempts,) questions shown
+        self.percentages = percentages      # (attempts,) score in percent
+        self.grade_index = grade_index      # (attempts,) index into GRADES
+        self.p_values = p_values            # (questions,) share answering correctly; NaN if never asked
+        self.option_rates = option_rates    # (questions, max options) share choosing each option
+
+    @property
+    def grades(self) -> List[str]:
+        return [GRADES[i] for i in self.grade_index]
+
+    def grade_counts(self) -> Dict[str, int]:
+        counts = np.bincount(self.grade_index, minlength=len(GRADES))
+        return dict(zip(GRADES, counts.tolist()))
+
+    def distractor_rates(self) -> "np.ndarray":
+        """option_rates with the correct option of each question masked out (NaN)."""
+        rates = self.option_rates.copy()
+        if rates.size:
+            rates[np.arange(len(self.correct_options)), self.correct_options] = np.nan
+        return rates
+
+def grade(encoded: EncodedAttempts) -> GradeReport:
+    _require_numpy()
+    answers = encoded.answers
+    asked_mask = answers != NOT_ASKED
+    correct_mask = answers == encoded.correct          # NOT_ASKED / SKIPPED never match
+
+    correct = correct_mask.sum(axis=1)
+    asked = asked_mask.sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        percentages = np.where(asked > 0, correct / asked * 100, 0.0)
+    # Thresholds are inclusive upper bounds, so the first bound >= score is the grade
+    limits = np.array([limit for limit, _ in GRADE_THRESHOLDS], dtype=float)
+    grade_index = np.searchsorted(limits, percentages, side="left")
+
+    times_asked = asked_mask.sum(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        p_values = correct_mask.sum(axis=0) / times_asked
+
+    # Option choice counts via one bincount over (question, option) cells
+    n_questions = len(encoded.question_ids)
+    width = int(encoded.option_counts.max()) if n_questions else 0
+    # an index past a question's options (bad input) is graded wrong and not counted as a choice
+    chosen = (answers >= 0) & (answers < encoded.option_counts)
+    cells = np.nonzero(chosen)[1] * width + answers[chosen].astype(np.int64)
+    counts = np.bincount(cells, minlength=n_questions * width).reshape(n_questions, width)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        option_rates = counts / times_asked[:, None]
+    # options a question doesn't have are NaN, not 0
+    option_rates[np.arange(width)[None, :] >= encoded.option_counts[:, None]] = np.nan
+
+    return GradeReport(encoded.question_ids, encoded.correct, correct, asked, percentages, grade_index, p_values, option_rates)
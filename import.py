@@ -0,0 +1,282 @@
+"""Bulk-import questions into a quiz of the JSON store.
+
+    python import.py bank.json                  # a quiz object or a list of questions
+    python import.py bank.jsonl --quiz "Bio 101"  # one question per line
+
+Input is streamed record by record, so a bank with tens of thousands of
+questions is never held as one parsed document. Records are validated in
+a process pool, in chunks:
+
+- "answer" is required (the legacy "correct_answer" key is accepted and
+  renamed; a record holding both with different values is rejected),
+- question_text is required, and True/False answers must be True or False,
+- a question_id may appear only once in the input (missing ids are generated).
+
+Valid questions are written through the selected quiz store (store.py) in
+batches, each one atomic save of the quiz. Existing questions with the same
+question_id are updated.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import store
+
+READ_CHUNK = 1 << 16
+VALIDATE_CHUNK = 2000
+WRITE_BATCH = 10000
+MAX_REPORTED_ERRORS = 20
+
+_decoder = json.JSONDecoder()
+
+class _Stream:
+    """A small buffered reader that lets raw_decode parse one value at a time."""
+    def __init__(self, f):
+        self.f = f
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.f.read(READ_CHUNK)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character ('' at end of input)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f"Expected '{char}' in JSON input")
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value, reading more input until it is whole."""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # a number could continue in the next chunk; objects and strings can't
+            if end == len(self.buf) and not isinstance(value, (dict, list, str)) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def array(self) -> Iterator:
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.peek() == ",":
+                self.pos += 1
+                continue
+            self.expect("]")
+            return
+
+def read_json(f, header: Dict) -> Iterator[Dict]:
+    """Yield the questions of a JSON document: a list of questions or a quiz object.
+
+    Top-level quiz fields are copied into header as they are met.
+    """
+    stream = _Stream(f)
+    if stream.peek() == "[":
+        yield from stream.array()
+        return
+    stream.expect("{")
+    while stream.peek() != "}":
+        key = stream.value()
+        stream.expect(":")
+        if key == "questions":
+            yield from stream.array()
+        else:
+            header[key] = stream.value()
+        if stream.peek() == ",":
+            stream.pos += 1
+    stream.expect("}")
+
+def read_jsonl(f, header: Dict) -> Iterator[Dict]:
+    """Yield one question per line; a line with quiz_name and no question_text is the quiz header."""
+    for line in f:
+        line = line.strip()
+        if not line:
+            continue
+        record = json.loads(line)
+        if isinstance(record, dict) and "quiz_name" in record and "question_text" not in record:
+            header.update(record)
+            continue
+        yield record
+
+def validate_record(record) -> Tuple[Optional[Dict], Optional[str]]:
+    """Normalize one input record to the store layout; returns (question, None) or (None, error)."""
+    if not isinstance(record, dict):
+        return None, "not a JSON object"
+    text = str(record.get("question_text") or "").strip()
+    if not text:
+        return None, "missing question_text"
+    answer = record.get("answer")
+    legacy = record.get("correct_answer")
+    if answer is not None and legacy is not None and str(answer).strip() != str(legacy).strip():
+        return None, "'answer' and legacy 'correct_answer' disagree"
+    if answer is None:
+        answer = legacy
+    if answer is None or not str(answer).strip():
+        return None, "missing answer"
+    answer = str(answer).strip()
+    is_tf = bool(record.get("is_true_false", False))
+    if is_tf:
+        if answer.lower() not in ("true", "false"):
+            return None, "True/False answer must be True or False"
+        answer = answer.capitalize()
+    false_answers = record.get("false_answers") or []
+    if not isinstance(false_answers, list):
+        return None, "false_answers must be a list"
+    qid = record.get("question_id")
+    return {
+        "question_id": str(qid) if qid else None,
+        "question_text": text,
+        "is_true_false": is_tf,
+        "answer": answer,
+        "false_answers": [] if is_tf else [str(fa).strip() for fa in false_answers if str(fa).strip()],
+    }, None
+
+def validate_chunk(chunk: List[Tuple[int, object]]) -> List[Tuple[int, Optional[Dict], Optional[str]]]:
+    """Process-pool entry point: validate (record number, record) pairs."""
+    return [(n, *validate_record(record)) for n, record in chunk]
+
+def _chunks(records: Iterator, size: int) -> Iterator[List[Tuple[int, object]]]:
+    chunk = []
+    for n, record in enumerate(records, 1):
+        chunk.append((n, record))
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def _validated(pool: ProcessPoolExecutor, chunks: Iterator, in_flight: int) -> Iterator:
+    """Like pool.map(validate_chunk, chunks), but reads ahead only in_flight chunks
+    (Executor.map would consume the whole input before returning)."""
+    futures = deque()
+    for chunk in chunks:
+        futures.append(pool.submit(validate_chunk, chunk))
+        if len(futures) >= in_flight:
+            yield futures.popleft().result()
+    while futures:
+        yield futures.popleft().result()
+
+def _open_target(name: str, description: str, selector_amount: int) -> store.LoadedQuiz:
+    slug = store._slugify(name)
+    loaded = store.open_quiz(slug)
+    if loaded is None:
+        store.create_quiz(name, description, selector_amount)
+        loaded = store.open_quiz(slug)
+    return loaded
+
+def import_file(path: str, quiz_name: Optional[str] = None, fmt: Optional[str] = None,
+                workers: Optional[int] = None, batch_size: int = WRITE_BATCH,
+                dry_run: bool = False, errors=sys.stderr) -> Tuple[str, int, int, float]:
+    """Import one file; returns (slug, imported, rejected, seconds).
+
+    The target quiz is quiz_name, else the input's quiz_name, else the file name.
+    Batches are written as soon as the target is known; a quiz object whose
+    quiz_name comes after its questions (or is missing) is written at the end.
+    """
+    fmt = fmt or ("jsonl" if path.endswith(".jsonl") else "json")
+    header: Dict = {}
+    started = time.perf_counter()
+    seen = set()
+    imported = rejected = 0
+    loaded = None
+    pending: List[Dict] = []
+
+    def target() -> Optional[store.LoadedQuiz]:
+        nonlocal loaded
+        if loaded is None and not dry_run:
+            name = quiz_name or header.get("quiz_name") or os.path.splitext(os.path.basename(path))[0]
+            loaded = _open_target(name, str(header.get("quiz_description") or ""),
+                                  int(header.get("question_selector_amount") or 4))
+        return loaded
+
+    def flush() -> None:
+        nonlocal pending
+        if not pending:
+            return  # nothing accepted yet: don't create an empty quiz
+        quiz = target()
+        if quiz is not None:
+            # one atomic save of the quiz per batch
+            with store.batch(quiz) as b:
+                for q in pending:
+                    b.upsert(q["question_id"], q["question_text"], q["is_true_false"], q["answer"], q["false_answers"])
+        pending = []
+
+    def reject(n: int, message: str) -> None:
+        nonlocal rejected
+        rejected += 1
+        if rejected <= MAX_REPORTED_ERRORS:
+            print(f"record {n}: {message}", file=errors)
+
+    workers = workers or os.cpu_count() or 1
+    with open(path, "r", encoding="utf-8") as f, ProcessPoolExecutor(max_workers=workers) as pool:
+        records = (read_jsonl if fmt == "jsonl" else read_json)(f, header)
+        # results come back in input order, so duplicate detection and the write order are deterministic
+        for results in _validated(pool, _chunks(records, VALIDATE_CHUNK), 2 * workers):
+            for n, q, error in results:
+                if error:
+                    reject(n, error)
+                    continue
+                if q["question_id"] is None:
+                    q["question_id"] = str(uuid.uuid4())
+                elif q["question_id"] in seen:
+                    reject(n, f"duplicate question_id {q['question_id']}")
+                    continue
+                seen.add(q["question_id"])
+                pending.append(q)
+                imported += 1
+                # a quiz object may carry quiz_name after its questions; wait until it is known
+                if len(pending) >= batch_size and (quiz_name or "quiz_name" in header or fmt == "jsonl"):
+                    flush()
+    flush()
+    if rejected > MAX_REPORTED_ERRORS:
+        print(f"... {rejected - MAX_REPORTED_ERRORS} more rejected records", file=errors)
+    slug = loaded.slug if loaded is not None else "-"
+    return slug, imported, rejected, time.perf_counter() - started
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk-import questions from JSON or JSONL into the quiz store.")
+    parser.add_argument("path", help="a .json quiz or question list, or a .jsonl file with one question per line")
+    parser.add_argument("--quiz", help="name of the quiz to import into (created if missing)")
+    parser.add_argument("--format", choices=("json", "jsonl"), help="input format (default: from the file extension)")
+    parser.add_argument("--workers", type=int, help="validation processes (default: CPU count)")
+    parser.add_argument("--batch-size", type=int, default=WRITE_BATCH, help="questions per atomic save")
+    parser.add_argument("--dry-run", action="store_true", help="validate only, write nothing")
+    args = parser.parse_args()
+    slug, imported, rejected, seconds = import_file(args.path, args.quiz, args.format, args.workers,
+                                                    args.batch_size, args.dry_run)
+    rate = imported / seconds if seconds else 0.0
+    action = "Validated" if args.dry_run else f"Imported into '{slug}':"
+    print(f"{action} {imported} questions, {rejected} rejected, in {seconds:.2f}s ({rate:,.0f} questions/sec)")
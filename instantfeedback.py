@@ -1,15 +1,17 @@
 import customtkinter as ctk
-import random
 import Results
-import json_store
+import attempt_history
+import background_io
+import quiz_session
+import quiz_timing
 # Import shared styles and components from QuizTake
 from QuizTake import (BG_MAIN, QUESTION_BOX_BG, TEXT_COLOR,
                       ANSWER_NORMAL, ANSWER_HOVER, ANSWER_SELECTED, OFFSET_COLOR,
                       QUESTION_FONT, ANSWER_FONT,
-                      QuestionBox, AnswerRectangle)
+                      QuestionBox, AnswerRectangle, AnswerPool, QuestionPrefetcher)
 
 class InstantFeedbackWindow(ctk.CTkToplevel):
-    def __init__(self, master, quiz_slug: str):
+    def __init__(self, master, quiz_slug: str, seed=None, weights=None):
         super().__init__(master)
         self.title("Instant Feedback Quiz")
         self.quiz_slug = quiz_slug
@@ -18,10 +20,11 @@ class InstantFeedbackWindow(ctk.CTkToplevel):
         self.configure(fg_color=BG_MAIN)
         self.grab_set()
 
-        quiz = json_store.load_quiz_by_slug(quiz_slug)
-        self.questions = quiz.get("questions", []) if quiz else []
-        self.current = 0
-        self.user_answers = []
+        # The attempt itself (a quiz_session.QuizSession), started off the UI
+        # thread (see on_session_ready)
+        self.session = None
+        # Render/think-time samples, recorded only while quiz_timing is enabled
+        self.timer = quiz_timing.QuizTimer()
 
         # Main container frames
         self.main = ctk.CTkFrame(self, fg_color=BG_MAIN)
@@ -30,77 +33,74 @@ class InstantFeedbackWindow(ctk.CTkToplevel):
         self.qbox.pack(pady=20)
         self.ans_frame = ctk.CTkFrame(self.main, fg_color=BG_MAIN)
         self.ans_frame.pack(pady=20)
+        self.answer_pool = AnswerPool(self.ans_frame, command=self.on_click)
 
+        self.qbox.set_text("Loading quiz...")
+        # Each attempt draws question_selector_amount questions (all of them if unset)
+        background_io.run(self, quiz_session.QuizSession.load, quiz_slug, seed=seed, weights=weights,
+                          on_done=self.on_session_ready)
+
+    def on_session_ready(self, session):
+        self.session = session
+        self.prefetcher = QuestionPrefetcher(self, len(self.session), self.build_layout, self.answer_pool)
+        if not len(self.session):
+            self.qbox.set_text("This quiz has no questions yet.")
+            return
         self.load_question()
 
-    def load_question(self):
-        # Clear previous answers
-        for w in self.ans_frame.winfo_children():
-            w.destroy()
-        self.answer_widgets = []
+    def build_layout(self, index):
+        """Display text and answer options of one question (prepared ahead by the prefetcher)."""
+        q_text = self.session.question(index).get("question_text", "")
+        display = f"Question {index+1}/{len(self.session)}:\n{q_text}"
+        return display, self.session.options(index)
 
-        q = self.questions[self.current]
-        q_text = q.get("question_text", "")
-        is_tf = bool(q.get("is_true_false", False))
-        display = f"Question {self.current+1}/{len(self.questions)}:\n{q_text}"
+    @quiz_timing.timed("render")
+    def load_question(self):
+        display, options = self.prefetcher.get(self.session.current)
         self.qbox.set_text(display)
 
-        # Prepare answer options
-        if is_tf:
-            options = ["True", "False"]
-        else:
-            correct = q.get("answer", "")
-            false_opts = list(q.get("false_answers", []))
-            options = [correct] + false_opts
-            random.shuffle(options)
-
-        # Create answer rectangles (grid them in two columns)
-        for idx, opt in enumerate(options):
-            btn = AnswerRectangle(self.ans_frame, text=opt,
-                                  command=lambda widget, _opts=options: self.on_click(widget),
-                                  width=350, height=120)
-            r, c = divmod(idx, 2)
-            btn.grid(row=r, column=c, padx=30, pady=30)
-            self.answer_widgets.append(btn)
+        # Reuse the pooled answer rectangles (gridded in two columns)
+        self.answer_widgets = self.answer_pool.show(options)
+        # Response time counts from here
+        self.session.mark_shown()
+        # The feedback delay leaves plenty of idle time to prepare what comes next
+        self.prefetcher.prefetch(self.session.current)
 
+    @quiz_timing.timed("answer")
     def on_click(self, widget):
-        # On answer click: mark selected and store answer
+        # On answer click: mark selected and record its position in the session
         widget.select(True)
-        chosen_text = widget.label.cget("text")
-        self.user_answers.append(chosen_text)
-        q = self.questions[self.current]
-        correct = q.get("answer", "")
+        self.session.answer(self.answer_widgets.index(widget))
+        correct = self.session.correct_position()
 
-        # Disable further clicks on all answer widgets
+        # Disable further clicks on all answer widgets (re-enabled when the pool shows the next question)
         for w in self.answer_widgets:
-            w.inner.unbind("<Button-1>")
-            w.label.unbind("<Button-1>")
-            w.label_shadow.unbind("<Button-1>")
+            w.enabled = False
 
         # After a short delay, show feedback coloring (green/red)
         self.after(1000, lambda: self.show_feedback(correct))
 
     def show_feedback(self, correct):
         # Color all answer options: green for correct answer, red for others
-        for w in self.answer_widgets:
-            txt = w.label.cget("text")
-            w.set_color("green" if txt == correct else "red")
+        for position, w in enumerate(self.answer_widgets):
+            w.set_color("green" if position == correct else "red")
         # After a delay, proceed to next question or finish
         self.after(3000, self.next_or_finish)
 
+    @quiz_timing.timed("navigate")
     def next_or_finish(self):
-        self.current += 1
-        if self.current < len(self.questions):
+        if self.session.next():
             self.load_question()
         else:
             self.finish()
 
+    @quiz_timing.timed("finish")
     def finish(self):
-        # Compile results and show the results window
-        result_data = []
-        for i, q in enumerate(self.questions):
-            user_ans = self.user_answers[i]
-            correct = q.get("answer", "")
-            result_data.append((q.get("question_text", ""), user_ans, correct, user_ans == correct))
+        # Grading happens in the session; the Results window just shows the rows
+        result_data = self.session.finish()
+        # Timings (when instrumented) go into the history record, so export them first
+        quiz_timing.export_attempt(self)
+        # Append the attempt to the local history (on the writer thread, after any pending saves)
+        background_io.write(self.master, attempt_history.record_session, self.session)
         Results.ResultsWindow(self.master, result_data)
         self.destroy()
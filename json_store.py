@@ -1,12 +1,48 @@
 
 import os
+import re
 import json
 import uuid
-from typing import Dict, List, Optional, Tuple
+import shutil
+import stat
+import contextlib
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import wqz
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
 
 # Directory where all quizzes live.
 QUIZZES_DIR = os.path.join(os.path.dirname(__file__), "quizzes")
 
+# Process-wide catalog of quiz headers, keyed by file path.
+# Each entry is ((mtime_ns, size), header_dict); a file is only re-parsed
+# when its stat signature changes.
+_catalog: Dict[str, Tuple[Tuple[int, int], Optional[Dict]]] = {}
+_catalog_stats = {"hits": 0, "misses": 0}
+_catalog_lock = threading.Lock()
+
+# File format of newly created quizzes: ".json" (pretty-printed) or wqz.EXTENSION
+# (compact, memory-mapped). Existing quizzes keep the format they are stored in;
+# use convert_quiz to switch one.
+QUIZ_FORMAT = ".json"
+QUIZ_FORMATS = (".json", wqz.EXTENSION)
+
+# Name of the on-disk quiz_id -> slug index inside QUIZZES_DIR.
+INDEX_FILENAME = ".index.json"
+
+# When true, save_quiz keeps the previous version of each quiz file as <file>.bak.
+KEEP_BACKUPS = False
+# Temp files older than this (seconds) belong to a crashed writer and are swept by list_quizzes.
+STALE_TEMP_SECONDS = 3600
+_index_lock = threading.Lock()
+
 def _ensure_dir() -> None:
     os.makedirs(QUIZZES_DIR, exist_ok=True)
 
@@ -19,56 +55,420 @@ def _slugify(name: str) -> str:
     )
 
 def _quiz_path(slug: str) -> str:
+    """Path of the quiz file for slug, in whichever format it is stored (QUIZ_FORMAT if new)."""
     _ensure_dir()
-    return os.path.join(QUIZZES_DIR, f"{slug}.json")
+    base = os.path.join(QUIZZES_DIR, slug)
+    for ext in (wqz.EXTENSION, ".json"):
+        if os.path.exists(base + ext):
+            return base + ext
+    return base + QUIZ_FORMAT
+
+def _index_path() -> str:
+    return os.path.join(QUIZZES_DIR, INDEX_FILENAME)
+
+def _fsync_dir(directory: str) -> None:
+    # Persist the rename itself; directories cannot be opened like this on Windows.
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+def _make_backup(path: str) -> None:
+    """Keep the current contents of path as path + '.bak' before it is replaced."""
+    if not os.path.exists(path):
+        return
+    bak = path + ".bak"
+    tmp = bak + ".tmp"
+    try:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        # a hard link is free; fall back to a copy where links are unsupported
+        os.link(path, tmp)
+    except OSError:
+        shutil.copy2(path, tmp)
+    os.replace(tmp, bak)
+
+def _write_atomic(path: str, payload: bytes, backup: bool = False) -> None:
+    """Crash-safely write payload to path.
+
+    The data goes to a temp file in the same directory, is fsync'ed, and then
+    renamed over path with os.replace, so readers see either the old file or
+    the complete new one, never a truncated write.
+    """
+    directory = os.path.dirname(path)
+    tmp = os.path.join(directory, f".{os.path.basename(path)}.{uuid.uuid4().hex}.tmp")
+    # 0o666 lets the umask decide, like a plain open(); mkstemp would make it owner-only
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            try:
+                # a replaced file keeps its permissions (e.g. group-writable on a shared directory)
+                os.chmod(tmp, stat.S_IMODE(os.stat(path).st_mode))
+            except FileNotFoundError:
+                pass
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        if backup:
+            _make_backup(path)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    _fsync_dir(directory)
+
+def _write_json_atomic(path: str, obj, indent: Optional[int] = None, backup: bool = False) -> None:
+    """Crash-safely write obj as JSON to path (see _write_atomic)."""
+    _write_atomic(path, json.dumps(obj, indent=indent, ensure_ascii=False).encode("utf-8"), backup)
+
+def _write_quiz(path: str, quiz: Dict, backup: bool = False) -> None:
+    # the file extension decides the format
+    if path.endswith(wqz.EXTENSION):
+        _write_atomic(path, wqz.encode(quiz), backup)
+    else:
+        _write_json_atomic(path, _header_first(quiz), indent=2, backup=backup)
+
+def _load_file(path: str) -> Dict:
+    if path.endswith(wqz.EXTENSION):
+        return wqz.load(path)
+    with open(path, "r", encoding="utf-8") as f:
+        quiz = json.load(f)
+    # written for list_quizzes only; it would go stale as the questions change
+    quiz.pop("question_count", None)
+    return quiz
+
+# --- Cross-process locking -------------------------------------------------
+# Each quiz has an advisory lock file (.<slug>.lock) held for the whole
+# read-modify-write of a save. Locks are re-entrant within a thread so that
+# e.g. a batch commit can call save_quiz while already holding the lock.
+
+class StaleRevisionError(ValueError):
+    """A save was based on an older revision of the quiz than the one on disk."""
+
+_held_locks = threading.local()
+
+def _lock_path(slug: str) -> str:
+    return os.path.join(QUIZZES_DIR, f".{slug}.lock")
+
+def _lock_file(f) -> None:
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        return
+    f.seek(0)
+    while True:
+        try:
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            # LK_LOCK gives up after ~10 seconds; keep waiting
+            continue
+
+def _unlock_file(f) -> None:
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+@contextlib.contextmanager
+def quiz_lock(slug: str) -> Iterator[None]:
+    """Hold the exclusive advisory lock for one quiz file."""
+    held = getattr(_held_locks, "slugs", None)
+    if held is None:
+        held = _held_locks.slugs = set()
+    if slug in held:
+        yield
+        return
+    _ensure_dir()
+    with open(_lock_path(slug), "a+") as f:
+        _lock_file(f)
+        held.add(slug)
+        try:
+            yield
+        finally:
+            held.discard(slug)
+            _unlock_file(f)
+
+def _read_index() -> Optional[Dict[str, str]]:
+    try:
+        with open(_index_path(), "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return index if isinstance(index, dict) else None
+
+def _rebuild_index() -> Dict[str, str]:
+    """Recreate the id index from the quiz catalog and write it to disk."""
+    index = {q["quiz_id"]: q["slug"] for q in list_quizzes() if q.get("quiz_id")}
+    with _index_lock:
+        _write_json_atomic(_index_path(), index)
+    return index
+
+def _index_set(quiz_id: str, slug: str) -> None:
+    with _index_lock:
+        index = _read_index()
+        if index is not None and index.get(quiz_id) == slug:
+            return
+        if index is None:
+            index = {q["quiz_id"]: q["slug"] for q in list_quizzes() if q.get("quiz_id")}
+        index[quiz_id] = slug
+        _write_json_atomic(_index_path(), index)
+
+# --- Header fields -----------------------------------------------------------
+# Quiz files are written with the header fields (and the number of questions)
+# in front of "questions", so list_quizzes and the revision check of a save
+# read a few hundred bytes instead of the whole bank. Files written before
+# that are loaded in full once; their next save moves the header to the front.
+
+_HEADER_KEYS = ("quiz_id", "quiz_name", "quiz_description", "question_selector_amount", "revision",
+                "question_count")
+HEADER_CHUNK = 4096
+_WS = re.compile(r"[ \t\n\r]*")
+_decoder = json.JSONDecoder()
+
+def _header_first(quiz: Dict) -> Dict:
+    """The quiz as it is written: header fields and question_count first, "questions" last."""
+    ordered = {k: quiz[k] for k in _HEADER_KEYS if k in quiz}
+    ordered["question_count"] = len(quiz.get("questions", []))
+    ordered.update((k, v) for k, v in quiz.items() if k != "questions" and k not in ordered)
+    if "questions" in quiz:
+        ordered["questions"] = quiz["questions"]
+    return ordered
+
+def _leading_fields(f) -> Iterator[Tuple[str, object]]:
+    """Yield the top-level (key, value) pairs of a JSON object file that come before "questions".
+
+    Reads HEADER_CHUNK characters at a time and stops at the "questions"
+    key (or the end of the object) without reading any further.
+    """
+    buf = ""
+    while True:
+        more = f.read(HEADER_CHUNK)
+        buf += more
+        pos = _WS.match(buf).end()
+        if pos < len(buf) or not more:
+            break
+    if buf[pos:pos + 1] != "{":
+        raise ValueError("quiz file is not a JSON object")
+    pos += 1
+    first = True
+    while True:
+        try:
+            start = _WS.match(buf, pos).end()
+            if buf[start:start + 1] == "}":
+                return
+            if not first:
+                if buf[start:start + 1] != ",":
+                    raise json.JSONDecodeError("expected ',' or '}'", buf, start)
+                start = _WS.match(buf, start + 1).end()
+            key, end = _decoder.raw_decode(buf, start)
+            end = _WS.match(buf, end).end()
+            if buf[end:end + 1] != ":":
+                raise json.JSONDecodeError("expected ':'", buf, end)
+            if key == "questions":
+                return
+            value, end = _decoder.raw_decode(buf, _WS.match(buf, end + 1).end())
+            # a number at the very end of the buffer might continue in the next chunk
+            if end >= len(buf) and not isinstance(value, (str, dict, list)):
+                raise json.JSONDecodeError("value may continue", buf, end)
+        except json.JSONDecodeError:
+            # the next key or value runs past the buffer: read on
+            more = f.read(HEADER_CHUNK)
+            if not more:
+                if buf[pos:].strip():
+                    raise
+                return
+            buf = buf[pos:] + more
+            pos = 0
+            continue
+        yield key, value
+        pos = end
+        first = False
+
+def _read_header(path: str, fn: str) -> Dict:
+    if fn.endswith(wqz.EXTENSION):
+        # fixed binary header: no scanning at all
+        data = wqz.read_header(path)
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            data = dict(_leading_fields(f))
+        if "question_count" not in data:
+            # old layout: the count needs the whole array
+            data = _load_file(path)
+            data["question_count"] = len(data.get("questions", []))
+    # normalize minimal keys
+    return {
+        "quiz_id": data.get("quiz_id"),
+        "quiz_name": data.get("quiz_name", os.path.splitext(fn)[0]),
+        "quiz_description": data.get("quiz_description", ""),
+        "question_selector_amount": int(data.get("question_selector_amount", 4)),
+        "slug": os.path.splitext(fn)[0],
+        "question_count": data.get("question_count", 0),
+        "revision": int(data.get("revision", 0)),
+    }
+
+def _remove_if_stale(entry: os.DirEntry) -> None:
+    """Delete a temp file left behind by a writer that died mid-save."""
+    try:
+        if time.time() - entry.stat().st_mtime > STALE_TEMP_SECONDS:
+            os.remove(entry.path)
+    except OSError:
+        pass
 
 def list_quizzes() -> List[Dict]:
-    """Return a list of quiz dicts (without loading every question's heavy data)."""
+    """Return a list of quiz dicts (without loading every question's heavy data).
+
+    Headers come from the in-memory catalog; only files whose (mtime, size)
+    changed since the last scan are parsed again.
+    """
     _ensure_dir()
-    quizzes = []
-    for fn in os.listdir(QUIZZES_DIR):
-        if fn.endswith(".json"):
-            p = os.path.join(QUIZZES_DIR, fn)
+    quizzes: Dict[str, Dict] = {}
+    seen = set()
+    with _catalog_lock:
+        for entry in os.scandir(QUIZZES_DIR):
+            fn = entry.name
+            if fn.startswith(".") and fn.endswith(".tmp"):
+                _remove_if_stale(entry)
+                continue
+            # dotfiles are bookkeeping (the id index, temp files), not quizzes
+            if fn.startswith(".") or not fn.endswith(QUIZ_FORMATS):
+                continue
+            p = entry.path
             try:
-                with open(p, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    # normalize minimal keys
-                    quizzes.append({
-                        "quiz_id": data.get("quiz_id"),
-                        "quiz_name": data.get("quiz_name", os.path.splitext(fn)[0]),
-                        "quiz_description": data.get("quiz_description", ""),
-                        "question_selector_amount": int(data.get("question_selector_amount", 4)),
-                        "slug": os.path.splitext(fn)[0],
-                        "question_count": len(data.get("questions", [])),
-                    })
-            except Exception:
-                # skip broken files
+                st = entry.stat()
+            except OSError:
                 continue
-    return quizzes
+            seen.add(p)
+            sig = (st.st_mtime_ns, st.st_size)
+            cached = _catalog.get(p)
+            if cached is not None and cached[0] == sig:
+                _catalog_stats["hits"] += 1
+                header = cached[1]
+            else:
+                _catalog_stats["misses"] += 1
+                try:
+                    header = _read_header(p, fn)
+                except Exception:
+                    # remember broken files too so they are not re-parsed every scan
+                    header = None
+                _catalog[p] = (sig, header)
+            # a .json left next to its .wqz (interrupted convert_quiz) is shadowed by it
+            if header is not None and (fn.endswith(wqz.EXTENSION) or header["slug"] not in quizzes):
+                quizzes[header["slug"]] = dict(header)
+        # drop entries for files that were deleted or renamed
+        for p in [p for p in _catalog if p not in seen]:
+            del _catalog[p]
+    return list(quizzes.values())
+
+def catalog_stats() -> Dict[str, int]:
+    """Return hit/miss counters and the current size of the quiz catalog cache."""
+    with _catalog_lock:
+        return {**_catalog_stats, "entries": len(_catalog)}
+
+def clear_catalog_cache() -> None:
+    """Forget every cached quiz header and reset the counters."""
+    with _catalog_lock:
+        _catalog.clear()
+        _catalog_stats["hits"] = 0
+        _catalog_stats["misses"] = 0
 
 def load_quiz_by_id(quiz_id: str) -> Optional[Dict]:
+    """Look the quiz up through the id index; rebuild the index if it is missing or stale."""
     _ensure_dir()
-    for fn in os.listdir(QUIZZES_DIR):
-        if fn.endswith(".json"):
-            with open(os.path.join(QUIZZES_DIR, fn), "r", encoding="utf-8") as f:
-                data = json.load(f)
-                if data.get("quiz_id") == quiz_id:
-                    return data
+    index = _read_index()
+    if index is not None and quiz_id in index:
+        data = load_quiz_by_slug(index[quiz_id])
+        if data is not None and data.get("quiz_id") == quiz_id:
+            return data
+    slug = _rebuild_index().get(quiz_id)
+    if slug is None:
+        return None
+    data = load_quiz_by_slug(slug)
+    if data is not None and data.get("quiz_id") == quiz_id:
+        return data
     return None
 
+def _disk_revision(path: str) -> int:
+    """Revision of the quiz file at path (0 if it is missing, unreadable or predates revisions)."""
+    try:
+        if path.endswith(wqz.EXTENSION):
+            return int(wqz.read_header(path).get("revision", 0))
+        with open(path, "r", encoding="utf-8") as f:
+            for key, value in _leading_fields(f):
+                if key == "revision":
+                    return int(value)
+            # an older file keeps "revision" after the questions (or has none)
+            f.seek(0)
+            return int(json.load(f).get("revision", 0))
+    except (OSError, ValueError):
+        # missing, or truncated/corrupt: a save may still replace it
+        return 0
+
 def load_quiz_by_slug(slug: str) -> Optional[Dict]:
     p = _quiz_path(slug)
     if not os.path.exists(p):
         return None
-    with open(p, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return _load_file(p)
+
+@contextlib.contextmanager
+def open_questions(slug: str) -> Iterator[Optional[Dict]]:
+    """Yield the quiz with "questions" as a read-only sequence, or None if it doesn't exist.
+
+    For a .wqz quiz the questions are a wqz.MappedQuiz, decoded one by one on
+    access, so picking a few questions out of a large bank never parses the
+    rest; a .json quiz is simply loaded. Only use it inside the with block.
+    """
+    p = _quiz_path(slug)
+    if not os.path.exists(p):
+        yield None
+    elif p.endswith(wqz.EXTENSION):
+        with wqz.MappedQuiz(p) as mapped:
+            yield {**mapped.meta, "questions": mapped}
+    else:
+        yield _load_file(p)
+
+def convert_quiz(slug: str, fmt: str) -> str:
+    """Rewrite a quiz in another format (".json" or wqz.EXTENSION); returns the new path."""
+    if fmt not in QUIZ_FORMATS:
+        raise ValueError(f"Unknown quiz format '{fmt}'")
+    with quiz_lock(slug):
+        old = _quiz_path(slug)
+        if not os.path.exists(old):
+            raise FileNotFoundError(f"Quiz '{slug}' not found")
+        new = os.path.splitext(old)[0] + fmt
+        if new != old:
+            # write the new file first; until the old one is gone the new one shadows it
+            _write_quiz(new, _load_file(old))
+            os.remove(old)
+            _fsync_dir(os.path.dirname(old))
+        return new
 
 def load_quiz_by_name(name: str) -> Optional[Dict]:
     slug = _slugify(name)
     return load_quiz_by_slug(slug)
 
-def save_quiz(quiz: Dict) -> Dict:
-    """Write quiz JSON back to disk. Returns the saved quiz (with ensured fields)."""
+def save_quiz(quiz: Dict, backup: Optional[bool] = None, expected_revision: Optional[int] = None) -> Dict:
+    """Write quiz JSON back to disk. Returns the saved quiz (with ensured fields).
+
+    The write is atomic (temp file, fsync, os.replace) and done under the
+    quiz's file lock; quiz["revision"] is bumped past the revision on disk.
+    With expected_revision, the save is rejected with StaleRevisionError if
+    the file on disk is at a different revision. Pass backup=True, or set
+    KEEP_BACKUPS, to keep the replaced file as <slug>.json.bak (or .wqz.bak).
+    """
+    return _save_quiz(quiz, QUIZ_FORMAT, backup, expected_revision)
+
+def _save_quiz(quiz: Dict, fmt: str, backup: Optional[bool], expected_revision: Optional[int]) -> Dict:
+    """save_quiz, writing a quiz that has no file yet in format fmt."""
     _ensure_dir()
     if not quiz.get("quiz_id"):
         quiz["quiz_id"] = str(uuid.uuid4())
@@ -83,31 +483,65 @@ def save_quiz(quiz: Dict) -> Dict:
     slug = _slugify(quiz["quiz_name"])
     quiz["slug"] = slug
     path = _quiz_path(slug)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(quiz, f, indent=2, ensure_ascii=False)
+    if not os.path.exists(path):
+        path = os.path.splitext(path)[0] + fmt
+    with quiz_lock(slug):
+        disk_revision = _disk_revision(path)
+        if expected_revision is not None and disk_revision != expected_revision:
+            raise StaleRevisionError(f"Quiz '{slug}' is at revision {disk_revision}, not {expected_revision}")
+        previous = quiz.get("revision")
+        quiz["revision"] = max(disk_revision, int(previous or 0)) + 1
+        try:
+            _write_quiz(path, quiz, backup=KEEP_BACKUPS if backup is None else backup)
+        except BaseException:
+            quiz["revision"] = previous
+            raise
+    _index_set(quiz["quiz_id"], slug)
     return quiz
 
 def create_quiz(name: str, description: str = "", question_selector_amount: int = 4) -> Dict:
-    quiz = {
-        "quiz_id": str(uuid.uuid4()),
-        "quiz_name": name.strip(),
-        "quiz_description": description.strip(),
-        "question_selector_amount": int(question_selector_amount),
-        "questions": []
-    }
-    return save_quiz(quiz)
+    """Create and save a new, empty quiz. Raises FileExistsError if the name is taken."""
+    slug = _slugify(name)
+    with quiz_lock(slug):
+        if os.path.exists(_quiz_path(slug)):
+            raise FileExistsError(f"Quiz '{slug}' already exists")
+        quiz = {
+            "quiz_id": str(uuid.uuid4()),
+            "quiz_name": name.strip(),
+            "quiz_description": description.strip(),
+            "question_selector_amount": int(question_selector_amount),
+            "revision": 0,
+            "questions": []
+        }
+        return save_quiz(quiz)
 
 def update_quiz_fields(slug: str, *, name: Optional[str] = None, description: Optional[str] = None, selector_amount: Optional[int] = None) -> Dict:
-    quiz = load_quiz_by_slug(slug)
-    if quiz is None:
-        raise FileNotFoundError(f"Quiz '{slug}' not found")
-    if name is not None:
-        quiz["quiz_name"] = name.strip()
-    if description is not None:
-        quiz["quiz_description"] = description.strip()
-    if selector_amount is not None:
-        quiz["question_selector_amount"] = int(selector_amount)
-    return save_quiz(quiz)
+    """Change a quiz's header fields. A new name renames the file, keeping its format.
+
+    Raises FileExistsError if another quiz already has the new name.
+    """
+    with quiz_lock(slug):
+        path = _quiz_path(slug)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Quiz '{slug}' not found")
+        quiz = _load_file(path)
+        if name is not None:
+            quiz["quiz_name"] = name.strip()
+        if description is not None:
+            quiz["quiz_description"] = description.strip()
+        if selector_amount is not None:
+            quiz["question_selector_amount"] = int(selector_amount)
+        new_slug = _slugify(quiz["quiz_name"])
+        if new_slug == slug:
+            return save_quiz(quiz)
+        with quiz_lock(new_slug):
+            if os.path.exists(_quiz_path(new_slug)):
+                raise FileExistsError(f"Quiz '{new_slug}' already exists")
+            # write the renamed file first, then drop the old one
+            saved = _save_quiz(quiz, os.path.splitext(path)[1], None, None)
+            os.remove(path)
+            _fsync_dir(os.path.dirname(path))
+        return saved
 
 def list_questions(slug: str) -> List[Dict]:
     quiz = load_quiz_by_slug(slug)
@@ -115,45 +549,224 @@ def list_questions(slug: str) -> List[Dict]:
         return []
     return quiz.get("questions", [])
 
-def add_or_update_question(slug: str, question_id: Optional[str], question_text: str, is_true_false: bool, answer: str, false_answers: List[str]) -> Dict:
-    quiz = load_quiz_by_slug(slug)
-    if quiz is None:
-        raise FileNotFoundError(f"Quiz '{slug}' not found")
-    questions = quiz.setdefault("questions", [])
-    if question_id is None:
-        q = {
-            "question_id": str(uuid.uuid4()),
+def _clean_false_answers(is_true_false: bool, false_answers: List[str]) -> List[str]:
+    return [] if is_true_false else [fa.strip() for fa in false_answers if fa.strip()]
+
+class LoadedQuiz:
+    """A quiz held in memory with a question_id -> position index.
+
+    Lets a window load a quiz once and then look up, upsert and delete
+    questions in O(1) instead of rescanning (or re-reading) the quiz per call.
+    """
+    def __init__(self, data: Dict, slug: Optional[str] = None):
+        self.data = data
+        self.slug = slug or data.get("slug") or _slugify(data.get("quiz_name", ""))
+        self.data.setdefault("questions", [])
+        self._reindex()
+
+    def _reindex(self) -> None:
+        self._positions = {q.get("question_id"): i for i, q in enumerate(self.data["questions"])}
+        self._ids: Optional[Tuple[str, ...]] = None
+
+    @property
+    def questions(self) -> List[Dict]:
+        return self.data["questions"]
+
+    @property
+    def revision(self) -> int:
+        return int(self.data.get("revision", 0))
+
+    def copy(self) -> "LoadedQuiz":
+        """A copy whose questions can be edited (e.g. on a worker thread) without touching this one."""
+        return type(self)({**self.data, "questions": [dict(q) for q in self.data["questions"]]}, self.slug)
+
+    def question_ids(self) -> Tuple[str, ...]:
+        if self._ids is None:
+            self._ids = tuple(qid for qid in self._positions if qid is not None)
+        return self._ids
+
+    def __contains__(self, question_id: str) -> bool:
+        return question_id in self._positions
+
+    def get_question(self, question_id: str) -> Optional[Dict]:
+        pos = self._positions.get(question_id)
+        return None if pos is None else self.data["questions"][pos]
+
+    def apply(self, ops: List[Tuple[str, str, Dict]]) -> None:
+        """Apply queued batch operations to the in-memory quiz."""
+        questions = self.data["questions"]
+        deleted = set()
+        for op, question_id, fields in ops:
+            pos = self._positions.get(question_id)
+            if op == "delete":
+                if pos is not None:
+                    deleted.add(pos)
+                    del self._positions[question_id]
+                continue
+            if pos is None:
+                if op == "update":
+                    # nothing to update (e.g. deleted meanwhile)
+                    continue
+                self._positions[question_id] = len(questions)
+                questions.append({"question_id": question_id, **fields})
+                continue
+            q = questions[pos]
+            q.update(fields)
+            if q.get("is_true_false"):
+                q["false_answers"] = []
+        if deleted:
+            self.data["questions"] = [q for i, q in enumerate(questions) if i not in deleted]
+            self._reindex()
+        self._ids = None
+
+    def rebase(self, ops: List[Tuple[str, str, Dict]]) -> None:
+        """Replace our copy with the newer one on disk before applying ops.
+
+        Edits merge at question granularity: if any question touched by ops
+        was changed on disk since we loaded it, StaleRevisionError is raised.
+        """
+        fresh = type(self)(self._fetch(), self.slug)
+        for _, question_id, _ in ops:
+            if fresh.get_question(question_id) != self.get_question(question_id):
+                raise StaleRevisionError(f"Question '{question_id}' was changed in quiz '{self.slug}' by another editor")
+        self.data = fresh.data
+        self._reindex()
+
+    def _fetch(self) -> Dict:
+        """The quiz as it is stored now; storage engines override this and save()."""
+        data = load_quiz_by_slug(self.slug)
+        if data is None:
+            raise FileNotFoundError(f"Quiz '{self.slug}' not found")
+        return data
+
+    def save(self) -> Dict:
+        saved = save_quiz(self.data, expected_revision=self.revision)
+        self.slug = saved["slug"]
+        return saved
+
+    def reload(self) -> None:
+        self.data = self._fetch()
+        self.data.setdefault("questions", [])
+        self._reindex()
+
+def open_quiz(slug: str) -> Optional[LoadedQuiz]:
+    """Load a quiz once for repeated question lookups and edits."""
+    data = load_quiz_by_slug(slug)
+    if data is None:
+        return None
+    return LoadedQuiz(data, slug)
+
+class QuestionBatch:
+    """Collect question upserts and deletes for one quiz and write them in one save.
+
+    The target is a slug (the quiz is loaded at commit time) or a LoadedQuiz,
+    which is updated in place. A LoadedQuiz is not locked: commit a copy()
+    on another thread and hand it back to the thread that reads it. Use it as a context
+    manager; the batch is committed when the block exits without an
+    exception, and discarded otherwise:
+
+        with json_store.batch(slug) as b:
+            b.upsert(None, "New question?", False, "Yes", ["No"])
+            b.update(question_id, answer="Paris")
+            b.delete(other_id)
+    """
+    def __init__(self, target):
+        self.target = target
+        self._ops: List[Tuple[str, str, Dict]] = []
+
+    def __len__(self) -> int:
+        return len(self._ops)
+
+    def question_ids(self) -> List[str]:
+        """Ids of the questions touched by the queued operations, in queue order, without repeats."""
+        return list(dict.fromkeys(question_id for _, question_id, _ in self._ops))
+
+    def upsert(self, question_id: Optional[str], question_text: str, is_true_false: bool, answer: str, false_answers: List[str]) -> str:
+        """Queue a full question write (same arguments as add_or_update_question). Returns the question_id."""
+        if question_id is None:
+            question_id = str(uuid.uuid4())
+        self._ops.append(("upsert", question_id, {
             "question_text": question_text.strip(),
             "is_true_false": bool(is_true_false),
             "answer": answer.strip(),
-            "false_answers": [] if is_true_false else [fa.strip() for fa in false_answers if fa.strip()]
-        }
-        questions.append(q)
-    else:
-        for q in questions:
-            if q.get("question_id") == question_id:
-                q["question_text"] = question_text.strip()
-                q["is_true_false"] = bool(is_true_false)
-                q["answer"] = answer.strip()
-                q["false_answers"] = [] if is_true_false else [fa.strip() for fa in false_answers if fa.strip()]
-                break
-        else:
-            # If not found, add as new
-            q = {
-                "question_id": question_id,
-                "question_text": question_text.strip(),
-                "is_true_false": bool(is_true_false),
-                "answer": answer.strip(),
-                "false_answers": [] if is_true_false else [fa.strip() for fa in false_answers if fa.strip()]
-            }
-            questions.append(q)
-    return save_quiz(quiz)
+            "false_answers": _clean_false_answers(is_true_false, false_answers),
+        }))
+        return question_id
+
+    def update(self, question_id: str, *, question_text: Optional[str] = None, is_true_false: Optional[bool] = None, answer: Optional[str] = None, false_answers: Optional[List[str]] = None) -> None:
+        """Queue a partial update; fields left as None keep their stored value."""
+        fields: Dict = {}
+        if question_text is not None:
+            fields["question_text"] = question_text.strip()
+        if is_true_false is not None:
+            fields["is_true_false"] = bool(is_true_false)
+        if answer is not None:
+            fields["answer"] = answer.strip()
+        if false_answers is not None:
+            fields["false_answers"] = [fa.strip() for fa in false_answers if fa.strip()]
+        self._ops.append(("update", question_id, fields))
+
+    def delete(self, question_id: str) -> None:
+        self._ops.append(("delete", question_id, {}))
+
+    def commit(self) -> Dict:
+        """Apply every queued operation to a single load of the quiz and save it once.
+
+        The read-modify-write runs under the quiz's file lock. A shared
+        LoadedQuiz that is behind the file on disk is rebased first, which
+        raises StaleRevisionError if another editor changed one of the same
+        questions.
+        """
+        slug = self.target.slug if isinstance(self.target, LoadedQuiz) else self.target
+        ops, self._ops = self._ops, []
+        with quiz_lock(slug):
+            loaded = self.target
+            if not isinstance(loaded, LoadedQuiz):
+                loaded = open_quiz(slug)
+                if loaded is None:
+                    raise FileNotFoundError(f"Quiz '{slug}' not found")
+            elif _disk_revision(_quiz_path(slug)) != loaded.revision:
+                loaded.rebase(ops)
+            loaded.apply(ops)
+            try:
+                return loaded.save()
+            except Exception:
+                # keep a shared LoadedQuiz consistent with what is on disk
+                if loaded is self.target:
+                    loaded.reload()
+                raise
+
+    def preview(self) -> LoadedQuiz:
+        """A copy of the target LoadedQuiz as it will be once this batch is saved.
+
+        The target is left alone. Stage the next batch on the preview to build
+        on a save that has not finished yet: its questions and revision then
+        match what that save writes, so it is not mistaken for another
+        editor's change.
+        """
+        preview = self.target.copy()
+        preview.apply(self._ops)
+        preview.data["revision"] = preview.revision + 1
+        return preview
+
+    def __enter__(self) -> "QuestionBatch":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None and self._ops:
+            self.commit()
+
+def batch(target) -> QuestionBatch:
+    """Start a QuestionBatch for a slug or an already loaded quiz."""
+    return QuestionBatch(target)
+
+def add_or_update_question(slug: str, question_id: Optional[str], question_text: str, is_true_false: bool, answer: str, false_answers: List[str]) -> Dict:
+    b = QuestionBatch(slug)
+    b.upsert(question_id, question_text, is_true_false, answer, false_answers)
+    return b.commit()
 
 def get_question(slug: str, question_id: str) -> Optional[Dict]:
-    quiz = load_quiz_by_slug(slug)
+    quiz = open_quiz(slug)
     if quiz is None:
         return None
-    for q in quiz.get("questions", []):
-        if q.get("question_id") == question_id:
-            return q
-    return None
+    return quiz.get_question(question_id)
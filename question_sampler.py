@@ -0,0 +1,96 @@
+"""Draw the subset of questions presented in one quiz attempt.
+
+Each quiz's ``question_selector_amount`` says how many questions an attempt
+shows. Unweighted draws use random.sample (O(k)); weighted draws use the
+Efraimidis-Spirakis reservoir (key = log(u) / w, keep the k largest keys in
+a heap), which is O(N log k) and never shuffles the whole bank. Pass a seed
+to reproduce an attempt exactly.
+
+The order in which each question's options are shown is also drawn once per
+attempt (option_orders), so revisiting a question never reshuffles it and
+answers can be recorded as option indexes instead of label text.
+"""
+import heapq
+import math
+import random
+from array import array
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Union
+
+Weights = Union[Sequence[float], Callable[[Dict], float], None]
+
+def make_weights(missed: Optional[Mapping[str, int]] = None,
+                 difficulty: Optional[Mapping[str, float]] = None) -> Callable[[Dict], float]:
+    """Build a weight function for sample_questions.
+
+    missed maps question_id -> times the user got it wrong; every miss adds
+    one to the question's weight. difficulty maps a question's "difficulty"
+    tag to a multiplier (untagged or unknown tags count as 1).
+    """
+    missed = missed or {}
+    difficulty = difficulty or {}
+    def weight(q: Dict) -> float:
+        w = 1.0 + missed.get(q.get("question_id"), 0)
+        return w * difficulty.get(q.get("difficulty"), 1.0)
+    return weight
+
+def sample_indexes(n: int, amount: int, weights: Weights = None,
+                   questions: Optional[Sequence[Dict]] = None,
+                   seed: Optional[int] = None) -> List[int]:
+    """Pick `amount` distinct indexes out of range(n), returned in ascending order.
+
+    amount <= 0 or >= n selects everything. Questions with a weight <= 0 are
+    never drawn, even when everything else is selected.
+    """
+    rng = random.Random(seed)
+    if weights is None:
+        if amount <= 0 or amount >= n:
+            return list(range(n))
+        return sorted(rng.sample(range(n), amount))
+    weight_of = weights if callable(weights) else None
+    weighted = []
+    for i in range(n):
+        w = weight_of(questions[i]) if weight_of else weights[i]
+        if w > 0:
+            weighted.append((i, w))
+    if amount <= 0 or amount >= len(weighted):
+        return [i for i, _ in weighted]
+    heap = []  # min-heap of (key, index) holding the `amount` largest keys
+    for i, w in weighted:
+        # 1 - random() is in (0, 1], so the log is always defined
+        key = math.log(1.0 - rng.random()) / w
+        if len(heap) < amount:
+            heapq.heappush(heap, (key, i))
+        elif key > heap[0][0]:
+            heapq.heapreplace(heap, (key, i))
+    return sorted(i for _, i in heap)
+
+def question_options(q: Dict) -> List[str]:
+    """The options of a question in stored order: the answer first, then the false answers
+    (True/False questions always offer "True", "False")."""
+    if q.get("is_true_false"):
+        return ["True", "False"]
+    return [q.get("answer", "")] + list(q.get("false_answers", []))
+
+def correct_option(q: Dict) -> int:
+    """Index of the correct option in question_options(q)."""
+    if q.get("is_true_false"):
+        return 0 if str(q.get("answer", "")).strip().lower() == "true" else 1
+    return 0
+
+def option_orders(questions: Sequence[Dict], seed: Optional[int] = None) -> List[array]:
+    """One display order per question: order[k] is the index (into question_options)
+    of the option shown in position k. True/False questions keep True before False."""
+    rng = random.Random(seed)
+    orders = []
+    for q in questions:
+        order = array("H", range(len(question_options(q))))
+        if not q.get("is_true_false"):
+            rng.shuffle(order)
+        orders.append(order)
+    return orders
+
+def sample_questions(questions: Sequence[Dict], amount: int, weights: Weights = None,
+                     seed: Optional[int] = None) -> List[Dict]:
+    """Return the questions for one attempt, keeping their order in the bank."""
+    picked = sample_indexes(len(questions), amount, weights, questions, seed)
+    return [questions[i] for i in picked]
@@ -0,0 +1,123 @@
+"""Compact in-memory question storage for quiz sessions.
+
+A quiz loaded with json.load is a list of dicts, each with its own key table
+and a nested false_answers list: roughly 650 bytes per question. QuizSession
+keeps the questions it draws as Question records (slotted, with interned
+answers: about 470 bytes each). Only a draw of more than
+quiz_session.PACK_ABOVE questions goes into a QuestionTable: every question
+packed as compact JSON into one bytes blob with an offset array (about 240
+bytes each), decoded into a Question only when accessed. Decoding costs
+time on every access, which a session that grades and lists all of its
+questions pays several times over.
+
+Question uses __slots__ and answers .get() / [] like the dict it replaces,
+so code written against question dicts (question_sampler, the quiz windows)
+keeps working unchanged.
+"""
+import json
+import sys
+from array import array
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Tuple
+
+_FIELDS = ("question_id", "question_text", "is_true_false", "answer", "false_answers")
+_FIELD_SET = frozenset(_FIELDS)
+_MISSING = object()
+_decode = json.JSONDecoder().decode
+
+class Question:
+    """One question as a slotted record; unknown fields (e.g. "difficulty") go to a small extra dict."""
+    __slots__ = _FIELDS + ("extra",)
+
+    def __init__(self, question_id: Optional[str] = None, question_text: str = "", is_true_false: bool = False,
+                 answer: str = "", false_answers: Iterable[str] = (), **extra):
+        self.question_id = question_id
+        self.question_text = question_text
+        self.is_true_false = bool(is_true_false)
+        # answers and distractors repeat a lot across a bank ("True", "None of the above")
+        self.answer = sys.intern(answer) if isinstance(answer, str) else answer
+        self.false_answers: Tuple[str, ...] = tuple(sys.intern(fa) if isinstance(fa, str) else fa
+                                                     for fa in false_answers)
+        self.extra: Optional[Dict[str, Any]] = extra or None
+
+    @classmethod
+    def from_dict(cls, q: Mapping) -> "Question":
+        if isinstance(q, Question):
+            return q
+        return cls(**q)
+
+    def get(self, key: str, default=None):
+        if key in _FIELD_SET:
+            return getattr(self, key)
+        value = self._lookup(key)
+        return default if value is _MISSING else value
+
+    def __getitem__(self, key: str):
+        value = self._lookup(key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def _lookup(self, key: str):
+        if key in _FIELD_SET:
+            return getattr(self, key)
+        if self.extra is not None:
+            return self.extra.get(key, _MISSING)
+        return _MISSING
+
+    def __contains__(self, key: str) -> bool:
+        return self._lookup(key) is not _MISSING
+
+    def keys(self) -> Tuple[str, ...]:
+        return _FIELDS + tuple(self.extra or ())
+
+    def to_dict(self) -> Dict:
+        d = {f: getattr(self, f) for f in _FIELDS}
+        d["false_answers"] = list(self.false_answers)
+        if self.extra:
+            d.update(self.extra)
+        return d
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (Question, Mapping)):
+            other = other.to_dict() if isinstance(other, Question) else dict(other)
+            return self.to_dict() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"Question({self.to_dict()!r})"
+
+class QuestionTable:
+    """A read-only sequence of questions stored as one packed blob, decoded on access."""
+    def __init__(self, questions: Iterable[Mapping] = ()):
+        records = [json.dumps(q.to_dict() if isinstance(q, Question) else q,
+                              ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+                   for q in questions]
+        self._blob = b"".join(records)
+        offsets = array("I" if len(self._blob) < 2 ** 32 else "Q", [0])
+        for record in records:
+            offsets.append(offsets[-1] + len(record))
+        self._offsets = offsets
+        # the quiz windows ask for the current question several times per click
+        self._last: Tuple[int, Optional[Question]] = (-1, None)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i: int) -> Question:
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("question index out of range")
+        last, question = self._last
+        if last != i:
+            question = Question(**_decode(self._blob[self._offsets[i]:self._offsets[i + 1]].decode("utf-8")))
+            self._last = (i, question)
+        return question
+
+    def __iter__(self) -> Iterator[Question]:
+        return (self[i] for i in range(len(self)))
+
+    def nbytes(self) -> int:
+        """Bytes held by the packed data (blob plus offsets)."""
+        return len(self._blob) + self._offsets.itemsize * len(self._offsets)
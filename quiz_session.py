@@ -0,0 +1,185 @@
+"""The quiz-taking flow without any UI.
+
+A QuizSession holds one attempt: which questions were drawn, the order each
+question's options are shown in, the answer given per question and where
+the user is. QuizTakeWindow and InstantFeedbackWindow only draw it; the
+same session can be driven headlessly (load tests, benchmarks):
+
+    session = QuizSession.start(store.load_quiz_by_slug(slug), seed=7)
+    while True:
+        session.answer(0)            # pick the first option shown
+        if not session.next():
+            break
+    correct, total, percentage = session.score()
+    letter_grade(percentage)
+
+Options are addressed by their on-screen position; answers are stored as
+indexes into question_sampler.question_options, so grading never compares
+label text.
+"""
+import time
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import store
+import question_sampler
+from question_table import Question, QuestionTable
+
+# Sessions drawing more questions than this keep them in a packed QuestionTable
+PACK_ABOVE = 1000
+
+# Upper bound (inclusive, in percent) of each letter grade; anything above is "A+".
+GRADE_THRESHOLDS = ((59, "F"), (69, "D"), (79, "C"), (89, "B"), (99, "A"))
+
+ResultRow = Tuple[str, Optional[str], str, bool]
+# (question_id, chosen option index or None, is correct, response time in ms)
+AttemptRow = Tuple[str, Optional[int], bool, int]
+
+def letter_grade(percentage: float) -> str:
+    for limit, grade in GRADE_THRESHOLDS:
+        if percentage <= limit:
+            return grade
+    return "A+"
+
+def score(result_data: Sequence[ResultRow]) -> Tuple[int, int, float]:
+    """(correct, total, percentage) of finished result rows."""
+    total = len(result_data)
+    correct = sum(1 for _, _, _, ok in result_data if ok)
+    return correct, total, (correct / total * 100) if total else 0.0
+
+class QuizSession:
+    """One attempt at a quiz: question order, option order, answers and position."""
+    def __init__(self, questions: Sequence[Dict], seed: Optional[int] = None, quiz_id: Optional[str] = None):
+        self.quiz_id = quiz_id
+        # One option order per question for the whole attempt
+        self.option_orders = question_sampler.option_orders(questions, seed=seed)
+        # A drawn handful stays decoded (results and grading read every question);
+        # only a large draw is packed and decoded per access
+        if len(questions) > PACK_ABOVE:
+            self.questions: Sequence[Question] = QuestionTable(questions)
+        else:
+            self.questions = [Question.from_dict(q) for q in questions]
+        self.answers: List[Optional[int]] = [None] * len(self.questions)
+        self.current = 0
+        self.finished = False
+        # Seconds spent on each question before answering it, summed over visits
+        self.response_times = array("d", bytes(8 * len(self.questions)))
+        self.started_at = time.time()
+        self.finished_at: Optional[float] = None
+        # Set by quiz_timing when the attempt was instrumented
+        self.timings: Optional[Dict] = None
+        self._shown_at = time.monotonic()
+
+    @classmethod
+    def start(cls, quiz: Optional[Dict], seed: Optional[int] = None, weights=None) -> "QuizSession":
+        """Draw question_selector_amount questions of quiz (all of them if unset)."""
+        bank = quiz.get("questions", []) if quiz else []
+        amount = int(quiz.get("question_selector_amount") or 0) if quiz else 0
+        return cls(question_sampler.sample_questions(bank, amount, weights=weights, seed=seed), seed=seed,
+                   quiz_id=quiz.get("quiz_id") if quiz else None)
+
+    @classmethod
+    def load(cls, slug: str, seed: Optional[int] = None, weights=None) -> "QuizSession":
+        """Start a session straight from the store; a .wqz bank is memory-mapped and
+        only the drawn questions are decoded."""
+        with store.open_questions(slug) as quiz:
+            return cls.start(quiz, seed=seed, weights=weights)
+
+    def __len__(self) -> int:
+        return len(self.questions)
+
+    def _index(self, index: Optional[int]) -> int:
+        return self.current if index is None else index
+
+    def question(self, index: Optional[int] = None):
+        """The question as a question_table.Question (read it like a dict, with .get())."""
+        return self.questions[self._index(index)]
+
+    def options(self, index: Optional[int] = None) -> List[str]:
+        """Option labels in the order they are shown."""
+        index = self._index(index)
+        stored = question_sampler.question_options(self.questions[index])
+        return [stored[i] for i in self.option_orders[index]]
+
+    def answer(self, position: int, index: Optional[int] = None) -> bool:
+        """Record the option shown at position; returns whether it is correct."""
+        if self.finished:
+            raise RuntimeError("Quiz session is already finished")
+        index = self._index(index)
+        now = time.monotonic()
+        self.response_times[index] += now - self._shown_at
+        self._shown_at = now
+        chosen = self.answers[index] = self.option_orders[index][position]
+        return chosen == question_sampler.correct_option(self.questions[index])
+
+    def chosen_position(self, index: Optional[int] = None) -> Optional[int]:
+        """Position of the recorded answer on screen (None if unanswered)."""
+        index = self._index(index)
+        chosen = self.answers[index]
+        return None if chosen is None else self.option_orders[index].index(chosen)
+
+    def correct_position(self, index: Optional[int] = None) -> int:
+        index = self._index(index)
+        return self.option_orders[index].index(question_sampler.correct_option(self.questions[index]))
+
+    @property
+    def is_first(self) -> bool:
+        return self.current == 0
+
+    @property
+    def is_last(self) -> bool:
+        return self.current >= len(self.questions) - 1
+
+    def mark_shown(self) -> None:
+        """Start the response-time clock of the current question (call once it is on screen)."""
+        self._shown_at = time.monotonic()
+
+    def go_to(self, index: int) -> None:
+        if not 0 <= index < len(self.questions):
+            raise IndexError(f"Question {index} is out of range")
+        self.current = index
+        self.mark_shown()
+
+    def next(self) -> bool:
+        """Move to the next question; False (and no move) on the last one."""
+        if self.is_last:
+            return False
+        self.current += 1
+        self.mark_shown()
+        return True
+
+    def back(self) -> bool:
+        if self.is_first:
+            return False
+        self.current -= 1
+        self.mark_shown()
+        return True
+
+    def answers_by_id(self) -> Dict[str, Optional[int]]:
+        """{question_id: chosen option index or None} for every drawn question (see batch_grading)."""
+        return {q.get("question_id"): chosen for q, chosen in zip(self.questions, self.answers)}
+
+    def attempt_rows(self) -> List[AttemptRow]:
+        """One row per drawn question, as attempt_history records them."""
+        return [(q.get("question_id"), chosen, chosen == question_sampler.correct_option(q), round(seconds * 1000))
+                for q, chosen, seconds in zip(self.questions, self.answers, self.response_times)]
+
+    def results(self) -> List[ResultRow]:
+        """(question text, chosen option text, correct option text, is correct) per question."""
+        rows = []
+        for q, chosen in zip(self.questions, self.answers):
+            options = question_sampler.question_options(q)
+            correct = question_sampler.correct_option(q)
+            rows.append((q.get("question_text", ""), options[chosen] if chosen is not None else None,
+                         options[correct], chosen == correct))
+        return rows
+
+    def score(self) -> Tuple[int, int, float]:
+        return score(self.results())
+
+    def finish(self) -> List[ResultRow]:
+        """End the attempt (no more answers) and return its result rows."""
+        if not self.finished:
+            self.finished = True
+            self.finished_at = time.time()
+        return self.results()
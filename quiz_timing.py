@@ -0,0 +1,175 @@
+"""Optional response-time instrumentation for the quiz windows.
+
+Decorate a window's event handlers with timed(kind) and give the window a
+QuizTimer as self.timer. While instrumentation is enabled every call is
+timed with time.perf_counter (monotonic) and recorded in fixed-size ring
+buffers:
+
+    render  ms from load_question starting to Tk going idle again
+            (layout applied and the question redrawn)
+    think   ms from the question being on screen to the answer click
+    handler ms spent inside each timed handler, per handler name
+
+When disabled, a timed handler costs one global lookup and one extra call.
+Turn it on with enable() at any time (Ctrl+Shift+T in the main window), or
+start the app with WOLFQUIZ_TRACE=<file.jsonl> to also append one JSON
+line per finished attempt to that file. Either way the window calls
+export_attempt(self) once its session is finished, which stores the
+timings as session.timings; attempt_history records them with the attempt.
+"""
+import json
+import os
+import time
+import functools
+from array import array
+from collections import deque
+from typing import Callable, Dict, List, Optional
+
+import background_io
+
+CAPACITY = 512          # samples kept per ring buffer
+
+ENABLED = False
+TRACE_PATH: Optional[str] = None
+
+def enable(trace_path: Optional[str] = None) -> None:
+    """Start timing; with trace_path, finished attempts are also appended to it as JSONL."""
+    global ENABLED, TRACE_PATH
+    ENABLED = True
+    if trace_path is not None:
+        TRACE_PATH = trace_path
+
+def disable() -> None:
+    global ENABLED
+    ENABLED = False
+
+def toggle() -> bool:
+    """Flip instrumentation on/off; returns the new state."""
+    (disable if ENABLED else enable)()
+    return ENABLED
+
+class RingBuffer:
+    """The last capacity float samples, in a preallocated array."""
+    def __init__(self, capacity: int = CAPACITY):
+        self._data = array("d", bytes(8 * capacity))
+        self._next = 0
+        self.count = 0          # samples ever added
+
+    def append(self, value: float) -> None:
+        self._data[self._next] = value
+        self._next = (self._next + 1) % len(self._data)
+        self.count += 1
+
+    def __len__(self) -> int:
+        return min(self.count, len(self._data))
+
+    def values(self) -> List[float]:
+        """Kept samples, oldest first."""
+        if self.count < len(self._data):
+            return self._data[:self.count].tolist()
+        return self._data[self._next:].tolist() + self._data[:self._next].tolist()
+
+    def summary(self) -> Dict[str, float]:
+        """count, mean, p50, p95 and max of the kept samples (ms)."""
+        values = sorted(self.values())
+        if not values:
+            return {"count": 0}
+        n = len(values)
+        return {"count": n, "mean": round(sum(values) / n, 3), "p50": round(values[(n - 1) // 2], 3),
+                "p95": round(values[min(n - 1, int(n * 0.95))], 3), "max": round(values[-1], 3)}
+
+class QuizTimer:
+    """Timings of one quiz window (one attempt)."""
+    def __init__(self, capacity: int = CAPACITY):
+        self.render = RingBuffer(capacity)
+        self.think = RingBuffer(capacity)
+        self.handlers: Dict[str, RingBuffer] = {}
+        self.capacity = capacity
+        # (event, question index, ms) in order, for the trace
+        self.events = deque(maxlen=capacity)
+        self._shown_at: Optional[float] = None
+
+    def record(self, name: str, index: Optional[int], ms: float) -> None:
+        ring = self.handlers.get(name)
+        if ring is None:
+            ring = self.handlers[name] = RingBuffer(self.capacity)
+        ring.append(ms)
+        self.events.append((name, index, round(ms, 3)))
+
+    def rendering(self, widget, index: Optional[int], started: float) -> None:
+        """Finish a render measurement once Tk has processed the redraw queued so far."""
+        def painted():
+            now = time.perf_counter()
+            ms = (now - started) * 1000
+            self.render.append(ms)
+            self.events.append(("render", index, round(ms, 3)))
+            self._shown_at = now
+        widget.after_idle(painted)
+
+    def answered(self, index: Optional[int], at: float) -> None:
+        if self._shown_at is not None:
+            ms = (at - self._shown_at) * 1000
+            self.think.append(ms)
+            self.events.append(("think", index, round(ms, 3)))
+
+    def to_dict(self) -> Dict:
+        return {
+            "render_ms": self.render.summary(),
+            "think_ms": self.think.summary(),
+            "handler_ms": {name: ring.summary() for name, ring in self.handlers.items()},
+            "events": [list(event) for event in self.events],
+        }
+
+    def export(self, session) -> Dict:
+        """The timings of a finished attempt, keyed like its attempt_history record."""
+        return {"quiz_id": session.quiz_id, "started_at": session.started_at,
+                "finished_at": session.finished_at,
+                "question_ids": [q.get("question_id") for q in session.questions],
+                **self.to_dict()}
+
+def append_trace(path: str, record: Dict) -> None:
+    """Append one attempt's timings to a JSONL trace file."""
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+def export_attempt(window) -> None:
+    """Attach the timings to window.session (finished) and append them to the trace.
+
+    Call it before the session is handed to attempt_history, so the record
+    includes them. Does nothing while instrumentation is disabled.
+    """
+    session = window.session
+    if not ENABLED or session is None or not session.finished:
+        return
+    session.timings = window.timer.export(session)
+    if TRACE_PATH:
+        background_io.write(window.master, append_trace, TRACE_PATH, session.timings)
+
+def timed(kind: str) -> Callable:
+    """Time a quiz window handler. kind is "render" (load_question), "answer"
+    (an answer click, ends the think time) or anything else for a plain
+    handler."""
+    def decorate(method: Callable) -> Callable:
+        name = method.__name__
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not ENABLED:
+                return method(self, *args, **kwargs)
+            timer = self.timer
+            session = self.session
+            index = session.current if session is not None else None
+            started = time.perf_counter()
+            if kind == "answer":
+                timer.answered(index, started)
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                timer.record(name, index, (time.perf_counter() - started) * 1000)
+                if kind == "render":
+                    timer.rendering(self, index, started)
+        return wrapper
+    return decorate
+
+if os.environ.get("WOLFQUIZ_TRACE"):
+    enable(os.environ["WOLFQUIZ_TRACE"])
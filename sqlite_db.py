@@ -0,0 +1,55 @@
+"""Connections and transactions shared by the SQLite modules (sqlite_store, attempt_history).
+
+Each thread keeps one connection per database file, opened in WAL mode with
+the caller's schema applied on first use. Transactions are explicit:
+
+    with Transaction(connect(DB_PATH, SCHEMA)) as conn:
+        conn.execute(...)
+"""
+import sqlite3
+import threading
+from typing import Callable, Optional
+
+_local = threading.local()
+
+def connect(db_path: str, schema: str,
+            setup: Optional[Callable[[sqlite3.Connection], None]] = None) -> sqlite3.Connection:
+    """Return this thread's connection to db_path, opening it on first use.
+
+    A new connection gets WAL mode, Row rows and schema; setup (if any) runs
+    after the schema, e.g. for per-connection pragmas or column migrations.
+    """
+    conns = getattr(_local, "conns", None)
+    if conns is None:
+        conns = _local.conns = {}
+    conn = conns.get((db_path, schema))
+    if conn is None:
+        # isolation_level=None: transactions are opened explicitly with BEGIN IMMEDIATE
+        conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(schema)
+        if setup is not None:
+            setup(conn)
+        conns[(db_path, schema)] = conn
+    return conn
+
+class Transaction:
+    """BEGIN IMMEDIATE ... COMMIT/ROLLBACK around a block; takes the write lock up front.
+
+    A block opened inside another one joins the outer transaction.
+    """
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self.outer = False
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.outer = not self.conn.in_transaction
+        if self.outer:
+            self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self.outer:
+            self.conn.execute("COMMIT" if exc_type is None else "ROLLBACK")
@@ -0,0 +1,330 @@
+"""SQLite storage engine with the same API as json_store.
+
+Quizzes and questions live in one SQLite database (WAL mode) instead of one
+JSON file per quiz, so listing is a single indexed query rather than a
+directory scan. It implements the json_store API the windows use; start the
+app with WOLFQUIZ_STORE=sqlite to select it (see store.py).
+
+Use migrate_from_json() (or run this file) once to copy an existing
+quizzes/ directory into the database.
+"""
+import os
+import json
+import uuid
+import sqlite3
+import argparse
+import contextlib
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import json_store
+from json_store import StaleRevisionError, _slugify, _clean_false_answers
+from sqlite_db import Transaction, connect
+
+# Database file used by the SQLite engine.
+DB_PATH = os.path.join(os.path.dirname(__file__), "wolfquiz_store.db")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS quizzes (
+    quiz_id                  TEXT PRIMARY KEY,
+    slug                     TEXT NOT NULL UNIQUE,
+    quiz_name                TEXT NOT NULL,
+    quiz_description         TEXT NOT NULL DEFAULT '',
+    question_selector_amount INTEGER NOT NULL DEFAULT 4,
+    revision                 INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS questions (
+    quiz_id       TEXT NOT NULL REFERENCES quizzes(quiz_id) ON DELETE CASCADE,
+    question_id   TEXT NOT NULL,
+    position      INTEGER NOT NULL,
+    question_text TEXT NOT NULL,
+    is_true_false INTEGER NOT NULL,
+    answer        TEXT NOT NULL,
+    false_answers TEXT NOT NULL,  -- JSON array
+    PRIMARY KEY (quiz_id, question_id)
+);
+CREATE INDEX IF NOT EXISTS idx_questions_position ON questions(quiz_id, position);
+CREATE INDEX IF NOT EXISTS idx_questions_question_id ON questions(question_id);
+"""
+
+def _setup(conn: sqlite3.Connection) -> None:
+    conn.execute("PRAGMA foreign_keys=ON")
+
+def _connect() -> sqlite3.Connection:
+    """Return this thread's connection to DB_PATH, opening it on first use."""
+    return connect(DB_PATH, _SCHEMA, _setup)
+
+@contextlib.contextmanager
+def quiz_lock(slug: str) -> Iterator[None]:
+    """Hold the database write lock (it covers every quiz, not only slug)."""
+    with Transaction(_connect()):
+        yield
+
+def _question_row(row: sqlite3.Row) -> Dict:
+    return {
+        "question_id": row["question_id"],
+        "question_text": row["question_text"],
+        "is_true_false": bool(row["is_true_false"]),
+        "answer": row["answer"],
+        "false_answers": json.loads(row["false_answers"]),
+    }
+
+def _load(conn: sqlite3.Connection, where: str, arg: str) -> Optional[Dict]:
+    row = conn.execute(f"SELECT * FROM quizzes WHERE {where} = ?", (arg,)).fetchone()
+    if row is None:
+        return None
+    questions = conn.execute(
+        "SELECT * FROM questions WHERE quiz_id = ? ORDER BY position", (row["quiz_id"],)
+    ).fetchall()
+    return {
+        "quiz_id": row["quiz_id"],
+        "quiz_name": row["quiz_name"],
+        "quiz_description": row["quiz_description"],
+        "question_selector_amount": row["question_selector_amount"],
+        "revision": row["revision"],
+        "questions": [_question_row(q) for q in questions],
+        "slug": row["slug"],
+    }
+
+def list_quizzes() -> List[Dict]:
+    """Return a list of quiz dicts (headers and question counts) in one query."""
+    rows = _connect().execute("""
+        SELECT q.quiz_id, q.quiz_name, q.quiz_description, q.question_selector_amount, q.slug, q.revision,
+               (SELECT COUNT(*) FROM questions WHERE questions.quiz_id = q.quiz_id) AS question_count
+        FROM quizzes AS q ORDER BY q.quiz_name
+    """).fetchall()
+    return [dict(row) for row in rows]
+
+def load_quiz_by_id(quiz_id: str) -> Optional[Dict]:
+    return _load(_connect(), "quiz_id", quiz_id)
+
+def load_quiz_by_slug(slug: str) -> Optional[Dict]:
+    return _load(_connect(), "slug", slug)
+
+def load_quiz_by_name(name: str) -> Optional[Dict]:
+    return load_quiz_by_slug(_slugify(name))
+
+def _save(conn: sqlite3.Connection, quiz: Dict, expected_revision: Optional[int] = None) -> Dict:
+    """Write a whole quiz inside the caller's transaction."""
+    if "quiz_name" not in quiz:
+        raise ValueError("quiz must include 'quiz_name'")
+    if not quiz.get("quiz_id"):
+        # like a file save: a quiz without an id replaces the quiz of the same name
+        row = conn.execute("SELECT quiz_id FROM quizzes WHERE slug = ?", (_slugify(quiz["quiz_name"]),)).fetchone()
+        quiz["quiz_id"] = row["quiz_id"] if row else str(uuid.uuid4())
+    quiz.setdefault("questions", [])
+    quiz.setdefault("question_selector_amount", 4)
+    quiz.setdefault("quiz_description", "")
+    slug = _slugify(quiz["quiz_name"])
+    quiz["slug"] = slug
+    row = conn.execute("SELECT revision FROM quizzes WHERE quiz_id = ?", (quiz["quiz_id"],)).fetchone()
+    db_revision = row["revision"] if row else 0
+    if expected_revision is not None and db_revision != expected_revision:
+        raise StaleRevisionError(f"Quiz '{slug}' is at revision {db_revision}, not {expected_revision}")
+    quiz["revision"] = max(db_revision, int(quiz.get("revision", 0))) + 1
+    conn.execute("""
+        INSERT INTO quizzes (quiz_id, slug, quiz_name, quiz_description, question_selector_amount, revision)
+        VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT(quiz_id) DO UPDATE SET
+            slug = excluded.slug, quiz_name = excluded.quiz_name,
+            quiz_description = excluded.quiz_description,
+            question_selector_amount = excluded.question_selector_amount,
+            revision = excluded.revision
+    """, (quiz["quiz_id"], slug, quiz["quiz_name"], quiz["quiz_description"],
+          int(quiz["question_selector_amount"]), quiz["revision"]))
+    conn.execute("DELETE FROM questions WHERE quiz_id = ?", (quiz["quiz_id"],))
+    conn.executemany("""
+        INSERT OR REPLACE INTO questions
+            (quiz_id, question_id, position, question_text, is_true_false, answer, false_answers)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """, [
+        (quiz["quiz_id"], q.get("question_id") or str(uuid.uuid4()), pos, q.get("question_text", ""),
+         int(bool(q.get("is_true_false", False))), q.get("answer", q.get("correct_answer", "")),
+         json.dumps(q.get("false_answers", []), ensure_ascii=False))
+        for pos, q in enumerate(quiz["questions"])
+    ])
+    return quiz
+
+def save_quiz(quiz: Dict, backup: Optional[bool] = None, expected_revision: Optional[int] = None) -> Dict:
+    """Write a quiz in one transaction. backup is accepted for json_store compatibility and ignored."""
+    with Transaction(_connect()) as conn:
+        return _save(conn, quiz, expected_revision)
+
+def create_quiz(name: str, description: str = "", question_selector_amount: int = 4) -> Dict:
+    """Create and save a new, empty quiz. Raises FileExistsError if the name is taken."""
+    with Transaction(_connect()) as conn:
+        if conn.execute("SELECT 1 FROM quizzes WHERE slug = ?", (_slugify(name),)).fetchone():
+            raise FileExistsError(f"Quiz '{_slugify(name)}' already exists")
+        quiz = {
+            "quiz_id": str(uuid.uuid4()),
+            "quiz_name": name.strip(),
+            "quiz_description": description.strip(),
+            "question_selector_amount": int(question_selector_amount),
+            "revision": 0,
+            "questions": []
+        }
+        return _save(conn, quiz)
+
+def update_quiz_fields(slug: str, *, name: Optional[str] = None, description: Optional[str] = None, selector_amount: Optional[int] = None) -> Dict:
+    with Transaction(_connect()) as conn:
+        row = conn.execute("SELECT quiz_id, quiz_name, revision FROM quizzes WHERE slug = ?", (slug,)).fetchone()
+        if row is None:
+            raise FileNotFoundError(f"Quiz '{slug}' not found")
+        new_name = name.strip() if name is not None else row["quiz_name"]
+        if _slugify(new_name) != slug and conn.execute("SELECT 1 FROM quizzes WHERE slug = ?", (_slugify(new_name),)).fetchone():
+            raise FileExistsError(f"Quiz '{_slugify(new_name)}' already exists")
+        conn.execute("""
+            UPDATE quizzes SET quiz_name = ?, slug = ?, revision = revision + 1,
+                quiz_description = COALESCE(?, quiz_description),
+                question_selector_amount = COALESCE(?, question_selector_amount)
+            WHERE quiz_id = ?
+        """, (new_name, _slugify(new_name),
+              description.strip() if description is not None else None,
+              int(selector_amount) if selector_amount is not None else None,
+              row["quiz_id"]))
+        return _load(conn, "quiz_id", row["quiz_id"])
+
+@contextlib.contextmanager
+def open_questions(slug: str) -> Iterator[Optional[Dict]]:
+    """Yield the quiz, or None if it doesn't exist (same as json_store.open_questions)."""
+    yield load_quiz_by_slug(slug)
+
+def convert_quiz(slug: str, fmt: str) -> str:
+    raise ValueError("Quizzes in the SQLite store have no file format to convert")
+
+def list_questions(slug: str) -> List[Dict]:
+    rows = _connect().execute("""
+        SELECT qs.* FROM questions AS qs JOIN quizzes AS q ON q.quiz_id = qs.quiz_id
+        WHERE q.slug = ? ORDER BY qs.position
+    """, (slug,)).fetchall()
+    return [_question_row(r) for r in rows]
+
+class LoadedQuiz(json_store.LoadedQuiz):
+    """json_store.LoadedQuiz that reloads from and saves to the database."""
+    def _fetch(self) -> Dict:
+        data = load_quiz_by_slug(self.slug)
+        if data is None:
+            raise FileNotFoundError(f"Quiz '{self.slug}' not found")
+        return data
+
+    def save(self) -> Dict:
+        saved = save_quiz(self.data, expected_revision=self.revision)
+        self.slug = saved["slug"]
+        return saved
+
+def open_quiz(slug: str) -> Optional[LoadedQuiz]:
+    """Load a quiz once for repeated question lookups and edits."""
+    data = load_quiz_by_slug(slug)
+    if data is None:
+        return None
+    return LoadedQuiz(data, slug)
+
+class QuestionBatch(json_store.QuestionBatch):
+    """json_store.QuestionBatch whose commit applies every operation in one SQLite transaction."""
+    def commit(self) -> Dict:
+        ops, self._ops = self._ops, []
+        if isinstance(self.target, json_store.LoadedQuiz):
+            return self._commit_loaded(self.target, ops)
+        with Transaction(_connect()) as conn:
+            row = conn.execute("SELECT quiz_id FROM quizzes WHERE slug = ?", (self.target,)).fetchone()
+            if row is None:
+                raise FileNotFoundError(f"Quiz '{self.target}' not found")
+            quiz_id = row["quiz_id"]
+            for op, question_id, fields in ops:
+                if op == "delete":
+                    conn.execute("DELETE FROM questions WHERE quiz_id = ? AND question_id = ?", (quiz_id, question_id))
+                    continue
+                current = conn.execute("SELECT * FROM questions WHERE quiz_id = ? AND question_id = ?",
+                                       (quiz_id, question_id)).fetchone()
+                if current is None:
+                    if op == "update":
+                        # nothing to update (e.g. deleted meanwhile)
+                        continue
+                    q = {"question_text": "", "is_true_false": False, "answer": "", "false_answers": []}
+                    (position,) = conn.execute("SELECT COALESCE(MAX(position) + 1, 0) FROM questions WHERE quiz_id = ?",
+                                               (quiz_id,)).fetchone()
+                else:
+                    q = _question_row(current)
+                    position = current["position"]
+                q.update(fields)
+                if q["is_true_false"]:
+                    q["false_answers"] = []
+                conn.execute("""
+                    INSERT OR REPLACE INTO questions
+                        (quiz_id, question_id, position, question_text, is_true_false, answer, false_answers)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, (quiz_id, question_id, position, q["question_text"], int(q["is_true_false"]),
+                      q["answer"], json.dumps(q["false_answers"], ensure_ascii=False)))
+            conn.execute("UPDATE quizzes SET revision = revision + 1 WHERE quiz_id = ?", (quiz_id,))
+            return _load(conn, "quiz_id", quiz_id)
+
+    def _commit_loaded(self, loaded: json_store.LoadedQuiz, ops: List[Tuple[str, str, Dict]]) -> Dict:
+        """Rebase a shared LoadedQuiz that is behind the database, apply ops and save it, in one transaction."""
+        applied = False
+        try:
+            with Transaction(_connect()) as conn:
+                row = conn.execute("SELECT revision FROM quizzes WHERE slug = ?", (loaded.slug,)).fetchone()
+                if row is None:
+                    raise FileNotFoundError(f"Quiz '{loaded.slug}' not found")
+                if row["revision"] != loaded.revision:
+                    loaded.rebase(ops)
+                applied = True
+                loaded.apply(ops)
+                saved = _save(conn, loaded.data, expected_revision=loaded.revision)
+        except Exception:
+            # keep the LoadedQuiz consistent with the rolled back database
+            if applied:
+                loaded.reload()
+            raise
+        loaded.slug = saved["slug"]
+        return saved
+
+def batch(target) -> QuestionBatch:
+    """Start a QuestionBatch for a slug or an already loaded quiz."""
+    return QuestionBatch(target)
+
+def add_or_update_question(slug: str, question_id: Optional[str], question_text: str, is_true_false: bool, answer: str, false_answers: List[str]) -> Dict:
+    b = QuestionBatch(slug)
+    b.upsert(question_id, question_text, is_true_false, answer, false_answers)
+    return b.commit()
+
+def get_question(slug: str, question_id: str) -> Optional[Dict]:
+    row = _connect().execute("""
+        SELECT qs.* FROM questions AS qs JOIN quizzes AS q ON q.quiz_id = qs.quiz_id
+        WHERE q.slug = ? AND qs.question_id = ?
+    """, (slug, question_id)).fetchone()
+    return None if row is None else _question_row(row)
+
+def migrate_from_json(quizzes_dir: Optional[str] = None) -> Tuple[int, int]:
+    """Copy every quiz file in quizzes_dir into the database in one transaction.
+
+    Returns (quizzes, questions) migrated. Re-running it overwrites the
+    quizzes it copied before (matched by quiz_id, or by name for files
+    without one), so it is safe to repeat.
+    """
+    quizzes_dir = quizzes_dir or json_store.QUIZZES_DIR
+    n_quizzes = n_questions = 0
+    with Transaction(_connect()) as conn:
+        for entry in sorted(os.scandir(quizzes_dir), key=lambda e: e.name):
+            if entry.name.startswith(".") or not entry.name.endswith(json_store.QUIZ_FORMATS):
+                continue
+            try:
+                quiz = json_store._load_file(entry.path)
+            except (OSError, ValueError):
+                # skip broken files
+                continue
+            quiz.setdefault("quiz_name", os.path.splitext(entry.name)[0])
+            for q in quiz.get("questions", []):
+                q["false_answers"] = _clean_false_answers(bool(q.get("is_true_false", False)), q.get("false_answers", []))
+            _save(conn, quiz)
+            n_quizzes += 1
+            n_questions += len(quiz["questions"])
+    return n_quizzes, n_questions
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Migrate the JSON quizzes directory into the SQLite store.")
+    parser.add_argument("quizzes_dir", nargs="?", default=json_store.QUIZZES_DIR)
+    parser.add_argument("--db", default=DB_PATH, help="database file to create or update")
+    args = parser.parse_args()
+    DB_PATH = args.db
+    quizzes, questions = migrate_from_json(args.quizzes_dir)
+    print(f"Migrated {quizzes} quizzes ({questions} questions) into {DB_PATH}")
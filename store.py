@@ -0,0 +1,28 @@
+"""The quiz storage engine the app uses.
+
+Windows and tools call store.open_quiz, store.batch, ... and get them from
+the selected engine: json_store (one file per quiz, the default) or
+sqlite_store (one database). Pick one with the WOLFQUIZ_STORE environment
+variable ("json" or "sqlite") before starting the app, or with use().
+"""
+import os
+import importlib
+from types import ModuleType
+
+ENGINES = {"json": "json_store", "sqlite": "sqlite_store"}
+
+backend: ModuleType
+
+def use(name: str) -> ModuleType:
+    """Select the storage engine by name; returns its module."""
+    global backend
+    if name not in ENGINES:
+        raise ValueError(f"Unknown quiz store '{name}' (choose from {', '.join(ENGINES)})")
+    backend = importlib.import_module(ENGINES[name])
+    return backend
+
+def __getattr__(name: str):
+    # store.<anything> is looked up on the selected engine at call time
+    return getattr(backend, name)
+
+use(os.environ.get("WOLFQUIZ_STORE", "json").strip().lower() or "json")
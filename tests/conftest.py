@@ -0,0 +1,33 @@
+import os
+import sys
+
+import pytest
+
+# The modules live flat in the repository root
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import json_store
+
+
+@pytest.fixture
+def quizzes_dir(tmp_path, monkeypatch):
+    """Point json_store at an empty quizzes directory for one test."""
+    directory = tmp_path / "quizzes"
+    directory.mkdir()
+    monkeypatch.setattr(json_store, "QUIZZES_DIR", str(directory))
+    json_store.clear_catalog_cache()
+    yield str(directory)
+    json_store.clear_catalog_cache()
+
+
+def make_questions(count, prefix="q"):
+    """count questions in the store layout, every fourth one True/False."""
+    return [{
+        "question_id": f"{prefix}{i}",
+        "question_text": f"Which statement about topic {i} best describes the idea in chapter {i % 12}?",
+        "is_true_false": i % 4 == 0,
+        "answer": "True" if i % 4 == 0 else f"Answer {i}",
+        "false_answers": [] if i % 4 == 0 else [f"Distractor {i} a", f"Distractor {i} b", "None of the above"],
+    } for i in range(count)]
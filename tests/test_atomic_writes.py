@@ -0,0 +1,192 @@
+"""Crash safety of quiz saves: a writer killed mid-save never leaves a partial file."""
+import json
+import os
+import random
+import stat
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+import json_store
+from conftest import ROOT, make_questions
+
+# Saves the same quiz over and over, alternating between two sizes, until killed.
+# With a fault point, the first save stops there (after announcing it on
+# stdout) so the test can kill it at exactly that moment:
+#   dump   half of the new file's bytes are written
+#   fsync  the temp file is complete but not renamed yet
+WRITER = """
+import os, sys, time
+sys.path.insert(0, sys.argv[1])
+import json_store
+json_store.QUIZZES_DIR = sys.argv[2]
+from conftest import make_questions
+fault = sys.argv[3]
+
+def stop_here():
+    print(fault, flush=True)
+    time.sleep(60)
+
+if fault == "dump":
+    real_fdopen = os.fdopen
+    class HalfWriter:
+        def __init__(self, f):
+            self.f = f
+        def __enter__(self):
+            return self
+        def __exit__(self, *exc):
+            self.f.close()
+        def write(self, data):
+            self.f.write(data[:len(data) // 2])
+            self.f.flush()
+            stop_here()
+        def __getattr__(self, name):
+            return getattr(self.f, name)
+    json_store.os.fdopen = lambda fd, mode: HalfWriter(real_fdopen(fd, mode))
+elif fault == "fsync":
+    json_store.os.fsync = lambda fd: stop_here()
+
+sizes = (3000, 4000)
+quiz = json_store.load_quiz_by_slug("crash")
+n = 0
+while True:
+    quiz["questions"] = make_questions(sizes[n % 2], prefix=f"v{n}-")
+    json_store.save_quiz(quiz)
+    n += 1
+"""
+
+
+def _start_writer(quizzes_dir, fault):
+    tests_dir = os.path.dirname(os.path.abspath(__file__))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([ROOT, tests_dir]))
+    return subprocess.Popen([sys.executable, "-c", WRITER, ROOT, quizzes_dir, fault],
+                            env=env, stdout=subprocess.PIPE, text=True)
+
+
+def _read_all(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.mark.parametrize("fault", ["dump", "fsync"])
+def test_writer_killed_at_fault_point(quizzes_dir, fault):
+    json_store.save_quiz({"quiz_name": "crash", "questions": make_questions(3000)})
+    path = os.path.join(quizzes_dir, "crash.json")
+    before = _read_all(path)
+    writer = _start_writer(quizzes_dir, fault)
+    try:
+        assert writer.stdout.readline().strip() == fault
+        # the half-written temp file is there, the quiz itself is untouched
+        assert [n for n in os.listdir(quizzes_dir) if n.endswith(".tmp")]
+        assert _read_all(path) == before
+    finally:
+        writer.kill()
+        writer.wait()
+        writer.stdout.close()
+    assert _read_all(path) == before
+    # a dead writer's temp file is hidden from the catalog
+    assert [q["slug"] for q in json_store.list_quizzes()] == ["crash"]
+
+
+def test_readers_never_see_a_partial_file(quizzes_dir):
+    json_store.save_quiz({"quiz_name": "crash", "questions": make_questions(3000)})
+    path = os.path.join(quizzes_dir, "crash.json")
+    rng = random.Random(6)
+    reads = 0
+    for _ in range(5):
+        writer = _start_writer(quizzes_dir, "none")
+        stop = threading.Event()
+        failures = []
+
+        def reader():
+            nonlocal reads
+            while not stop.is_set():
+                try:
+                    quiz = _read_all(path)
+                except ValueError as exc:
+                    failures.append(exc)
+                    return
+                if len(quiz["questions"]) not in (3000, 4000):
+                    failures.append(len(quiz["questions"]))
+                    return
+                reads += 1
+
+        thread = threading.Thread(target=reader)
+        thread.start()
+        # kill it at a random point of its save loop
+        time.sleep(rng.uniform(0.2, 0.8))
+        writer.kill()
+        writer.wait()
+        writer.stdout.close()
+        stop.set()
+        thread.join()
+        assert not failures, failures
+        # whatever was on disk when the writer died is a complete quiz
+        quiz = _read_all(path)
+        assert len(quiz["questions"]) in (3000, 4000)
+        assert quiz["quiz_name"] == "crash"
+    assert reads > 0
+
+
+def test_failed_write_keeps_the_old_file(quizzes_dir, monkeypatch):
+    quiz = json_store.save_quiz({"quiz_name": "keep", "questions": make_questions(10)})
+    path = os.path.join(quizzes_dir, "keep.json")
+    before = _read_all(path)
+
+    def fail(fd):
+        raise OSError("disk full")
+    monkeypatch.setattr(os, "fsync", fail)
+    quiz["questions"] = make_questions(20)
+    with pytest.raises(OSError):
+        json_store.save_quiz(quiz)
+    monkeypatch.undo()
+    assert _read_all(path) == before
+    assert not [name for name in os.listdir(quizzes_dir) if name.endswith(".tmp")]
+
+
+def test_backup_keeps_the_previous_version(quizzes_dir):
+    quiz = json_store.save_quiz({"quiz_name": "bak", "questions": make_questions(1)})
+    quiz["questions"] = make_questions(2)
+    json_store.save_quiz(quiz, backup=True)
+    assert len(_read_all(os.path.join(quizzes_dir, "bak.json.bak"))["questions"]) == 1
+    assert len(_read_all(os.path.join(quizzes_dir, "bak.json"))["questions"]) == 2
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX permissions")
+def test_saved_files_follow_the_umask(quizzes_dir):
+    old = os.umask(0o022)
+    try:
+        json_store.create_quiz("shared")
+    finally:
+        os.umask(old)
+    for name in ("shared.json", json_store.INDEX_FILENAME):
+        mode = stat.S_IMODE(os.stat(os.path.join(quizzes_dir, name)).st_mode)
+        assert mode == 0o644, (name, oct(mode))
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX permissions")
+def test_saves_keep_the_existing_mode(quizzes_dir):
+    quiz = json_store.create_quiz("group")
+    path = os.path.join(quizzes_dir, "group.json")
+    os.chmod(path, 0o664)
+    json_store.save_quiz(quiz)
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o664
+
+
+@pytest.mark.parametrize("content,revision", [
+    # truncated in the questions: the header in front is still read
+    ('{"quiz_name": "broken", "revision": 4, "questions": [{"quest', 5),
+    ('{"quiz_name": "broken", "questions": [{"quest', 1),
+    ("", 1),
+    ("\xff garbage", 1),
+])
+def test_corrupt_file_can_be_overwritten(quizzes_dir, content, revision):
+    path = os.path.join(quizzes_dir, "broken.json")
+    with open(path, "w", encoding="latin-1") as f:
+        f.write(content)
+    saved = json_store.save_quiz({"quiz_name": "broken"})
+    assert saved["revision"] == revision
+    assert _read_all(path)["quiz_name"] == "broken"
@@ -0,0 +1,67 @@
+"""Finished attempts in the history database, with their timings."""
+import sqlite3
+from types import SimpleNamespace
+
+import pytest
+
+import attempt_history
+import quiz_timing
+from conftest import make_questions
+from quiz_session import QuizSession
+
+
+@pytest.fixture
+def history(tmp_path, monkeypatch):
+    monkeypatch.setattr(attempt_history, "DB_PATH", str(tmp_path / "history.db"))
+    return str(tmp_path / "history.db")
+
+
+def _finished_session():
+    session = QuizSession.start({"quiz_id": "quiz-1", "question_selector_amount": 3,
+                                 "questions": make_questions(5)}, seed=3)
+    while True:
+        session.answer(session.correct_position())
+        if not session.next():
+            break
+    session.finish()
+    return session
+
+
+def test_record_session_fills_log_and_aggregates(history):
+    session = _finished_session()
+    attempt_id = attempt_history.record_session(session, user="sam")
+    [attempt] = attempt_history.user_history("sam")
+    assert (attempt["attempt_id"], attempt["correct"], attempt["total"]) == (attempt_id, 3, 3)
+    answers = attempt_history.attempt_answers(attempt_id)
+    assert [a["question_id"] for a in answers] == [q["question_id"] for q in session.questions]
+    assert all(row["miss_rate"] == 0 for row in attempt_history.question_stats("quiz-1"))
+    assert attempt_history.attempt_timings(attempt_id) is None
+    with pytest.raises(sqlite3.DatabaseError):
+        attempt_history._connect().execute("DELETE FROM attempts")
+
+
+def test_timings_are_recorded_with_the_attempt(history, monkeypatch):
+    monkeypatch.setattr(quiz_timing, "ENABLED", True)
+    monkeypatch.setattr(quiz_timing, "TRACE_PATH", None)
+    window = SimpleNamespace(session=_finished_session(), timer=quiz_timing.QuizTimer(), master=None)
+    window.timer.record("next_question", 0, 1.5)
+    # the order the quiz windows use: export, then queue the history write
+    quiz_timing.export_attempt(window)
+    attempt_id = attempt_history.record_session(window.session, user="sam")
+    timings = attempt_history.attempt_timings(attempt_id)
+    assert timings["quiz_id"] == "quiz-1"
+    assert timings["handler_ms"]["next_question"]["count"] == 1
+    assert timings["question_ids"] == [q["question_id"] for q in window.session.questions]
+
+
+def test_old_history_databases_get_the_timings_column(history):
+    conn = sqlite3.connect(history)
+    conn.execute("""CREATE TABLE attempts (attempt_id INTEGER PRIMARY KEY, user TEXT NOT NULL,
+                    quiz_id TEXT NOT NULL, started_at REAL NOT NULL, finished_at REAL NOT NULL,
+                    correct INTEGER NOT NULL, total INTEGER NOT NULL)""")
+    conn.execute("INSERT INTO attempts VALUES (1, 'sam', 'old', 0, 1, 1, 2)")
+    conn.commit()
+    conn.close()
+    assert attempt_history.attempt_timings(1) is None
+    attempt_id = attempt_history.record_attempt("sam", "old", [("q1", 0, True, 900)], 2, 3, {"render_ms": {}})
+    assert attempt_history.attempt_timings(attempt_id) == {"render_ms": {}}
@@ -0,0 +1,89 @@
+"""Class-wide grading of an answer matrix (batch_grading.py)."""
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import batch_grading
+from batch_grading import NOT_ASKED, SKIPPED
+from conftest import make_questions
+from quiz_session import letter_grade
+
+# q0 and q4 are True/False ("True" is option 0); the rest have 4 options, the answer first
+QUESTIONS = make_questions(6)
+
+
+def test_encode_cells():
+    encoded = batch_grading.encode(QUESTIONS, [{"q0": 1, "q1": None, "gone": 2}, {}, {"q5": 3, "q4": 0}])
+    assert len(encoded) == 3
+    assert encoded.question_ids == ["q0", "q1", "q2", "q3", "q4", "q5"]
+    assert encoded.answers.dtype == np.int16
+    assert encoded.answers.tolist() == [
+        [1, SKIPPED, NOT_ASKED, NOT_ASKED, NOT_ASKED, NOT_ASKED],
+        [NOT_ASKED] * 6,
+        [NOT_ASKED, NOT_ASKED, NOT_ASKED, NOT_ASKED, 0, 3],
+    ]
+    assert encoded.correct.tolist() == [0] * 6
+    assert encoded.option_counts.tolist() == [2, 4, 4, 4, 2, 4]
+
+
+def test_encode_false_true_false_answer():
+    encoded = batch_grading.encode([dict(QUESTIONS[0], answer="False")], [{"q0": 1}])
+    assert encoded.correct.tolist() == [1]
+    assert batch_grading.grade(encoded).percentages.tolist() == [100.0]
+
+
+def test_grade_percentages():
+    report = batch_grading.grade(batch_grading.encode(QUESTIONS, [
+        {"q0": 0, "q1": 0, "q2": 1, "q3": None},  # 2 of 4, the skip counts as wrong
+        {"q5": 0},                                # 1 of 1
+        {"gone": 0},                              # nothing asked
+    ]))
+    assert report.correct.tolist() == [2, 1, 0]
+    assert report.asked.tolist() == [4, 1, 0]
+    assert report.percentages.tolist() == [50.0, 100.0, 0.0]
+    assert report.grades == ["F", "A+", "F"]
+
+
+def test_grade_buckets_match_letter_grade():
+    questions = make_questions(200)
+    rights = [0, 118, 119, 120, 138, 139, 140, 178, 179, 180, 198, 199, 200]
+    attempts = [{q["question_id"]: 0 if i < right else 1 for i, q in enumerate(questions)} for right in rights]
+    report = batch_grading.grade(batch_grading.encode(questions, attempts))
+    assert report.percentages.tolist() == [right / 2 for right in rights]  # 59, 59.5, 60, ... 99, 99.5, 100
+    assert report.grades == [letter_grade(right / 2) for right in rights]
+    assert report.grades[1:4] == ["F", "D", "D"]
+    assert report.grades[-3:] == ["A", "A+", "A+"]
+    assert sum(report.grade_counts().values()) == len(rights)
+
+
+def test_p_values_are_nan_for_questions_never_asked():
+    report = batch_grading.grade(batch_grading.encode(QUESTIONS, [
+        {"q0": 0, "q1": 0}, {"q0": 1, "q1": None}, {"q0": 0},
+    ]))
+    assert report.p_values[:2].tolist() == pytest.approx([2 / 3, 1 / 2])
+    assert np.isnan(report.p_values[2:]).all()
+    assert np.isnan(report.option_rates[2:]).all()
+
+
+def test_distractor_rates_mask_the_correct_option():
+    questions = QUESTIONS[:2] + [dict(QUESTIONS[4], answer="False")]
+    report = batch_grading.grade(batch_grading.encode(questions, [
+        {"q0": 0, "q1": 2, "q4": 0}, {"q0": 1, "q1": 2, "q4": 1}, {"q0": 0, "q1": 0, "q4": None},
+        {"q0": 0, "q1": 7},  # out of range: wrong and not a choice
+    ]))
+    assert report.option_rates.shape == (3, 4)
+    rates = report.distractor_rates()
+    # the correct option and options a question doesn't have are NaN
+    assert np.isnan(rates[0, [0, 2, 3]]).all() and rates[0, 1] == pytest.approx(1 / 4)
+    assert np.isnan(rates[1, 0]) and rates[1, 1:].tolist() == pytest.approx([0.0, 2 / 4, 0.0])
+    assert np.isnan(rates[2, [1, 2, 3]]).all() and rates[2, 0] == pytest.approx(1 / 3)
+    # option_rates itself is left alone
+    assert report.option_rates[0, 0] == pytest.approx(3 / 4)
+    assert report.correct.tolist() == [1, 1, 2, 1]
+
+
+def test_empty_inputs():
+    report = batch_grading.grade(batch_grading.encode([], [{}, {"q0": 0}]))
+    assert report.percentages.tolist() == [0.0, 0.0]
+    assert report.distractor_rates().shape == (0, 0)
+    assert len(batch_grading.grade(batch_grading.encode(QUESTIONS, [])).grades) == 0
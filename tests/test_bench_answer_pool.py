@@ -0,0 +1,55 @@
+"""Per-navigation cost of rebuilding the answer widgets against reusing an AnswerPool (pytest-benchmark)."""
+import itertools
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+ctk = pytest.importorskip("customtkinter")
+
+import QuizTake
+
+# a multiple-choice question, then a True/False one, and so on
+QUESTIONS = [["Paris", "London", "Berlin", "Madrid"], ["True", "False"]]
+
+
+@pytest.fixture
+def frame():
+    try:
+        root = ctk.CTk()
+    except Exception:
+        pytest.skip("no display")
+    frame = ctk.CTkFrame(root)
+    frame.pack()
+    yield frame
+    root.destroy()
+
+
+def test_bench_rebuild_per_navigation(benchmark, frame):
+    benchmark.group = "answer widgets per navigation"
+    shown = []
+    questions = itertools.cycle(QUESTIONS)
+
+    def navigate():
+        # what the windows did before the pool: destroy and recreate every option
+        for widget in shown:
+            widget.destroy()
+        shown[:] = [QuizTake.AnswerRectangle(frame, text=text, command=lambda w: None, width=350, height=120)
+                    for text in next(questions)]
+        for i, widget in enumerate(shown):
+            widget.grid(row=i // 2, column=i % 2, padx=30, pady=30)
+        frame.update_idletasks()
+
+    benchmark(navigate)
+
+
+def test_bench_answer_pool_per_navigation(benchmark, frame):
+    benchmark.group = "answer widgets per navigation"
+    pool = QuizTake.AnswerPool(frame, command=lambda w: None)
+    questions = itertools.cycle(QUESTIONS)
+
+    def navigate():
+        pool.show(next(questions))
+        frame.update_idletasks()
+
+    benchmark(navigate)
+    assert len(pool.widgets) == 4
@@ -0,0 +1,73 @@
+"""Font fitting in the Results window: Tk measure calls and time per card (pytest-benchmark)."""
+import tkinter.font as tkFont
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+ctk = pytest.importorskip("customtkinter")
+
+import Results
+from conftest import make_questions
+
+WIDTH = 900
+TEXTS = [q["question_text"] * (1 + i % 4) for i, q in enumerate(make_questions(200))] + \
+        ["Correct ✅", "Wrong ❌"] * 50
+
+
+def _binary_search_fit(text, max_width, family="Verdana", weight="normal", min_size=8, max_size=36):
+    """The fitting Results did before: a new Font and a measurement per probe."""
+    low, high = min_size, max_size
+    best = min_size
+    while low <= high:
+        mid = (low + high) // 2
+        if tkFont.Font(family=family, size=mid, weight=weight).measure(text) <= max_width:
+            best = mid
+            low = mid + 1
+        else:
+            high = mid - 1
+    return best
+
+
+@pytest.fixture
+def measures(monkeypatch):
+    """Count Font.measure calls (each one is a Tk round trip)."""
+    try:
+        root = ctk.CTk()
+    except Exception:
+        pytest.skip("no display")
+    calls = [0]
+    measure = tkFont.Font.measure
+
+    def counted(self, *args, **kwargs):
+        calls[0] += 1
+        return measure(self, *args, **kwargs)
+    monkeypatch.setattr(tkFont.Font, "measure", counted)
+    # cached fonts belong to the Tk interpreter they were made in; every test has its own root
+    Results._font_cache.clear()
+    Results._fit_font_size.cache_clear()
+    yield calls
+    Results._fit_font_size.cache_clear()
+    Results._font_cache.clear()
+    root.destroy()
+
+
+def test_fitted_sizes_match_the_binary_search(measures):
+    assert [Results._fit_font_size(t, WIDTH) for t in TEXTS] == [_binary_search_fit(t, WIDTH) for t in TEXTS]
+
+
+def test_bench_binary_search_fit(benchmark, measures):
+    benchmark.group = "font fitting, one pass over the results"
+    benchmark.pedantic(lambda: [_binary_search_fit(t, WIDTH) for t in TEXTS], rounds=5)
+    benchmark.extra_info["measure_calls_per_pass"] = measures[0] // 5
+
+
+def test_bench_fit_font_size(benchmark, measures):
+    benchmark.group = "font fitting, one pass over the results"
+
+    def one_pass():
+        # a fresh window: nothing memoized yet, shared fonts kept
+        Results._fit_font_size.cache_clear()
+        return [Results._fit_font_size(t, WIDTH) for t in TEXTS]
+
+    benchmark.pedantic(one_pass, rounds=5)
+    benchmark.extra_info["measure_calls_per_pass"] = measures[0] // 5
@@ -0,0 +1,51 @@
+"""Header-only reads against a full load of a 10k-question quiz (pytest-benchmark)."""
+import json
+
+import pytest
+
+import json_store
+from conftest import make_questions
+
+pytest.importorskip("pytest_benchmark")
+
+QUIZ = {"quiz_id": "big", "quiz_name": "Big", "quiz_description": "10k questions",
+        "question_selector_amount": 20, "revision": 3}
+
+
+@pytest.fixture(scope="module")
+def big_quiz(tmp_path_factory):
+    """The quiz as save_quiz writes it: header and question_count first."""
+    path = str(tmp_path_factory.mktemp("bench") / "big.json")
+    json_store._write_quiz(path, {**QUIZ, "questions": make_questions(10000)})
+    return path
+
+
+@pytest.fixture(scope="module")
+def old_layout_quiz(tmp_path_factory):
+    """A file written before the header went first: no stored count, questions before the revision."""
+    path = str(tmp_path_factory.mktemp("bench") / "old.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"questions": make_questions(10000), **QUIZ}, f, indent=2)
+    return path
+
+
+def test_bench_full_load(benchmark, big_quiz):
+    benchmark.group = "10k-question quiz"
+    assert len(benchmark(json_store._load_file, big_quiz)["questions"]) == 10000
+
+
+def test_bench_read_header(benchmark, big_quiz):
+    benchmark.group = "10k-question quiz"
+    header = benchmark(json_store._read_header, big_quiz, "big.json")
+    assert (header["question_count"], header["revision"]) == (10000, 3)
+
+
+def test_bench_read_header_old_layout(benchmark, old_layout_quiz):
+    benchmark.group = "10k-question quiz"
+    header = benchmark(json_store._read_header, old_layout_quiz, "old.json")
+    assert (header["question_count"], header["revision"]) == (10000, 3)
+
+
+def test_bench_disk_revision(benchmark, big_quiz):
+    benchmark.group = "10k-question quiz"
+    assert benchmark(json_store._disk_revision, big_quiz) == 3
@@ -0,0 +1,53 @@
+"""Headless QuizSession throughput: whole attempts per second (pytest-benchmark)."""
+import pytest
+
+from conftest import make_questions
+from quiz_session import QuizSession, letter_grade
+
+pytest.importorskip("pytest_benchmark")
+
+SESSIONS = 1000
+
+
+@pytest.fixture(scope="module")
+def bank():
+    return {"quiz_id": "bench", "question_selector_amount": 10, "questions": make_questions(500)}
+
+
+def _attempt(quiz, seed):
+    """One whole attempt, as a window (or a load test) drives it."""
+    session = QuizSession.start(quiz, seed=seed)
+    while True:
+        session.options()
+        session.answer(seed % 2)
+        if not session.next():
+            break
+    session.finish()
+    session.attempt_rows()
+    session.answers_by_id()
+    return letter_grade(session.score()[2])
+
+
+def test_bench_one_attempt(benchmark, bank):
+    benchmark.group = "quiz sessions"
+    assert benchmark(_attempt, bank, 1) in ("F", "D", "C", "B", "A", "A+")
+
+
+def test_bench_thousand_attempts(benchmark, bank):
+    benchmark.group = "quiz sessions"
+
+    def attempts():
+        for seed in range(SESSIONS):
+            _attempt(bank, seed)
+
+    benchmark(attempts)
+    # not collected under --benchmark-disable
+    if benchmark.stats is not None:
+        benchmark.extra_info["sessions_per_second"] = round(SESSIONS / benchmark.stats.stats.mean)
+
+
+def test_bench_start_from_large_bank(benchmark):
+    benchmark.group = "quiz sessions"
+    quiz = {"quiz_id": "big", "question_selector_amount": 20, "questions": make_questions(10000)}
+    session = benchmark(QuizSession.start, quiz, 3)
+    assert len(session) == 20
@@ -0,0 +1,87 @@
+"""Load time and memory of a large bank as .json and as .wqz (pytest-benchmark).
+
+Times come from pytest-benchmark. The RSS growth of each load is measured
+once in a fresh process and reported as extra_info["rss_growth_mb"].
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+import json_store
+import wqz
+from conftest import ROOT, make_questions
+from quiz_session import QuizSession
+
+pytest.importorskip("pytest_benchmark")
+
+QUESTIONS = 20000
+
+# Prints the peak-RSS growth (KB) of one load in this fresh process. VmHWM
+# starts over at exec; ru_maxrss would inherit the forking pytest's peak.
+RSS = """
+import sys
+sys.path.insert(0, sys.argv[1])
+import json_store
+json_store.QUIZZES_DIR = sys.argv[2]
+from quiz_session import QuizSession
+def peak():
+    with open("/proc/self/status") as f:
+        return next(int(line.split()[1]) for line in f if line.startswith("VmHWM:"))
+before = peak()
+if sys.argv[4] == "load":
+    quiz = json_store.load_quiz_by_slug(sys.argv[3])
+else:
+    session = QuizSession.load(sys.argv[3], seed=1)
+print(peak() - before)
+"""
+
+
+@pytest.fixture(scope="module")
+def banks(tmp_path_factory):
+    """The same bank saved once per format; returns the quizzes directory."""
+    directory = str(tmp_path_factory.mktemp("quizzes"))
+    for fmt in (".json", wqz.EXTENSION):
+        slug = "bank" + fmt.replace(".", "-")
+        json_store._write_quiz(os.path.join(directory, slug + fmt),
+                               {"quiz_id": slug, "quiz_name": slug, "question_selector_amount": 20,
+                                "revision": 1, "questions": make_questions(QUESTIONS)})
+    return directory
+
+
+@pytest.fixture
+def store_dir(banks, monkeypatch):
+    monkeypatch.setattr(json_store, "QUIZZES_DIR", banks)
+    return banks
+
+
+def _report_rss(benchmark, directory, slug, what):
+    if not os.path.exists("/proc/self/status"):
+        return  # Linux only
+    out = subprocess.run([sys.executable, "-c", RSS, ROOT, directory, slug, what],
+                         capture_output=True, text=True, check=True).stdout
+    benchmark.extra_info["rss_growth_mb"] = round(int(out) / 1024, 1)
+
+
+@pytest.mark.parametrize("slug", ["bank-json", "bank-wqz"])
+def test_bench_full_load(benchmark, store_dir, slug):
+    benchmark.group = f"{QUESTIONS} questions: full load"
+    quiz = benchmark(json_store.load_quiz_by_slug, slug)
+    assert len(quiz["questions"]) == QUESTIONS
+    _report_rss(benchmark, store_dir, slug, "load")
+
+
+@pytest.mark.parametrize("slug", ["bank-json", "bank-wqz"])
+def test_bench_start_session(benchmark, store_dir, slug):
+    benchmark.group = f"{QUESTIONS} questions: start a 20-question session"
+    session = benchmark(QuizSession.load, slug, 1)
+    assert len(session) == 20
+    _report_rss(benchmark, store_dir, slug, "session")
+
+
+@pytest.mark.parametrize("slug", ["bank-json", "bank-wqz"])
+def test_bench_read_header(benchmark, store_dir, slug):
+    benchmark.group = f"{QUESTIONS} questions: catalog header"
+    fn = os.path.basename(json_store._quiz_path(slug))
+    assert benchmark(json_store._read_header, json_store._quiz_path(slug), fn)["question_count"] == QUESTIONS
@@ -0,0 +1,68 @@
+"""Typing in the recycled QuestionCreator cards survives rows being removed and patched."""
+import pytest
+
+pytest.importorskip("ttkthemes")
+tk = pytest.importorskip("tkinter")
+from tkinter import ttk
+
+import QuestionCreator
+
+
+@pytest.fixture
+def cards():
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        pytest.skip("no display")
+    root.geometry("700x900")
+    frame = ttk.Frame(root)
+    frame.pack(fill="both", expand=True)
+    card_list = QuestionCreator.CardList(
+        frame, lambda parent: QuestionCreator.QuestionCard(parent, on_save=lambda card: None))
+    root.update()
+    yield card_list
+    root.destroy()
+
+
+def _row(text=""):
+    return {"question_id": None, "question_text": text, "is_true_false": False}
+
+
+def _card(card_list, row):
+    return next(card for card, _ in card_list.pool if card.row is row)
+
+
+def _type(card_list, row, text):
+    card = _card(card_list, row)
+    card.question_text.delete("1.0", "end")
+    card.question_text.insert("1.0", text)
+
+
+def _shown(card_list, row):
+    return _card(card_list, row).question_text.get("1.0", "end").strip()
+
+
+def test_remove_keeps_typing_of_the_rows_that_move_up(cards):
+    first, second, third = _row(), _row(), _row()
+    cards.set_rows([first, second, third])
+    _type(cards, first, "First?")
+    _type(cards, second, "Second?")
+    _type(cards, third, "Third?")
+    # the first "+ Create" card was saved and is merged away
+    cards.remove([first])
+    assert (_shown(cards, second), _shown(cards, third)) == ("Second?", "Third?")
+    cards.store()
+    assert (second["question_text"], third["question_text"]) == ("Second?", "Third?")
+
+
+def test_patched_rows_are_not_overwritten_by_recycled_cards(cards):
+    saved, other, last = _row("Saved?"), _row("Old text"), _row("Last?")
+    cards.set_rows([saved, other, last])
+    # the order _patch_tabs uses: store the typing, patch the rows, re-fill, then remove
+    cards.store()
+    other["question_text"] = "Patched by the save"
+    cards.refresh([other])
+    cards.remove([saved])
+    cards.store()
+    assert other["question_text"] == "Patched by the save"
+    assert _shown(cards, other) == "Patched by the save"
@@ -0,0 +1,94 @@
+"""Validation, streaming and writes of the bulk importer (import.py)."""
+import importlib
+import io
+import json
+
+import pytest
+
+import json_store
+import store
+from conftest import make_questions
+
+importer = importlib.import_module("import")  # "import" is a keyword; the module is a script
+
+
+@pytest.fixture
+def json_engine(quizzes_dir):
+    previous = store.backend
+    store.use("json")
+    yield quizzes_dir
+    store.backend = previous
+
+
+def _import(tmp_path, name, content, **kwargs):
+    path = tmp_path / name
+    path.write_text(content, encoding="utf-8")
+    errors = io.StringIO()
+    result = importer.import_file(str(path), workers=1, errors=errors, **kwargs)
+    return result, errors.getvalue()
+
+
+@pytest.mark.parametrize("record, error", [
+    ({"question_text": "Q?"}, "missing answer"),
+    ({"question_text": "Q?", "answer": "  "}, "missing answer"),
+    ({"question_text": "", "answer": "A"}, "missing question_text"),
+    ({"question_text": "Q?", "answer": "A", "correct_answer": "B"}, "'answer' and legacy 'correct_answer' disagree"),
+    ({"question_text": "Q?", "answer": "Maybe", "is_true_false": True}, "True/False answer must be True or False"),
+    ({"question_text": "Q?", "answer": "A", "false_answers": "B"}, "false_answers must be a list"),
+    (["Q?", "A"], "not a JSON object"),
+])
+def test_validate_record_rejects(record, error):
+    assert importer.validate_record(record) == (None, error)
+
+
+def test_validate_record_normalizes():
+    q, error = importer.validate_record({"question_id": 7, "question_text": " Q? ", "correct_answer": "A",
+                                         "false_answers": [" B ", "", 3]})
+    assert error is None
+    assert q == {"question_id": "7", "question_text": "Q?", "is_true_false": False,
+                 "answer": "A", "false_answers": ["B", "3"]}
+    # the same value under both keys is not a conflict
+    assert importer.validate_record({"question_text": "Q?", "answer": "A ", "correct_answer": "A"})[1] is None
+
+
+@pytest.mark.parametrize("answer", ["true", "TRUE", " True "])
+def test_validate_record_normalizes_true_false(answer):
+    q, error = importer.validate_record({"question_text": "Q?", "answer": answer, "is_true_false": True,
+                                         "false_answers": ["False"]})
+    assert error is None
+    assert (q["answer"], q["false_answers"]) == ("True", [])
+
+
+@pytest.mark.parametrize("chunk", [1, 7, 64])
+def test_read_json_across_chunk_boundaries(monkeypatch, chunk):
+    monkeypatch.setattr(importer, "READ_CHUNK", chunk)
+    questions = make_questions(30)
+    document = json.dumps({"quiz_name": "Bänk", "question_selector_amount": 12345,
+                           "questions": questions, "quiz_description": "after"}, indent=1)
+    header = {}
+    assert list(importer.read_json(io.StringIO(document), header)) == questions
+    assert header == {"quiz_name": "Bänk", "question_selector_amount": 12345, "quiz_description": "after"}
+    assert list(importer.read_json(io.StringIO(json.dumps(questions)), {})) == questions
+    assert list(importer.read_json(io.StringIO(" [ ] "), {})) == []
+
+
+def test_duplicate_ids_are_rejected(json_engine, tmp_path):
+    records = make_questions(3) + [dict(make_questions(2)[1], question_text="Again?")]
+    (slug, imported, rejected, _), errors = _import(tmp_path, "dups.json", json.dumps(records))
+    assert (imported, rejected) == (3, 1)
+    assert errors == "record 4: duplicate question_id q1\n"
+    questions = json_store.load_quiz_by_slug(slug)["questions"]
+    assert [q["question_text"] for q in questions if q["question_id"] == "q1"] == [records[1]["question_text"]]
+
+
+def test_all_rejected_creates_no_quiz(json_engine, tmp_path):
+    (slug, imported, rejected, _), _ = _import(tmp_path, "bad.jsonl", '{"question_text": "Q?"}\n' * 3)
+    assert (slug, imported, rejected) == ("-", 0, 3)
+    assert store.list_quizzes() == []
+
+
+def test_batches_are_written(json_engine, tmp_path):
+    records = "\n".join(json.dumps(q) for q in make_questions(25))
+    (slug, imported, rejected, _), _ = _import(tmp_path, "bank.jsonl", records, quiz_name="Bio 101", batch_size=10)
+    assert (slug, imported, rejected) == ("bio-101", 25, 0)
+    assert json_store.load_quiz_by_slug(slug)["questions"] == make_questions(25)
@@ -0,0 +1,76 @@
+"""Cross-process locking and revision checks of json_store."""
+import multiprocessing
+import os
+
+import pytest
+
+import json_store
+
+WORKERS = 6
+UPSERTS = 40
+
+
+def _hammer(quizzes_dir, worker, barrier):
+    json_store.QUIZZES_DIR = quizzes_dir
+    json_store.clear_catalog_cache()
+    barrier.wait()
+    for i in range(UPSERTS):
+        json_store.add_or_update_question("stress", f"w{worker}-{i}", f"Question {worker}/{i}", False,
+                                          "Yes", ["No", "Maybe"])
+        if i % 10 == 0:
+            # edits of one shared question interleave with the inserts
+            json_store.add_or_update_question("stress", "shared", f"Last edit by {worker}", True, "True", [])
+
+
+def test_parallel_upserts_lose_nothing(quizzes_dir):
+    json_store.create_quiz("stress")
+    ctx = multiprocessing.get_context("spawn" if os.name == "nt" else "fork")
+    barrier = ctx.Barrier(WORKERS)
+    workers = [ctx.Process(target=_hammer, args=(quizzes_dir, w, barrier)) for w in range(WORKERS)]
+    for p in workers:
+        p.start()
+    for p in workers:
+        p.join(120)
+        assert p.exitcode == 0
+    quiz = json_store.load_quiz_by_slug("stress")
+    ids = [q["question_id"] for q in quiz["questions"]]
+    assert len(ids) == len(set(ids))
+    expected = {f"w{w}-{i}" for w in range(WORKERS) for i in range(UPSERTS)} | {"shared"}
+    assert set(ids) == expected
+    # create + one save per upsert
+    assert quiz["revision"] == 1 + WORKERS * (UPSERTS + UPSERTS // 10)
+
+
+def test_stale_revision_is_rejected(quizzes_dir):
+    quiz = json_store.create_quiz("stale")
+    old = dict(quiz)
+    json_store.save_quiz(quiz, expected_revision=quiz["revision"])
+    with pytest.raises(json_store.StaleRevisionError):
+        json_store.save_quiz(old, expected_revision=old["revision"])
+
+
+def test_batches_merge_at_question_granularity(quizzes_dir):
+    json_store.create_quiz("merge")
+    with json_store.batch("merge") as b:
+        first = b.upsert(None, "One?", True, "True", [])
+        second = b.upsert(None, "Two?", True, "False", [])
+    mine = json_store.open_quiz("merge")
+    theirs = json_store.open_quiz("merge")
+
+    # different questions: the second editor is rebased onto the first one's save
+    with json_store.batch(theirs) as b:
+        b.update(first, question_text="One, edited?")
+    with json_store.batch(mine) as b:
+        b.update(second, question_text="Two, edited?")
+    texts = [q["question_text"] for q in json_store.load_quiz_by_slug("merge")["questions"]]
+    assert texts == ["One, edited?", "Two, edited?"]
+
+    # the same question: the stale edit is rejected and the file keeps the other one
+    mine = json_store.open_quiz("merge")
+    theirs = json_store.open_quiz("merge")
+    with json_store.batch(theirs) as b:
+        b.update(second, answer="True")
+    with pytest.raises(json_store.StaleRevisionError):
+        with json_store.batch(mine) as b:
+            b.update(second, answer="False")
+    assert json_store.get_question("merge", second)["answer"] == "True"
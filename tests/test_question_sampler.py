@@ -0,0 +1,48 @@
+"""Question draws for an attempt (question_sampler.py)."""
+from collections import Counter
+
+import pytest
+
+import question_sampler
+from conftest import make_questions
+
+BANK = make_questions(50)
+
+
+@pytest.mark.parametrize("weights", [None, [1.0 + i % 3 for i in range(50)]])
+def test_same_seed_same_draw(weights):
+    draws = {tuple(question_sampler.sample_indexes(50, 10, weights, BANK, seed=seed)) for seed in (7, 7, 7)}
+    assert len(draws) == 1
+    draw = draws.pop()
+    assert len(draw) == 10 and list(draw) == sorted(set(draw))
+    assert draw != tuple(question_sampler.sample_indexes(50, 10, weights, BANK, seed=8))
+
+
+@pytest.mark.parametrize("amount", [0, -1, 50, 80])
+def test_everything_selected(amount):
+    assert question_sampler.sample_indexes(50, amount, seed=1) == list(range(50))
+
+
+@pytest.mark.parametrize("amount", [0, 5, 8, 50])
+def test_zero_weights_never_drawn(amount):
+    weights = [0.0 if i % 5 == 0 else -1.0 if i % 5 == 1 else 1.0 for i in range(50)]
+    eligible = [i for i, w in enumerate(weights) if w > 0]
+    picked = question_sampler.sample_indexes(50, amount, weights, BANK, seed=3)
+    assert set(picked) <= set(eligible)
+    assert len(picked) == (amount if 0 < amount < len(eligible) else len(eligible))
+
+
+def test_weight_function_and_sequence_agree():
+    weight = question_sampler.make_weights(missed={"q3": 4, "q9": 2}, difficulty={None: 1.0})
+    weights = [weight(q) for q in BANK]
+    assert (question_sampler.sample_indexes(50, 12, weight, BANK, seed=5)
+            == question_sampler.sample_indexes(50, 12, weights, BANK, seed=5))
+    assert question_sampler.sample_questions(BANK, 50, weight, seed=5) == BANK
+
+
+def test_heavier_questions_are_drawn_more_often():
+    weights = [20.0 if i < 5 else 1.0 for i in range(50)]
+    counts = Counter(i for seed in range(400) for i in question_sampler.sample_indexes(50, 5, weights, BANK, seed=seed))
+    heavy = sum(counts[i] for i in range(5)) / 5
+    light = sum(counts[i] for i in range(5, 50)) / 45
+    assert heavy > 5 * light
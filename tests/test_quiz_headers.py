@@ -0,0 +1,93 @@
+"""Quiz headers for list_quizzes and the revision check of save_quiz."""
+import io
+import json
+import os
+
+import pytest
+
+import json_store
+from conftest import make_questions
+
+CASES = [
+    ('{}', []),
+    ('{"revision": 4, "questions": [1, 2]}', [("revision", 4)]),
+    ('{"questions": [], "revision": 2}', []),
+    ('{"quiz_name": "a", "revision": 12}', [("quiz_name", "a"), ("revision", 12)]),
+    (' { "a" : [1, {"b": "}"}] , "revision": 7, "questions": []}', [("a", [1, {"b": "}"}]), ("revision", 7)]),
+    ('{"revision": 12345678}', [("revision", 12345678)]),
+]
+
+
+@pytest.mark.parametrize("chunk", [1, 2, 3, 7, 4096])
+def test_leading_fields_across_chunk_sizes(monkeypatch, chunk):
+    monkeypatch.setattr(json_store, "HEADER_CHUNK", chunk)
+    for text, expected in CASES:
+        assert list(json_store._leading_fields(io.StringIO(text))) == expected
+
+
+@pytest.mark.parametrize("text", ['[1]', '', '{"a" 1}', '{"a": 1 "b": 2}'])
+def test_leading_fields_rejects_malformed(text):
+    with pytest.raises(ValueError):
+        list(json_store._leading_fields(io.StringIO(text)))
+
+
+def test_leading_fields_stops_before_questions():
+    class Reads(io.StringIO):
+        def __init__(self, text):
+            super().__init__(text)
+            self.consumed = 0
+
+        def read(self, n=-1):
+            data = super().read(n)
+            self.consumed += len(data)
+            return data
+
+    quiz = json_store._header_first({"questions": make_questions(2000), "quiz_name": "Big", "revision": 3})
+    f = Reads(json.dumps(quiz, indent=2))
+    assert dict(json_store._leading_fields(f)) == {"quiz_name": "Big", "revision": 3, "question_count": 2000}
+    assert f.consumed <= json_store.HEADER_CHUNK
+
+
+def test_saved_files_put_the_header_first(quizzes_dir):
+    json_store.create_quiz("Bio 101")
+    json_store.add_or_update_question("bio-101", None, "Q?", True, "True", [])
+    with open(os.path.join(quizzes_dir, "bio-101.json"), encoding="utf-8") as f:
+        keys = list(json.load(f))
+    assert keys[:6] == list(json_store._HEADER_KEYS)
+    assert keys[-1] == "questions"
+
+
+def test_list_quizzes_reads_only_the_header(quizzes_dir, monkeypatch):
+    json_store.save_quiz({"quiz_name": "Big", "questions": make_questions(500)})
+    json_store.clear_catalog_cache()
+
+    def full_load(path):
+        raise AssertionError("list_quizzes loaded the whole quiz")
+    monkeypatch.setattr(json_store, "_load_file", full_load)
+    [header] = json_store.list_quizzes()
+    assert (header["slug"], header["question_count"], header["revision"]) == ("big", 500, 1)
+
+
+def test_loaded_quizzes_carry_no_stored_count(quizzes_dir):
+    json_store.save_quiz({"quiz_name": "Count", "questions": make_questions(2)})
+    assert "question_count" not in json_store.load_quiz_by_slug("count")
+
+
+def test_disk_revision_of_old_layout(quizzes_dir):
+    # written before revisions were kept in front: "revision" after the questions
+    path = os.path.join(quizzes_dir, "old.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"quiz_name": "old", "questions": make_questions(3), "slug": "old", "revision": 5}, f)
+    assert json_store._disk_revision(path) == 5
+    quiz = json_store.load_quiz_by_slug("old")
+    json_store.save_quiz(quiz, expected_revision=5)
+    assert json_store._disk_revision(path) == 6
+
+
+def test_list_quizzes_counts_questions(quizzes_dir):
+    with open(os.path.join(quizzes_dir, "legacy.json"), "w", encoding="utf-8") as f:
+        json.dump({"quiz_id": "L", "quiz_name": "Legacy", "questions": make_questions(7)}, f)
+    [header] = json_store.list_quizzes()
+    assert header["question_count"] == 7
+    assert header["quiz_id"] == "L"
+    assert header["revision"] == 0
@@ -0,0 +1,85 @@
+"""The headless quiz-taking flow of QuizSession."""
+import pytest
+
+import json_store
+import quiz_session
+import wqz
+from conftest import make_questions
+from question_table import QuestionTable
+from quiz_session import QuizSession, letter_grade
+
+
+def _quiz(count=20, amount=5):
+    return {"quiz_id": "quiz-1", "question_selector_amount": amount, "questions": make_questions(count)}
+
+
+@pytest.mark.parametrize("percentage,grade", [(0, "F"), (59, "F"), (60, "D"), (85, "B"), (99, "A"), (100, "A+")])
+def test_letter_grade(percentage, grade):
+    assert letter_grade(percentage) == grade
+
+
+def test_start_draws_question_selector_amount():
+    session = QuizSession.start(_quiz(), seed=1)
+    assert len(session) == 5
+    assert session.quiz_id == "quiz-1"
+    assert len({q["question_id"] for q in session.questions}) == 5
+    assert len(QuizSession.start(_quiz(amount=0), seed=1)) == 20
+    assert len(QuizSession.start(None)) == 0
+
+
+def test_same_seed_same_attempt():
+    first, second = QuizSession.start(_quiz(), seed=9), QuizSession.start(_quiz(), seed=9)
+    assert [q["question_id"] for q in first.questions] == [q["question_id"] for q in second.questions]
+    assert [first.options(i) for i in range(5)] == [second.options(i) for i in range(5)]
+
+
+def test_answers_are_graded_by_position():
+    session = QuizSession.start(_quiz(), seed=2)
+    for i in range(len(session)):
+        session.go_to(i)
+        assert session.options()[session.correct_position()] == \
+            ("True" if session.question()["is_true_false"] else session.question()["answer"])
+        wrong = (session.correct_position() + 1) % len(session.options())
+        assert session.answer(session.correct_position() if i % 2 == 0 else wrong) is (i % 2 == 0)
+    rows = session.finish()
+    assert [ok for *_, ok in rows] == [True, False, True, False, True]
+    assert session.score() == (3, 5, 60.0)
+    assert [(ok, chosen is not None) for _, chosen, ok, _ in session.attempt_rows()] == [(ok, True) for *_, ok in rows]
+    with pytest.raises(RuntimeError):
+        session.answer(0)
+
+
+def test_navigation_stays_in_range():
+    session = QuizSession.start(_quiz(amount=3), seed=4)
+    assert session.is_first and not session.back()
+    assert session.next() and session.next()
+    assert session.is_last and not session.next()
+    with pytest.raises(IndexError):
+        session.go_to(3)
+
+
+def test_unanswered_questions_are_wrong():
+    session = QuizSession.start(_quiz(), seed=5)
+    session.answer(session.correct_position())
+    assert session.finish()[1][1] is None
+    assert session.score()[0] == 1
+    assert list(session.answers_by_id().values())[1:] == [None] * 4
+
+
+def test_large_draws_are_packed(monkeypatch):
+    monkeypatch.setattr(quiz_session, "PACK_ABOVE", 10)
+    assert isinstance(QuizSession.start(_quiz(amount=10), seed=1).questions, list)
+    packed = QuizSession.start(_quiz(amount=11), seed=1)
+    assert isinstance(packed.questions, QuestionTable)
+    packed.answer(packed.correct_position())
+    assert packed.results()[0][3]
+
+
+def test_load_from_a_mapped_quiz(quizzes_dir):
+    quiz = json_store.save_quiz({"quiz_name": "Mapped", "question_selector_amount": 4,
+                                 "questions": make_questions(50)})
+    json_store.convert_quiz("mapped", wqz.EXTENSION)
+    session = QuizSession.load("mapped", seed=8)
+    assert len(session) == 4 and session.quiz_id == quiz["quiz_id"]
+    # the drawn questions outlive the mapping
+    assert all(q["question_text"] for q in session.questions)
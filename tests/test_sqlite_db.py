@@ -0,0 +1,48 @@
+"""The connection and transaction helpers shared by sqlite_store and attempt_history."""
+import threading
+
+import pytest
+
+import attempt_history
+import sqlite_db
+import sqlite_store
+
+SCHEMA = "CREATE TABLE IF NOT EXISTS t (x INTEGER);"
+
+
+def test_one_connection_per_thread_and_file(tmp_path):
+    path = str(tmp_path / "a.db")
+    conn = sqlite_db.connect(path, SCHEMA)
+    assert sqlite_db.connect(path, SCHEMA) is conn
+    assert sqlite_db.connect(str(tmp_path / "b.db"), SCHEMA) is not conn
+    other = []
+    thread = threading.Thread(target=lambda: other.append(sqlite_db.connect(path, SCHEMA)))
+    thread.start()
+    thread.join()
+    assert other[0] is not conn
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_nested_transactions_join_the_outer_one(tmp_path):
+    conn = sqlite_db.connect(str(tmp_path / "a.db"), SCHEMA)
+    with pytest.raises(RuntimeError):
+        with sqlite_db.Transaction(conn):
+            conn.execute("INSERT INTO t VALUES (1)")
+            with sqlite_db.Transaction(conn):
+                conn.execute("INSERT INTO t VALUES (2)")
+            assert conn.in_transaction  # the inner block did not commit
+            raise RuntimeError
+    assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+    with sqlite_db.Transaction(conn):
+        with sqlite_db.Transaction(conn):
+            conn.execute("INSERT INTO t VALUES (3)")
+    assert not conn.in_transaction
+    assert conn.execute("SELECT x FROM t").fetchall()[0][0] == 3
+
+
+def test_both_databases_use_the_shared_helpers(tmp_path, monkeypatch):
+    monkeypatch.setattr(sqlite_store, "DB_PATH", str(tmp_path / "store.db"))
+    monkeypatch.setattr(attempt_history, "DB_PATH", str(tmp_path / "history.db"))
+    assert sqlite_store._connect() is sqlite_db.connect(sqlite_store.DB_PATH, sqlite_store._SCHEMA)
+    assert attempt_history._connect() is sqlite_db.connect(attempt_history.DB_PATH, attempt_history._SCHEMA)
+    assert sqlite_store._connect().execute("PRAGMA foreign_keys").fetchone()[0] == 1
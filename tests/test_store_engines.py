@@ -0,0 +1,154 @@
+"""The store API the windows use behaves the same on both storage engines."""
+import json
+import os
+
+import pytest
+
+import json_store
+import sqlite_store
+import store
+import wqz
+from conftest import make_questions
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def engine(request, quizzes_dir, tmp_path, monkeypatch):
+    """Select each engine in turn, with an empty quizzes directory or database."""
+    monkeypatch.setattr(sqlite_store, "DB_PATH", str(tmp_path / "store.db"))
+    previous = store.backend
+    store.use(request.param)
+    yield store.backend
+    store.backend = previous
+
+
+def test_env_switch_selects_the_engine(engine):
+    assert store.open_quiz is engine.open_quiz
+    with pytest.raises(ValueError):
+        store.use("xml")
+
+
+def test_create_list_and_rename(engine):
+    quiz = store.create_quiz("Bio 101", "Cells", 3)
+    with pytest.raises(FileExistsError):
+        store.create_quiz("Bio 101")
+    assert [(q["slug"], q["question_count"]) for q in store.list_quizzes()] == [("bio-101", 0)]
+    updated = store.update_quiz_fields("bio-101", name="Biology", selector_amount=5)
+    assert (updated["slug"], updated["quiz_id"], updated["question_selector_amount"]) == ("biology", quiz["quiz_id"], 5)
+    assert store.load_quiz_by_slug("bio-101") is None
+    assert [q["slug"] for q in store.list_quizzes()] == ["biology"]
+    store.create_quiz("Chem")
+    with pytest.raises(FileExistsError):
+        store.update_quiz_fields("chem", name="Biology")
+    assert store.load_quiz_by_name("Biology")["quiz_description"] == "Cells"
+
+
+def test_batches_on_a_loaded_quiz(engine):
+    store.create_quiz("Chem")
+    loaded = store.open_quiz("chem")
+    assert isinstance(loaded, json_store.LoadedQuiz)
+    with store.batch(loaded) as b:
+        first = b.upsert(None, "Water is H2O?", True, "True", ["ignored"])
+        second = b.upsert(None, "Symbol of gold?", False, "Au", ["Ag", " "])
+    assert loaded.question_ids() == (first, second)
+    assert store.get_question("chem", second)["false_answers"] == ["Ag"]
+    assert store.get_question("chem", first)["false_answers"] == []
+
+    # another editor's save of a different question is merged in
+    other = store.open_quiz("chem")
+    with store.batch(other) as b:
+        b.update(first, question_text="Water is H2O, right?")
+    with store.batch(loaded) as b:
+        b.delete(second)
+    assert loaded.get_question(first)["question_text"] == "Water is H2O, right?"
+    assert [q["question_id"] for q in store.load_quiz_by_slug("chem")["questions"]] == [first]
+
+    # the same question: the stale edit is rejected
+    with store.batch(loaded) as b:
+        b.update(first, answer="False")
+    with pytest.raises(store.StaleRevisionError):
+        with store.batch(other) as b:
+            b.update(first, answer="True")
+    assert store.get_question("chem", first)["answer"] == "False"
+
+
+def test_slug_batches_and_open_questions(engine):
+    store.create_quiz("Geo")
+    store.add_or_update_question("geo", "g1", "Capital of France?", False, "Paris", ["Rome"])
+    with store.batch("geo") as b:
+        b.update("g1", answer="Paris ")
+        b.upsert("g2", "Earth is round?", True, "True", [])
+    with store.open_questions("geo") as quiz:
+        assert [q["question_id"] for q in quiz["questions"]] == ["g1", "g2"]
+    with store.open_questions("missing") as quiz:
+        assert quiz is None
+    with store.quiz_lock("geo"):
+        quiz = store.load_quiz_by_slug("geo")
+        quiz["questions"].reverse()
+        store.save_quiz(quiz, expected_revision=quiz["revision"])
+    assert [q["question_id"] for q in store.list_questions("geo")] == ["g2", "g1"]
+
+
+def test_committing_a_copy_leaves_the_original_alone(engine):
+    store.create_quiz("Art")
+    shown = store.open_quiz("art")
+    working = shown.copy()
+    with store.batch(working) as b:
+        added = b.upsert(None, "Who painted the Mona Lisa?", False, "Leonardo", ["Raphael"])
+    assert shown.question_ids() == () and shown.revision == 1
+    assert working.question_ids() == (added,) and working.revision == 2
+
+    edit = working.copy()
+    with store.batch(edit) as b:
+        b.update(added, answer="Leonardo da Vinci")
+    assert working.get_question(added)["answer"] == "Leonardo"
+    assert edit.get_question(added)["answer"] == "Leonardo da Vinci"
+
+
+def test_rename_keeps_the_file_format(quizzes_dir):
+    json_store.create_quiz("Phys")
+    json_store.add_or_update_question("phys", "p1", "F = ma?", True, "True", [])
+    json_store.convert_quiz("phys", wqz.EXTENSION)
+    json_store.update_quiz_fields("phys", name="Physics")
+    assert sorted(n for n in os.listdir(quizzes_dir) if not n.startswith(".")) == ["physics" + wqz.EXTENSION]
+    assert json_store.get_question("physics", "p1")["question_text"] == "F = ma?"
+
+
+def test_migration_can_run_twice(quizzes_dir, tmp_path, monkeypatch):
+    monkeypatch.setattr(sqlite_store, "DB_PATH", str(tmp_path / "store.db"))
+    json_store.create_quiz("With id")
+    # a legacy file without a quiz_id
+    with open(os.path.join(quizzes_dir, "legacy.json"), "w", encoding="utf-8") as f:
+        json.dump({"quiz_name": "Legacy", "questions": make_questions(1)}, f)
+    assert sqlite_store.migrate_from_json(quizzes_dir) == (2, 1)
+    ids = {q["slug"]: q["quiz_id"] for q in sqlite_store.list_quizzes()}
+    assert sqlite_store.migrate_from_json(quizzes_dir) == (2, 1)
+    assert {q["slug"]: q["quiz_id"] for q in sqlite_store.list_quizzes()} == ids
+    assert len(sqlite_store.list_questions("legacy")) == 1
+
+
+def test_queued_saves_build_on_each_other(engine):
+    store.create_quiz("Music")
+    store.add_or_update_question("music", "m1", "Who wrote Hamlet?", False, "Marlowe", ["Bacon"])
+    shown = store.open_quiz("music")
+    # two saves of the same question, the second staged before the first is written
+    first = store.batch(shown.copy())
+    first.update("m1", answer="Shakespeare")
+    second = store.batch(first.preview())
+    second.update("m1", false_answers=["Marlowe", "Bacon"])
+    first.commit()
+    saved = second.commit()
+    assert saved["revision"] == shown.revision + 2
+    assert store.get_question("music", "m1")["answer"] == "Shakespeare"
+    assert store.get_question("music", "m1")["false_answers"] == ["Marlowe", "Bacon"]
+    assert shown.get_question("m1")["answer"] == "Marlowe"
+
+    # another editor's save in between still conflicts
+    shown = store.open_quiz("music")
+    first = store.batch(shown.copy())
+    first.update("m1", answer="W. Shakespeare")
+    second = store.batch(first.preview())
+    second.update("m1", answer="William Shakespeare")
+    first.commit()
+    store.add_or_update_question("music", "m1", "Who wrote Hamlet?", False, "Kyd", [])
+    with pytest.raises(store.StaleRevisionError):
+        second.commit()
@@ -0,0 +1,62 @@
+"""Round trips through the .wqz format."""
+import pytest
+
+import wqz
+from conftest import make_questions
+
+
+def _write(tmp_path, quiz):
+    path = str(tmp_path / ("quiz" + wqz.EXTENSION))
+    with open(path, "wb") as f:
+        f.write(wqz.encode(quiz))
+    return path
+
+
+def test_empty_quiz(tmp_path):
+    quiz = {"quiz_id": "e", "quiz_name": "Empty", "revision": 2, "questions": []}
+    path = _write(tmp_path, quiz)
+    assert wqz.load(path) == quiz
+    assert wqz.read_header(path) == {"quiz_id": "e", "quiz_name": "Empty", "revision": 2, "question_count": 0}
+    with wqz.MappedQuiz(path) as mapped:
+        assert len(mapped) == 0
+        assert mapped.questions() == [] and list(mapped) == []
+        with pytest.raises(IndexError):
+            mapped[0]
+
+
+def test_non_ascii_round_trip(tmp_path):
+    quiz = {"quiz_name": "Géographie ✓", "quiz_description": "日本語, emoji 🐺",
+            "questions": [{"question_id": "é1", "question_text": "Quelle est la capitale de l’Allemagne ?",
+                           "is_true_false": False, "answer": "Berlin", "false_answers": ["München", "Zürich"]},
+                          {"question_id": "j2", "question_text": "富士山は日本一高い山?",
+                           "is_true_false": True, "answer": "True", "false_answers": []}]}
+    path = _write(tmp_path, quiz)
+    assert wqz.load(path) == quiz
+    with wqz.MappedQuiz(path) as mapped:
+        assert mapped.meta["quiz_description"] == "日本語, emoji 🐺"
+        assert mapped[1]["question_text"] == "富士山は日本一高い山?"
+
+
+def test_getitem_matches_questions(tmp_path):
+    questions = make_questions(257)
+    path = _write(tmp_path, {"quiz_name": "Bank", "questions": questions})
+    with wqz.MappedQuiz(path) as mapped:
+        assert len(mapped) == 257
+        assert [mapped[i] for i in range(len(mapped))] == mapped.questions() == questions
+        assert mapped[-1] == questions[-1]
+        with pytest.raises(IndexError):
+            mapped[257]
+        with pytest.raises(IndexError):
+            mapped[-258]
+
+
+def test_rejects_other_files(tmp_path):
+    path = str(tmp_path / "bad.wqz")
+    with open(path, "wb") as f:
+        f.write(b'{"quiz_name": "not binary"}')
+    with pytest.raises(ValueError):
+        wqz.read_header(path)
+    with open(path, "wb") as f:
+        f.write(b"WQZ1")
+    with pytest.raises(ValueError):
+        wqz.MappedQuiz(path)
@@ -0,0 +1,143 @@
+"""Compact binary quiz files (.wqz), read through mmap.
+
+Layout (all integers little-endian):
+
+    header   "WQZ1" | version u16 | flags u16 | question count u32 | meta length u32
+    meta     the quiz's top-level fields (everything but "questions") as compact JSON
+    padding  to a multiple of 8
+    offsets  (count + 1) x u64, relative to the start of data
+    data     "[" + one compact JSON object per question, separated by "," + "]"
+
+Question i is data[offsets[i] : offsets[i + 1] - 1], so it can be decoded
+on its own without touching the rest of the file, and the data block as a
+whole is one JSON array that json.loads decodes in a single call when
+everything is needed.
+json_store reads and writes this format next to plain .json files.
+"""
+import json
+import mmap
+import struct
+import sys
+from array import array
+from typing import Dict, Iterator
+
+EXTENSION = ".wqz"
+MAGIC = b"WQZ1"
+VERSION = 1
+_HEADER = struct.Struct("<4sHHII")
+
+def _compact(obj) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def _offsets_at(buf, pos: int, count: int) -> array:
+    offsets = array("Q")
+    offsets.frombytes(buf[pos:pos + 8 * (count + 1)])
+    if sys.byteorder != "little":
+        offsets.byteswap()
+    return offsets
+
+def _layout(meta_length: int) -> int:
+    """Position of the offset table."""
+    pos = _HEADER.size + meta_length
+    return pos + (-pos) % 8
+
+def encode(quiz: Dict) -> bytes:
+    """Serialize a quiz dict (as json_store keeps it) to the .wqz layout."""
+    meta = _compact({k: v for k, v in quiz.items() if k != "questions"})
+    records = [_compact(q) for q in quiz.get("questions", [])]
+    offsets = array("Q", [1])  # past the opening "["
+    for record in records:
+        offsets.append(offsets[-1] + len(record) + 1)
+    # offsets[count] is always the length of data, "[]" included
+    offsets[-1] = max(offsets[-1], 2)
+    if sys.byteorder != "little":
+        offsets.byteswap()
+    pos = _HEADER.size + len(meta)
+    return b"".join((_HEADER.pack(MAGIC, VERSION, 0, len(records), len(meta)), meta,
+                     b"\0" * ((-pos) % 8), offsets.tobytes(), b"[", b",".join(records), b"]"))
+
+def _parse_header(buf) -> tuple:
+    if len(buf) < _HEADER.size:
+        raise ValueError("truncated .wqz file")
+    magic, version, _, count, meta_length = _HEADER.unpack_from(buf, 0)
+    if magic != MAGIC:
+        raise ValueError("not a .wqz quiz file")
+    if version != VERSION:
+        raise ValueError(f"unsupported .wqz version {version}")
+    return count, meta_length
+
+def read_header(path: str) -> Dict:
+    """Top-level fields plus "question_count", read from the first few hundred bytes only."""
+    with open(path, "rb") as f:
+        count, meta_length = _parse_header(f.read(_HEADER.size))
+        meta = json.loads(f.read(meta_length))
+    meta["question_count"] = count
+    return meta
+
+class MappedQuiz:
+    """A .wqz file mapped into memory; questions are decoded one at a time on access.
+
+    Behaves like a read-only sequence of question dicts, so it can stand in
+    for quiz["questions"] wherever only indexing and len() are used. Close it
+    (or use it as a context manager) when done: on Windows a mapped file
+    cannot be replaced by the next save.
+    """
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._count, meta_length = _parse_header(self._map)
+            self.meta: Dict = json.loads(self._map[_HEADER.size:_HEADER.size + meta_length])
+            pos = _layout(meta_length)
+            self._offsets = _offsets_at(self._map, pos, self._count)
+            self._data = pos + 8 * (self._count + 1)
+        except Exception:
+            self._map.close()
+            raise
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i: int) -> Dict:
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("question index out of range")
+        start = self._data + self._offsets[i]
+        return json.loads(self._map[start:self._data + self._offsets[i + 1] - 1])
+
+    def __iter__(self) -> Iterator[Dict]:
+        return (self[i] for i in range(self._count))
+
+    def questions(self) -> list:
+        """Decode every question at once (one json.loads over the data block)."""
+        return json.loads(self._map[self._data:self._data + self._offsets[self._count]])
+
+    def to_dict(self) -> Dict:
+        quiz = dict(self.meta)
+        quiz["questions"] = self.questions()
+        return quiz
+
+    def close(self) -> None:
+        self._map.close()
+
+    def __enter__(self) -> "MappedQuiz":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+def load(path: str) -> Dict:
+    """Read a whole .wqz file into the same dict json.load would give for the .json version."""
+    with MappedQuiz(path) as quiz:
+        return quiz.to_dict()
+
+if __name__ == "__main__":
+    import argparse
+    import json_store
+    parser = argparse.ArgumentParser(description="Convert quizzes in the quiz store between .json and .wqz.")
+    parser.add_argument("slugs", nargs="+", help="quiz slugs (file names without extension)")
+    parser.add_argument("--to-json", action="store_true", help="convert back to pretty-printed .json")
+    args = parser.parse_args()
+    for slug in args.slugs:
+        print(json_store.convert_quiz(slug, ".json" if args.to_json else EXTENSION))